@@ -0,0 +1,197 @@
+"""Shared helpers for data migrations.
+
+Any migration that rewrites rows in ``tasks``, ``task_history`` or
+``design_messages`` must go through :func:`paginated_update` instead of
+loading the whole table and updating it in one transaction — those tables
+grow without bound and a load-all migration holds every row in memory and
+every row lock until commit.
+
+Usage inside a revision::
+
+    from backend.alembic.helpers import paginated_update
+
+    tasks = sa.table("tasks", sa.column("id"), sa.column("status"))
+
+    def _fix(bind, row):
+        bind.execute(tasks.update().where(tasks.c.id == row.id).values(status="ready"))
+
+    def upgrade() -> None:
+        paginated_update(sa.select(tasks.c.id).where(tasks.c.status == "rejected"), _fix, tasks.c.id)
+
+Indexes added to tables that may already hold rows must be built with
+:func:`create_index_concurrently`. A plain ``CREATE INDEX`` takes a lock
+that blocks every writer until the build finishes; ``CONCURRENTLY`` only
+takes SHARE UPDATE EXCLUSIVE, so inserts and updates continue.
+
+Seed data is loaded with :func:`fast_copy`, which streams rows through
+``COPY ... FROM STDIN`` rather than issuing one INSERT per row.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import Connection, Row, Select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.elements import ColumnElement
+
+PARTITION_DDL = "CREATE TABLE {partition} PARTITION OF {parent} FOR VALUES FROM ('{start}') TO ('{end}')"
+
+
+def paginated_update(
+    select_stmt: Select[Any],
+    fn: Callable[[Connection, Row[Any]], None],
+    key_column: ColumnElement[Any],
+    page_size: int = 1000,
+    *,
+    commit_pages: bool = True,
+) -> int:
+    """Apply ``fn`` to every row of ``select_stmt``, one page at a time.
+
+    Pages are fetched by keyset on ``key_column`` (which must be part of the
+    select list), so rows that ``fn`` moves out of the filter are never
+    skipped the way OFFSET pagination would skip them. Memory stays at
+    O(page_size) either way.
+
+    With ``commit_pages`` (the default) each page is applied in an
+    autocommit block, releasing its locks page by page. Entering the block
+    commits the migration's transaction first, so DDL that ran earlier in
+    the revision becomes durable mid-migration and a failure leaves the
+    rows half-updated; call this last in the revision and keep ``fn``
+    idempotent. Pass ``commit_pages=False`` to keep the whole update in
+    the migration transaction instead, atomic but holding every row lock
+    until the revision commits.
+
+    Offline (``--sql``) there are no rows to read, so nothing is emitted and
+    the data migration has to run online.
+
+    Returns the number of rows processed.
+    """
+    if op.get_context().as_sql:
+        return 0
+
+    bind = op.get_bind()
+    last_key: Any = None
+    processed = 0
+
+    while True:
+        stmt = select_stmt.order_by(key_column).limit(page_size)
+        if last_key is not None:
+            stmt = stmt.where(key_column > last_key)
+        rows = bind.execute(stmt).all()
+        if not rows:
+            break
+
+        if commit_pages:
+            with op.get_context().autocommit_block():
+                for row in rows:
+                    fn(bind, row)
+        else:
+            for row in rows:
+                fn(bind, row)
+
+        processed += len(rows)
+        last_key = rows[-1]._mapping[key_column]
+        if len(rows) < page_size:
+            break
+
+    return processed
+
+
+def table_exists(name: str) -> bool:
+    """Return True if ``name`` exists in the target database (always False offline)."""
+    if op.get_context().as_sql:
+        return False
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def create_index_concurrently(index_name: str, table_name: str, columns: list[str], **kw: Any) -> None:
+    """Build an index with ``CREATE INDEX CONCURRENTLY``.
+
+    ``CONCURRENTLY`` cannot run inside a transaction block, so the build is
+    wrapped in an autocommit block. Extra keyword arguments are passed through
+    to ``op.create_index``.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(index_name, table_name, columns, postgresql_concurrently=True, **kw)
+
+
+def create_enum_types(*enum_types: postgresql.ENUM) -> None:
+    """Create PostgreSQL enum types in one round trip.
+
+    All ``CREATE TYPE`` statements are sent as a single ``DO`` block instead of
+    a catalog lookup plus ``CREATE TYPE`` per type. Each statement has its own
+    ``duplicate_object`` handler, so a type that already exists is skipped
+    without affecting the others. Columns should reference the types with
+    ``create_type=False``.
+    """
+    statements = []
+    for enum_type in enum_types:
+        labels = ", ".join("'" + label.replace("'", "''") + "'" for label in enum_type.enums)
+        statements.append(
+            "  BEGIN CREATE TYPE " + enum_type.name + " AS ENUM (" + labels + "); "
+            "EXCEPTION WHEN duplicate_object THEN NULL; END;"
+        )
+    op.execute(sa.text("DO $$\nBEGIN\n" + "\n".join(statements) + "\nEND $$"))
+
+
+def _month_start(base: date, offset: int) -> date:
+    years, month_index = divmod(base.month - 1 + offset, 12)
+    return date(base.year + years, month_index + 1, 1)
+
+
+def create_monthly_partitions(table_name: str, first_month: date, months: int) -> None:
+    """Create a DEFAULT partition plus one RANGE partition per month.
+
+    ``months`` consecutive partitions are created starting with the month
+    containing ``first_month``, named ``<table>_yYYYYmMM``; rows outside that
+    window land in ``<table>_default``.
+    """
+    op.execute(sa.text("CREATE TABLE " + table_name + "_default PARTITION OF " + table_name + " DEFAULT"))
+    first = _month_start(first_month, 0)
+    for offset in range(months):
+        start = _month_start(first, offset)
+        end = _month_start(first, offset + 1)
+        op.execute(
+            sa.text(
+                PARTITION_DDL.format(
+                    partition="%s_y%04dm%02d" % (table_name, start.year, start.month),
+                    parent=table_name,
+                    start=start.isoformat(),
+                    end=end.isoformat(),
+                )
+            )
+        )
+
+
+def _column_for_values(name: str, records: list[dict[str, Any]]) -> sa.ColumnClause[Any]:
+    value = next((record[name] for record in records if record[name] is not None), None)
+    return sa.column(name, sa.literal(value).type if value is not None else None)
+
+
+def fast_copy(table_name: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """Bulk-load ``rows`` into ``table_name`` over the COPY protocol.
+
+    Each row is a sequence of values in ``columns`` order. On psycopg the rows
+    are streamed with ``cursor.copy()``, so network round trips and parse cost
+    are paid once for the whole batch. Offline (``--sql``) and on other
+    drivers this falls back to ``op.bulk_insert``.
+    """
+    bind = op.get_bind()
+    if op.get_context().as_sql or bind.dialect.driver != "psycopg":
+        records = [dict(zip(columns, row)) for row in rows]
+        # Typed from the first non-NULL value, so --sql can render the literals
+        table = sa.table(table_name, *(_column_for_values(name, records) for name in columns))
+        op.bulk_insert(table, records)
+        return
+
+    statement = "COPY {} ({}) FROM STDIN".format(
+        bind.dialect.identifier_preparer.quote(table_name),
+        ", ".join(bind.dialect.identifier_preparer.quote(name) for name in columns),
+    )
+    with bind.connection.driver_connection.cursor() as cursor:
+        with cursor.copy(statement) as copy:
+            for row in rows:
+                copy.write_row(row)
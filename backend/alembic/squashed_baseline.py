@@ -0,0 +1,346 @@
+"""Squashed schema baseline for bootstrapping empty databases.
+
+Replaying the full revision chain on a fresh database runs every historical
+step (including enum recreations and table rebuilds that only matter for
+databases that already hold data). This module builds the end state of the
+chain in one transaction instead; env.py then stamps the database at
+SQUASHED_REVISION and applies anything newer as usual.
+
+It is only used when ALEMBIC_USE_SQUASH=1 and the database has no
+alembic_version yet (CI / test bootstrapping). Production databases that
+already ran the historical revisions keep using the chain.
+
+When a new revision changes the schema, either mirror the change here and
+bump SQUASHED_REVISION, or leave both alone and let the new revision run on
+top of the baseline.
+"""
+
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from backend.alembic.helpers import create_enum_types, create_monthly_partitions
+
+# Head of the revision chain whose end state this baseline reproduces.
+SQUASHED_REVISION = "n5c6d7e8f9a0"
+
+TASK_HISTORY_FUTURE_MONTHS = 6
+
+# Per-row wall-clock default for the append-only event tables.
+CLOCK_TIMESTAMP = sa.text("clock_timestamp()")
+
+BRIN_OPTIONS = {"postgresql_using": "brin", "postgresql_with": {"pages_per_range": 32}}
+
+
+def _enum(name: str, *values: str) -> postgresql.ENUM:
+    return postgresql.ENUM(*values, name=name, create_type=False)
+
+
+projectstatus = _enum("projectstatus", "design", "active", "paused", "completed")
+phasestatus = _enum("phasestatus", "pending", "active", "completed")
+taskstatus = _enum("taskstatus", "waiting", "ready", "queued", "in_progress", "review", "done", "redesign")
+taskpriority = _enum("taskpriority", "low", "medium", "high", "critical")
+workerstatus = _enum("workerstatus", "idle", "busy", "offline")
+designsessionstatus = _enum("designsessionstatus", "active", "finalized", "cancelled")
+messagerole = _enum("messagerole", "user", "assistant")
+messagetype = _enum("messagetype", "chat", "internal")
+role = _enum("role", "admin", "operator", "viewer", "worker")
+auditaction = _enum(
+    "auditaction",
+    "auth_login",
+    "auth_logout",
+    "auth_failed",
+    "auth_token_created",
+    "auth_token_revoked",
+    "worker_registered",
+    "worker_deregistered",
+    "worker_heartbeat_failed",
+    "data_read",
+    "data_created",
+    "data_updated",
+    "data_deleted",
+    "data_exported",
+    "admin_settings_changed",
+    "admin_config_changed",
+    "security_rate_limited",
+    "security_invalid_input",
+    "security_unauthorized",
+    "security_prompt_tampered",
+    "security_audit_requested",
+    "task_state_changed",
+    "task_assigned",
+)
+auditseverity = _enum("auditseverity", "info", "warning", "error", "critical")
+
+ENUMS = (
+    projectstatus,
+    phasestatus,
+    taskstatus,
+    taskpriority,
+    workerstatus,
+    designsessionstatus,
+    messagerole,
+    messagetype,
+    role,
+    auditaction,
+    auditseverity,
+)
+
+
+def _jsonb() -> postgresql.JSONB:
+    return postgresql.JSONB(astext_type=sa.Text())
+
+
+def _timestamp(name: str, server_default: sa.ClauseElement = sa.func.now()) -> sa.Column:
+    return sa.Column(name, sa.DateTime(timezone=True), server_default=server_default, nullable=False)
+
+
+def upgrade() -> None:
+    create_enum_types(*ENUMS)
+
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("design_doc_path", sa.String(length=500), nullable=True),
+        sa.Column("repo_path", sa.String(length=500), nullable=False),
+        sa.Column("status", projectstatus, nullable=False),
+        sa.Column("llm_config", _jsonb(), nullable=True),
+        _timestamp("created_at"),
+        _timestamp("updated_at"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "workers",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("platform", sa.String(length=50), nullable=False),
+        sa.Column("capabilities", _jsonb(), nullable=True),
+        sa.Column("status", workerstatus, nullable=False),
+        sa.Column("current_task_id", sa.Uuid(), nullable=True),
+        sa.Column("executor_type", sa.String(length=50), nullable=False),
+        _timestamp("registered_at"),
+        sa.Column("last_heartbeat", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("project_id", sa.Uuid(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], name="fk_workers_project_id", ondelete="SET NULL"),
+    )
+
+    op.create_table(
+        "phases",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("branch_name", sa.Text(), nullable=False),
+        sa.Column("order", sa.Integer(), nullable=False),
+        sa.Column("status", phasestatus, nullable=False),
+        _timestamp("created_at"),
+        _timestamp("updated_at"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+    )
+
+    op.create_table(
+        "design_sessions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=True),
+        sa.Column("status", designsessionstatus, nullable=False),
+        sa.Column("llm_config", _jsonb(), nullable=True),
+        _timestamp("created_at"),
+        _timestamp("updated_at"),
+        sa.Column("name", sa.Text(), nullable=True),
+        sa.Column("worker_id", sa.Uuid(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(
+            ["worker_id"], ["workers.id"], name="fk_design_sessions_worker_id", ondelete="SET NULL"
+        ),
+    )
+
+    op.create_table(
+        "design_messages",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("session_id", sa.Uuid(), nullable=False),
+        sa.Column("role", messagerole, nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        _timestamp("created_at", CLOCK_TIMESTAMP),
+        sa.Column("message_type", messagetype, nullable=False, server_default="chat"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["session_id"], ["design_sessions.id"], ondelete="CASCADE"),
+    )
+
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("phase_id", sa.Uuid(), nullable=False),
+        sa.Column("title", sa.String(length=500), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", taskstatus, nullable=False),
+        sa.Column("priority", taskpriority, nullable=False),
+        sa.Column("worker_prompt", _jsonb(), nullable=True),
+        sa.Column("qa_prompt", _jsonb(), nullable=True),
+        sa.Column("branch_name", sa.Text(), nullable=True),
+        sa.Column("commit_hash", sa.String(length=64), nullable=True),
+        sa.Column("worker_id", sa.Uuid(), nullable=True),
+        sa.Column("reviewer_id", sa.Uuid(), nullable=True),
+        sa.Column("qa_result", _jsonb(), nullable=True),
+        sa.Column("output_path", sa.String(length=500), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        _timestamp("created_at"),
+        _timestamp("updated_at"),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("retry_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_retries", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("qa_feedback_history", _jsonb(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["phase_id"], ["phases.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["worker_id"], ["workers.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["reviewer_id"], ["workers.id"], ondelete="SET NULL"),
+    )
+
+    op.create_table(
+        "task_dependencies",
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("dependency_id", sa.Uuid(), nullable=False),
+        sa.PrimaryKeyConstraint("task_id", "dependency_id"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["dependency_id"], ["tasks.id"], ondelete="CASCADE"),
+    )
+
+    op.create_table(
+        "task_history",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("from_status", sa.String(length=50), nullable=False),
+        sa.Column("to_status", sa.String(length=50), nullable=False),
+        sa.Column("actor", sa.String(length=100), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("metadata", _jsonb(), nullable=True),
+        _timestamp("timestamp", CLOCK_TIMESTAMP),
+        sa.PrimaryKeyConstraint("id", "timestamp", name="task_history_pkey"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    create_monthly_partitions("task_history", datetime.now(timezone.utc).date(), TASK_HISTORY_FUTURE_MONTHS + 1)
+
+    op.create_table(
+        "settings",
+        sa.Column("key", sa.Text(), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False, server_default=""),
+        _timestamp("updated_at"),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+    op.create_table(
+        "registration_tokens",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("token", sa.Text(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        _timestamp("created_at"),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("revoked", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "api_keys",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("key_hash", sa.String(length=64), nullable=False),
+        sa.Column("key_prefix", sa.String(length=10), nullable=False),
+        sa.Column("role", role, nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        _timestamp("created_at"),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", sa.String(length=255), nullable=True),
+        sa.Column("metadata", postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key_hash"),
+    )
+
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        _timestamp("timestamp"),
+        sa.Column("action", auditaction, nullable=False),
+        sa.Column("severity", auditseverity, nullable=False),
+        sa.Column("actor_id", sa.String(length=255), nullable=True),
+        sa.Column("actor_type", sa.String(length=50), nullable=True),
+        sa.Column("resource_type", sa.String(length=100), nullable=True),
+        sa.Column("resource_id", sa.String(length=255), nullable=True),
+        sa.Column("ip_address", sa.String(length=45), nullable=True),
+        sa.Column("user_agent", sa.String(length=500), nullable=True),
+        sa.Column("details", postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column("request_path", sa.String(length=500), nullable=True),
+        sa.Column("request_method", sa.String(length=10), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "consent_records",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("subject_id", sa.String(length=255), nullable=False),
+        sa.Column("purpose", sa.String(length=500), nullable=False),
+        sa.Column("consent_given", sa.Boolean(), nullable=False),
+        _timestamp("consent_timestamp"),
+        sa.Column("withdrawal_timestamp", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("ip_address", sa.String(length=45), nullable=True),
+        sa.Column("metadata", postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "data_processing_records",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("purpose", sa.String(length=500), nullable=False),
+        sa.Column("data_categories", sa.Text(), nullable=False),
+        sa.Column("data_subjects", sa.String(length=255), nullable=False),
+        sa.Column("retention_period", sa.String(length=100), nullable=False),
+        sa.Column("legal_basis", sa.String(length=255), nullable=False),
+        sa.Column("recipients", sa.Text(), nullable=True),
+        sa.Column("third_country_transfers", sa.Text(), nullable=True),
+        sa.Column("security_measures", sa.Text(), nullable=True),
+        _timestamp("created_at"),
+        _timestamp("updated_at"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Indexes — all tables are empty here, so no CONCURRENTLY needed.
+    op.create_index("ix_design_messages_session_id", "design_messages", ["session_id"])
+    op.create_index("ix_design_messages_created_brin", "design_messages", ["created_at"], **BRIN_OPTIONS)
+    op.create_index("ix_tasks_project_status", "tasks", ["project_id", "status"])
+    op.create_index("ix_tasks_phase_status", "tasks", ["phase_id", "status"])
+    op.create_index("ix_tasks_worker_id", "tasks", ["worker_id"])
+    op.create_index(
+        "ix_tasks_project_open",
+        "tasks",
+        ["project_id", "status", "created_at"],
+        postgresql_where=sa.text("status IN ('ready', 'queued', 'in_progress', 'review', 'redesign')"),
+        postgresql_include=["id", "priority", "worker_id"],
+    )
+    op.create_index(
+        "ix_tasks_phase_open",
+        "tasks",
+        ["phase_id", "status"],
+        postgresql_where=sa.text("status <> 'done'"),
+        postgresql_include=["id"],
+    )
+    op.create_index("ix_task_history_task_id", "task_history", ["task_id"])
+    op.create_index("ix_task_history_timestamp_brin", "task_history", ["timestamp"], **BRIN_OPTIONS)
+    op.create_index("ix_registration_tokens_token", "registration_tokens", ["token"], unique=True)
+    op.create_index("ix_api_keys_key_hash", "api_keys", ["key_hash"])
+    op.create_index("ix_api_keys_role", "api_keys", ["role"])
+    op.create_index("ix_audit_logs_action_timestamp", "audit_logs", ["action", "timestamp"])
+    op.create_index("ix_audit_logs_actor_timestamp", "audit_logs", ["actor_id", "timestamp"])
+    op.create_index("ix_audit_logs_severity", "audit_logs", ["severity"])
+    op.create_index("ix_consent_records_subject_id", "consent_records", ["subject_id"])
@@ -7,6 +7,7 @@ Create Date: 2026-02-10 00:00:00.000000
 """
 from typing import Sequence, Union
 
+import sqlalchemy as sa
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -16,11 +17,38 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _label_exists() -> bool:
+    if op.get_context().as_sql:
+        return False
+    return (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT 1 FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid "
+                "WHERE t.typname = 'taskstatus' AND e.enumlabel = 'blocked'"
+            )
+        )
+        .scalar()
+        is not None
+    )
+
+
 def upgrade() -> None:
-    op.execute("ALTER TYPE taskstatus ADD VALUE IF NOT EXISTS 'blocked'")
+    # Even with IF NOT EXISTS, ALTER TYPE locks the type before checking, so
+    # re-applied heads (dev / CI) look the label up in pg_enum first.
+    if _label_exists():
+        return
+    # ALTER TYPE ... ADD VALUE runs outside the migration transaction so it
+    # holds its lock on the type only for the statement itself.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE taskstatus ADD VALUE IF NOT EXISTS 'blocked'")
 
 
 def downgrade() -> None:
     # PostgreSQL does not support removing enum values directly.
-    # A full enum recreation would be needed for a true downgrade.
+    # A true downgrade would need a full enum recreation:
+    #   CREATE TYPE taskstatus_new AS ENUM (...values without 'blocked'...);
+    #   ALTER TABLE tasks ALTER COLUMN status TYPE taskstatus_new USING status::text::taskstatus_new;
+    #   DROP TYPE taskstatus;
+    #   ALTER TYPE taskstatus_new RENAME TO taskstatus;
     pass
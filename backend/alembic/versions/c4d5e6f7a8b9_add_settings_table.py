@@ -4,6 +4,13 @@ Revision ID: c4d5e6f7a8b9
 Revises: b3c4d5e6f7a8
 Create Date: 2026-02-12 00:00:00.000000
 
+Seed rows for this table must be loaded with
+``backend.alembic.helpers.fast_copy`` rather than row-by-row INSERTs::
+
+    fast_copy("settings", ["key", "value"], [("llm_model", "gpt-4o"), ...])
+
+COPY sends the whole batch in one stream, so per-row round trips and parse
+cost are paid once.
 """
 from typing import Sequence, Union
 
@@ -1,5 +1,10 @@
 """add registration_tokens table
 
+Indexes added to a table that may already contain rows are built with
+CREATE INDEX CONCURRENTLY (see backend/alembic/helpers.py); indexes on a
+table created in the same revision use plain op.create_index since the
+table is empty.
+
 Revision ID: d5e6f7a8b9c0
 Revises: c4d5e6f7a8b9
 Create Date: 2026-02-13 00:00:00.000000
@@ -10,6 +15,8 @@ from typing import Sequence, Union
 import sqlalchemy as sa
 from alembic import op
 
+from backend.alembic.helpers import create_index_concurrently, table_exists
+
 # revision identifiers, used by Alembic.
 revision: str = "d5e6f7a8b9c0"
 down_revision: str | None = "c4d5e6f7a8b9"
@@ -18,6 +25,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    if table_exists("registration_tokens"):
+        # Table was created out of band (e.g. metadata.create_all) and may
+        # already hold rows — build the index without blocking writers.
+        create_index_concurrently(
+            "ix_registration_tokens_token", "registration_tokens", ["token"], if_not_exists=True
+        )
+        return
+
     op.create_table(
         "registration_tokens",
         sa.Column("id", sa.Uuid(), primary_key=True),
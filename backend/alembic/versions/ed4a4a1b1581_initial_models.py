@@ -9,6 +9,9 @@ from typing import Sequence, Union
 
 import sqlalchemy as sa
 from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from backend.alembic.helpers import create_enum_types
 
 # revision identifiers, used by Alembic.
 revision: str = "ed4a4a1b1581"
@@ -19,14 +22,29 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Enum types
-    projectstatus = sa.Enum("design", "active", "paused", "completed", name="projectstatus")
-    phasestatus = sa.Enum("pending", "active", "completed", name="phasestatus")
-    taskstatus = sa.Enum("waiting", "ready", "queued", "in_progress", "review", "done", "rejected", name="taskstatus")
-    taskpriority = sa.Enum("low", "medium", "high", "critical", name="taskpriority")
-    workerstatus = sa.Enum("idle", "busy", "offline", name="workerstatus")
-    designsessionstatus = sa.Enum("active", "finalized", "cancelled", name="designsessionstatus")
-    messagerole = sa.Enum("user", "assistant", name="messagerole")
+    # Enum types — created together in one DO block; columns reference them
+    # with create_type=False so no per-column CREATE TYPE check is emitted.
+    projectstatus = postgresql.ENUM("design", "active", "paused", "completed", name="projectstatus", create_type=False)
+    phasestatus = postgresql.ENUM("pending", "active", "completed", name="phasestatus", create_type=False)
+    taskstatus = postgresql.ENUM(
+        "waiting", "ready", "queued", "in_progress", "review", "done", "rejected", name="taskstatus", create_type=False
+    )
+    taskpriority = postgresql.ENUM("low", "medium", "high", "critical", name="taskpriority", create_type=False)
+    workerstatus = postgresql.ENUM("idle", "busy", "offline", name="workerstatus", create_type=False)
+    designsessionstatus = postgresql.ENUM(
+        "active", "finalized", "cancelled", name="designsessionstatus", create_type=False
+    )
+    messagerole = postgresql.ENUM("user", "assistant", name="messagerole", create_type=False)
+
+    create_enum_types(
+        projectstatus,
+        phasestatus,
+        taskstatus,
+        taskpriority,
+        workerstatus,
+        designsessionstatus,
+        messagerole,
+    )
 
     # projects
     op.create_table(
@@ -98,7 +116,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.ForeignKeyConstraint(["session_id"], ["design_sessions.id"], ondelete="CASCADE"),
     )
-    op.create_index("ix_design_messages_session_created", "design_messages", ["session_id", "created_at"])
 
     # tasks
     op.create_table(
@@ -130,9 +147,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["worker_id"], ["workers.id"], ondelete="SET NULL"),
         sa.ForeignKeyConstraint(["reviewer_id"], ["workers.id"], ondelete="SET NULL"),
     )
-    op.create_index("ix_tasks_project_status", "tasks", ["project_id", "status"])
-    op.create_index("ix_tasks_phase_status", "tasks", ["phase_id", "status"])
-    op.create_index("ix_tasks_worker_id", "tasks", ["worker_id"])
 
     # task_dependencies
     op.create_table(
@@ -158,6 +172,13 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
     )
+
+    # Indexes are built after every table exists so the whole schema is laid
+    # down in one pass inside the migration transaction.
+    op.create_index("ix_design_messages_session_created", "design_messages", ["session_id", "created_at"])
+    op.create_index("ix_tasks_project_status", "tasks", ["project_id", "status"])
+    op.create_index("ix_tasks_phase_status", "tasks", ["phase_id", "status"])
+    op.create_index("ix_tasks_worker_id", "tasks", ["worker_id"])
     op.create_index("ix_task_history_task_timestamp", "task_history", ["task_id", "timestamp"])
 
 
@@ -0,0 +1,48 @@
+"""add partial covering indexes for the task scheduling hot path
+
+Revision ID: i0d1e2f3a4b5
+Revises: 7e7c56acd1a0
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.alembic.helpers import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "i0d1e2f3a4b5"
+down_revision: Union[str, None] = "7e7c56acd1a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Scheduler queries only look at non-terminal tasks: count_active_tasks,
+    # list_ready_by_priority and the redesign scan (TaskRepository). Done tasks
+    # dominate the table over time, so indexing only the open statuses keeps
+    # the index small; INCLUDE lets the active-count query run index-only.
+    # tasks is populated by now, so both are built CONCURRENTLY.
+    create_index_concurrently(
+        "ix_tasks_project_open",
+        "tasks",
+        ["project_id", "status", "created_at"],
+        postgresql_where=sa.text("status IN ('ready', 'queued', 'in_progress', 'review', 'redesign')"),
+        postgresql_include=["id", "priority", "worker_id"],
+    )
+    # Phase promotion (list_waiting_in_phase / list_incomplete_in_phase).
+    create_index_concurrently(
+        "ix_tasks_phase_open",
+        "tasks",
+        ["phase_id", "status"],
+        postgresql_where=sa.text("status <> 'done'"),
+        postgresql_include=["id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_phase_open", table_name="tasks")
+    op.drop_index("ix_tasks_project_open", table_name="tasks")
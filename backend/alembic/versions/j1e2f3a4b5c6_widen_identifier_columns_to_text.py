@@ -0,0 +1,43 @@
+"""store unbounded name/identifier columns as TEXT
+
+Revision ID: j1e2f3a4b5c6
+Revises: i0d1e2f3a4b5
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "j1e2f3a4b5c6"
+down_revision: Union[str, None] = "i0d1e2f3a4b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# VARCHAR(255) -> TEXT is binary-compatible in PostgreSQL, so these are
+# catalog-only changes (no table rewrite). Bounded columns with a real
+# meaning (commit_hash, platform, executor_type, paths) are left alone.
+COLUMNS: list[tuple[str, str, bool]] = [
+    ("projects", "name", False),
+    ("phases", "name", False),
+    ("phases", "branch_name", False),
+    ("tasks", "branch_name", True),
+    ("workers", "name", False),
+    ("design_sessions", "name", True),
+    ("settings", "key", False),
+    ("registration_tokens", "token", False),
+    ("registration_tokens", "name", False),
+]
+
+
+def upgrade() -> None:
+    for table, column, nullable in COLUMNS:
+        op.alter_column(table, column, type_=sa.Text(), existing_type=sa.String(255), existing_nullable=nullable)
+
+
+def downgrade() -> None:
+    for table, column, nullable in COLUMNS:
+        op.alter_column(table, column, type_=sa.String(255), existing_type=sa.Text(), existing_nullable=nullable)
@@ -0,0 +1,54 @@
+"""convert JSON columns to JSONB
+
+Revision ID: k2f3a4b5c6d7
+Revises: j1e2f3a4b5c6
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "k2f3a4b5c6d7"
+down_revision: Union[str, None] = "j1e2f3a4b5c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS: list[tuple[str, str]] = [
+    ("projects", "llm_config"),
+    ("workers", "capabilities"),
+    ("design_sessions", "llm_config"),
+    ("tasks", "worker_prompt"),
+    ("tasks", "qa_prompt"),
+    ("tasks", "qa_result"),
+    ("tasks", "qa_feedback_history"),
+    ("task_history", "metadata"),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=column + "::jsonb",
+        )
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=column + "::json",
+        )
@@ -0,0 +1,148 @@
+"""partition task_history by month
+
+task_history is append-only and grows without bound. It becomes a
+RANGE (timestamp) partitioned table with one partition per month plus a
+DEFAULT partition, so each month's indexes stay small and retention is a
+DROP TABLE on an old partition.
+
+Monthly partitions run from the month of the oldest existing row through
+FUTURE_MONTHS past the later of ANCHOR_MONTH and the newest row, so the
+result depends only on the data, not on when the migration runs; anything
+outside that window lands in task_history_default. Later months must be
+added ahead of time (pg_partman or a periodic migration) with
+CREATE TABLE task_history_yYYYYmMM PARTITION OF task_history FOR VALUES ...
+
+Existing rows are copied in keyset pages of COPY_PAGE_SIZE on ``id`` (the
+leading primary-key column on both layouts), so each statement reads a
+bounded index range instead of one INSERT ... SELECT over the whole table.
+The pages stay inside the migration transaction: the swap must be atomic,
+and committing mid-copy would leave both tables half-populated on failure.
+
+Revision ID: l3a4b5c6d7e8
+Revises: k2f3a4b5c6d7
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from backend.alembic.helpers import create_monthly_partitions
+
+# revision identifiers, used by Alembic.
+revision: str = "l3a4b5c6d7e8"
+down_revision: Union[str, None] = "k2f3a4b5c6d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FUTURE_MONTHS = 6
+# Month this revision was written; partitions never stop short of it
+ANCHOR_MONTH = date(2026, 3, 1)
+COPY_PAGE_SIZE = 10000
+
+COLUMN_LIST = "id, task_id, from_status, to_status, actor, reason, metadata, timestamp"
+
+
+def _history_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("from_status", sa.String(length=50), nullable=False),
+        sa.Column("to_status", sa.String(length=50), nullable=False),
+        sa.Column("actor", sa.String(length=100), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("metadata", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("timestamp", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        # Named explicitly: partitions keep clones of the generated name, so an
+        # unnamed FK on the replacement table would come out as ``..._fkey1``.
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], name="task_history_task_id_fkey", ondelete="CASCADE"),
+    ]
+
+
+def _swap_out_current_table(legacy_name: str) -> None:
+    op.drop_index("ix_task_history_task_timestamp", table_name="task_history")
+    op.rename_table("task_history", legacy_name)
+    # Free the constraint names so the replacement table gets the standard ones.
+    for suffix in ("pkey", "task_id_fkey"):
+        op.execute(
+            sa.text(
+                "ALTER TABLE " + legacy_name + " RENAME CONSTRAINT task_history_" + suffix + " TO "
+                + legacy_name + "_" + suffix
+            )
+        )
+
+
+def _months_between(first: date, last: date) -> int:
+    return (last.year - first.year) * 12 + last.month - first.month
+
+
+def _partition_months(source: str) -> tuple[date, int]:
+    """Return the first month and month count the partitions must cover for ``source``'s rows."""
+    oldest = newest = None
+    if not op.get_context().as_sql:
+        oldest, newest = op.get_bind().execute(
+            sa.text("SELECT min(timestamp), max(timestamp) FROM " + source)
+        ).one()
+    first = min(oldest.date(), ANCHOR_MONTH) if oldest is not None else ANCHOR_MONTH
+    last = max(newest.date(), ANCHOR_MONTH) if newest is not None else ANCHOR_MONTH
+    return first, _months_between(first, last) + FUTURE_MONTHS + 1
+
+
+def _copy_rows(source: str, target: str) -> None:
+    """Copy every row of ``source`` into ``target`` in keyset pages on ``id``."""
+    if op.get_context().as_sql:
+        op.execute("INSERT INTO " + target + " (" + COLUMN_LIST + ") SELECT " + COLUMN_LIST + " FROM " + source)
+        return
+
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        after = "" if last_id is None else " WHERE id > :last_id"
+        # The data-modifying CTE runs once per page; the outer select returns the page's last key.
+        last_id = bind.execute(
+            sa.text(
+                "WITH page AS (SELECT " + COLUMN_LIST + " FROM " + source + after + " ORDER BY id LIMIT :limit), "
+                "copied AS (INSERT INTO " + target + " (" + COLUMN_LIST + ") SELECT " + COLUMN_LIST + " FROM page) "
+                "SELECT id FROM page ORDER BY id DESC LIMIT 1"
+            ),
+            {"last_id": last_id, "limit": COPY_PAGE_SIZE},
+        ).scalar()
+        if last_id is None:
+            break
+
+
+def upgrade() -> None:
+    _swap_out_current_table("task_history_legacy")
+
+    # The partition key must be part of the primary key.
+    op.create_table(
+        "task_history",
+        *_history_columns(),
+        sa.PrimaryKeyConstraint("id", "timestamp", name="task_history_pkey"),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    create_monthly_partitions("task_history", *_partition_months("task_history_legacy"))
+    # Created on the parent, so every partition gets its own local index.
+    op.create_index("ix_task_history_task_timestamp", "task_history", ["task_id", "timestamp"])
+
+    _copy_rows("task_history_legacy", "task_history")
+    op.drop_table("task_history_legacy")
+
+
+def downgrade() -> None:
+    _swap_out_current_table("task_history_partitioned")
+
+    op.create_table(
+        "task_history",
+        *_history_columns(),
+        sa.PrimaryKeyConstraint("id", name="task_history_pkey"),
+    )
+    op.create_index("ix_task_history_task_timestamp", "task_history", ["task_id", "timestamp"])
+
+    _copy_rows("task_history_partitioned", "task_history")
+    # Dropping the parent drops every partition with it.
+    op.drop_table("task_history_partitioned")
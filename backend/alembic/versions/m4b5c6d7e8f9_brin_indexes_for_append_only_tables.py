@@ -0,0 +1,51 @@
+"""BRIN time indexes for append-only design_messages / task_history
+
+Rows in both tables are inserted in time order, so created_at / timestamp
+correlate with physical order and a BRIN index summarises them in a few
+pages. BRIN cannot narrow a lookup by a random UUID, so the composite
+(session_id, created_at) / (task_id, timestamp) btrees are replaced by a
+narrow btree on the lookup key plus a BRIN on the time column.
+
+Revision ID: m4b5c6d7e8f9
+Revises: l3a4b5c6d7e8
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from backend.alembic.helpers import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "m4b5c6d7e8f9"
+down_revision: Union[str, None] = "l3a4b5c6d7e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BRIN_OPTIONS = {"postgresql_using": "brin", "postgresql_with": {"pages_per_range": 32}}
+
+
+def upgrade() -> None:
+    create_index_concurrently("ix_design_messages_session_id", "design_messages", ["session_id"])
+    create_index_concurrently("ix_design_messages_created_brin", "design_messages", ["created_at"], **BRIN_OPTIONS)
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_design_messages_session_created", table_name="design_messages", postgresql_concurrently=True)
+
+    # task_history is partitioned; CONCURRENTLY is not supported on a
+    # partitioned parent, and each partition's build is small.
+    op.create_index("ix_task_history_task_id", "task_history", ["task_id"])
+    op.create_index("ix_task_history_timestamp_brin", "task_history", ["timestamp"], **BRIN_OPTIONS)
+    op.drop_index("ix_task_history_task_timestamp", table_name="task_history")
+
+
+def downgrade() -> None:
+    op.create_index("ix_task_history_task_timestamp", "task_history", ["task_id", "timestamp"])
+    op.drop_index("ix_task_history_timestamp_brin", table_name="task_history")
+    op.drop_index("ix_task_history_task_id", table_name="task_history")
+
+    create_index_concurrently("ix_design_messages_session_created", "design_messages", ["session_id", "created_at"])
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_design_messages_created_brin", table_name="design_messages", postgresql_concurrently=True)
+        op.drop_index("ix_design_messages_session_id", table_name="design_messages", postgresql_concurrently=True)
@@ -0,0 +1,39 @@
+"""clock_timestamp() defaults for task_history / design_messages
+
+now() is the transaction start time, so every row written in one
+transaction got the same timestamp and readers needed an id tiebreaker to
+order them. clock_timestamp() is evaluated per row. Only the column default
+changes (a catalog update, no table rewrite); projects and the other
+mutable tables keep now() so a transaction's writes share one time.
+
+Revision ID: n5c6d7e8f9a0
+Revises: m4b5c6d7e8f9
+Create Date: 2026-03-03 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "n5c6d7e8f9a0"
+down_revision: Union[str, None] = "m4b5c6d7e8f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    ("task_history", "timestamp"),
+    ("design_messages", "created_at"),
+)
+
+
+def upgrade() -> None:
+    for table_name, column_name in COLUMNS:
+        op.alter_column(table_name, column_name, server_default=sa.text("clock_timestamp()"))
+
+
+def downgrade() -> None:
+    for table_name, column_name in COLUMNS:
+        op.alter_column(table_name, column_name, server_default=sa.func.now())
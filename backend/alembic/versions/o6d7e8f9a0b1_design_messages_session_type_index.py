@@ -0,0 +1,43 @@
+"""composite (session_id, message_type, created_at, id) index on design_messages
+
+Session messages are eager-loaded with a single IN query filtered to chat
+messages and ordered by (created_at, id). With only ix_design_messages_session_id
+Postgres fetched every message of each session, dropped the finalize ones and
+sorted the rest; the composite index serves the filter and the order directly.
+It also covers every session_id lookup, so the single-column index is dropped.
+
+Revision ID: o6d7e8f9a0b1
+Revises: n5c6d7e8f9a0
+Create Date: 2026-03-04 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from backend.alembic.helpers import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "o6d7e8f9a0b1"
+down_revision: Union[str, None] = "n5c6d7e8f9a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_design_messages_session_type_created",
+        "design_messages",
+        ["session_id", "message_type", "created_at", "id"],
+    )
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_design_messages_session_id", table_name="design_messages", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    create_index_concurrently("ix_design_messages_session_id", "design_messages", ["session_id"])
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_design_messages_session_type_created", table_name="design_messages", postgresql_concurrently=True
+        )
@@ -0,0 +1,51 @@
+"""indexes for the task list, dependents lookup and registration token list
+
+GET /tasks/by-project filters tasks by project_id plus optional status and
+priority; (project_id, status, priority) serves every combination and its
+prefix covers all ix_tasks_project_status lookups, so that index is dropped.
+
+task_dependencies is keyed (task_id, dependency_id), which serves forward
+lookups only. find_waiting_dependents, clear_dependencies and the ON DELETE
+CASCADE on dependency_id all search by dependency_id and seq-scanned the
+table.
+
+GET /registration-tokens orders by created_at DESC; a btree on created_at is
+scanned backwards for that order.
+
+Revision ID: p7e8f9a0b1c2
+Revises: o6d7e8f9a0b1
+Create Date: 2026-03-05 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from backend.alembic.helpers import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "p7e8f9a0b1c2"
+down_revision: Union[str, None] = "o6d7e8f9a0b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently("ix_tasks_project_status_priority", "tasks", ["project_id", "status", "priority"])
+    create_index_concurrently("ix_task_dependencies_dependency_id", "task_dependencies", ["dependency_id"])
+    create_index_concurrently("ix_registration_tokens_created_at", "registration_tokens", ["created_at"])
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_tasks_project_status", table_name="tasks", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    create_index_concurrently("ix_tasks_project_status", "tasks", ["project_id", "status"])
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_registration_tokens_created_at", table_name="registration_tokens", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_task_dependencies_dependency_id", table_name="task_dependencies", postgresql_concurrently=True
+        )
+        op.drop_index("ix_tasks_project_status_priority", table_name="tasks", postgresql_concurrently=True)
@@ -2,19 +2,20 @@ from __future__ import annotations
 
 import json
 import re
-import unicodedata
 import uuid
 from typing import Any
 
+import orjson
 from backend.src import models, schemas
 from backend.src.api.settings import get_raw_llm_config
-from backend.src.core.llm_client import LLMClient, LLMConfig, LLMError
+from backend.src.core.llm_client import LLMConfig, LLMError, get_llm_client
 from backend.src.prompts.loader import get_prompt
 from backend.src.repositories.design_session_repository import DesignSessionRepository
 from backend.src.repositories.phase_repository import PhaseRepository
 from backend.src.repositories.project_repository import ProjectRepository
 from backend.src.repositories.task_repository import TaskRepository
 from backend.src.storage.database import async_session, get_db
+from backend.src.utils.text import slugify
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,15 +24,6 @@ from sse_starlette.sse import EventSourceResponse
 router = APIRouter(prefix="/api/v1/architect", tags=["architect"])
 
 
-def _slugify(value: str) -> str:
-    """Convert a string to a URL-friendly slug."""
-    value = (
-        unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
-    )
-    value = re.sub(r"[^\w\s-]", "", value.lower())
-    return re.sub(r"[-\s]+", "-", value).strip("-")
-
-
 FINALIZE_MARKER = "[FINALIZE]"
 _CONTEXT_RE = re.compile(r"<design_context>(.*?)</design_context>", re.DOTALL)
 
@@ -58,6 +50,20 @@ def _clean_response(text: str) -> tuple[str, bool, str | None]:
     return cleaned, has_finalize, design_context
 
 
+_SSE_LINE_SEP_RE = re.compile(r"\r\n|\r|\n")
+
+
+def _sse_chunk(text: str) -> bytes:
+    """Encode a ``chunk`` event as a ready-to-send SSE frame.
+
+    Produces the same bytes as ``ServerSentEvent(event="chunk", data=text)``
+    with EventSourceResponse's default separator; sse-starlette passes bytes
+    through untouched, so no per-chunk event object is built.
+    """
+    lines = _SSE_LINE_SEP_RE.split(text)
+    return ("event: chunk\r\ndata: " + "\r\ndata: ".join(lines) + "\r\n\r\n").encode()
+
+
 _STREAM_MARKERS = ["<design_context>", "[FINALIZE]"]
 _MAX_MARKER_LEN = max(len(m) for m in _STREAM_MARKERS)
 
@@ -80,15 +86,17 @@ def _find_potential_marker_start(text: str) -> int | None:
 
 def _extract_design_context(session: models.DesignSession) -> str | None:
     """Extract design_context from the last assistant chat message."""
-    chat_messages = [
-        m
-        for m in session.messages
-        if m.message_type == models.MessageType.chat
-        and m.role == models.MessageRole.assistant
-    ]
-    if not chat_messages:
+    # session.messages is already in chronological order (ordered in SQL)
+    last = next(
+        (
+            m
+            for m in reversed(session.messages)
+            if m.message_type == models.MessageType.chat and m.role == models.MessageRole.assistant
+        ),
+        None,
+    )
+    if last is None:
         return None
-    last = sorted(chat_messages, key=lambda m: m.created_at)[-1]
     match = _CONTEXT_RE.search(last.content)
     return match.group(1).strip() if match else None
 
@@ -101,30 +109,38 @@ def _build_llm_config(llm_config_dict: dict[str, Any] | None) -> LLMConfig:
         api_key=llm_config_dict["api_key"],
         model=llm_config_dict.get("model") or "anthropic/claude-sonnet-4-20250514",
         base_url=llm_config_dict.get("base_url"),
+        parsing_model=llm_config_dict.get("parsing_model"),
     )
 
 
+# MessageRole is a str enum, so this also resolves roles stored as plain strings.
+_ROLE_VALUES: dict[str, str] = {role: role.value for role in models.MessageRole}
+
+
+def _system_message() -> dict[str, str]:
+    """The architect system message; the prompt text itself is cached by the loader."""
+    return {"role": "system", "content": get_prompt("architect", "system")}
+
+
 def _build_message_history(session: models.DesignSession) -> list[dict[str, str]]:
     """Build LLM message history from a session's messages.
 
     Prepends the system prompt from the prompt template with role='system',
-    then appends all stored messages (user + assistant) in chronological order.
+    then appends all stored chat messages (user + assistant). Messages are
+    expected in chronological order, as the ``messages`` relationship loads
+    them; load the session with ``chat_only=True`` so internal messages are
+    not fetched at all (they are still skipped here if present).
+
+    The result is append-only across turns: nothing here depends on the
+    current time, counts or other request state, so the history sent on turn
+    N+1 starts with exactly the messages sent on turn N. Keep it that way —
+    providers only reuse their prompt cache for a byte-identical prefix.
     """
-    history: list[dict[str, str]] = [
-        {"role": "system", "content": get_prompt("architect", "system")},
-    ]
-    chat_messages = [
-        m for m in session.messages if m.message_type == models.MessageType.chat
-    ]
-    sorted_messages = sorted(chat_messages, key=lambda m: m.created_at)
+    history: list[dict[str, str]] = [_system_message()]
     history.extend(
-        {
-            "role": (
-                m.role.value if isinstance(m.role, models.MessageRole) else str(m.role)
-            ),
-            "content": m.content,
-        }
-        for m in sorted_messages
+        {"role": _ROLE_VALUES[m.role], "content": m.content}
+        for m in session.messages
+        if m.message_type == models.MessageType.chat
     )
     return history
 
@@ -145,11 +161,7 @@ async def list_sessions(
             status_filter = models.DesignSessionStatus(status)
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
-    sessions = await repo.list_sessions(status=status_filter)
-    for s in sessions:
-        s.messages = [
-            m for m in s.messages if m.message_type == models.MessageType.chat
-        ]
+    sessions = await repo.list_sessions(status=status_filter, chat_only=True)
     return [schemas.DesignSessionResponse.model_validate(s) for s in sessions]
 
 
@@ -214,15 +226,18 @@ async def create_session(
         llm_config_dict["model"] = settings["llm_model"]
     if settings.get("llm_base_url"):
         llm_config_dict["base_url"] = settings["llm_base_url"]
+    if settings.get("llm_parsing_model"):
+        llm_config_dict["parsing_model"] = settings["llm_parsing_model"]
 
     repo = DesignSessionRepository(db)
     session = await repo.add(
-        models.DesignSession(name=body.name, llm_config=llm_config_dict, worker_id=body.worker_id)
+        models.DesignSession(name=body.name, llm_config=llm_config_dict, worker_id=body.worker_id, messages=[])
     )
     await repo.commit()
 
-    # Reload with messages
-    loaded = await repo.get_by_id(session.id)
+    # A new session has no messages; one SELECT fills the columns the INSERT
+    # did not return.
+    loaded = await repo.get_by_id(session.id, load_messages=False)
     if loaded is None:
         raise HTTPException(status_code=500, detail="Failed to create session")
     return schemas.DesignSessionResponse.model_validate(loaded)
@@ -238,12 +253,9 @@ async def get_session(
 ) -> schemas.DesignSessionResponse:
     """Get a design session with all messages."""
     repo = DesignSessionRepository(db)
-    session = await repo.get_by_id(session_id)
+    session = await repo.get_by_id(session_id, chat_only=True)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    session.messages = [
-        m for m in session.messages if m.message_type == models.MessageType.chat
-    ]
     return schemas.DesignSessionResponse.model_validate(session)
 
 
@@ -260,7 +272,7 @@ async def send_message(
 ) -> schemas.DesignMessageResponse:
     """Send a message and get a non-streaming LLM response."""
     repo = DesignSessionRepository(db)
-    session = await repo.get_by_id(session_id)
+    session = await repo.get_by_id(session_id, chat_only=True)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -275,7 +287,7 @@ async def send_message(
     messages.append({"role": "user", "content": body.content})
 
     config = _build_llm_config(session.llm_config)
-    client = LLMClient(config)
+    client = get_llm_client(config)
 
     try:
         response_text = await client.chat(messages)
@@ -312,31 +324,35 @@ async def send_message_stream(
 ) -> EventSourceResponse:
     """Send a message and stream the LLM response via SSE."""
     repo = DesignSessionRepository(db)
-    session = await repo.get_by_id(session_id)
+    session = await repo.get_by_id(session_id, chat_only=True)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
     if session.status != models.DesignSessionStatus.active:
         raise HTTPException(status_code=400, detail="Session is not active")
 
-    # Save user message
-    await repo.add_message(session.id, models.MessageRole.user, body.content)
-
-    # Build message history
+    # Build message history from the session loaded above; the stream never
+    # re-reads it.
     messages = _build_message_history(session)
     messages.append({"role": "user", "content": body.content})
 
     config = _build_llm_config(session.llm_config)
-    client = LLMClient(config)
+    client = get_llm_client(config)
+
+    # End the read transaction so no connection sits idle-in-transaction
+    # while the LLM streams (30-60+ seconds).
+    await db.commit()
 
     async def event_generator():
-        full_response = ""
+        # Chunks are collected and joined once; += on the full response would
+        # copy everything received so far on every chunk.
+        response_parts: list[str] = []
         emit_buffer = ""
         suppressed = False
 
         try:
             async for chunk in client.stream_chat(messages):
-                full_response += chunk
+                response_parts.append(chunk)
 
                 if suppressed:
                     # Already found marker start — just accumulate for DB
@@ -349,7 +365,7 @@ async def send_message_stream(
                 if dc_idx != -1:
                     safe_text = emit_buffer[:dc_idx].rstrip()
                     if safe_text:
-                        yield {"event": "chunk", "data": safe_text}
+                        yield _sse_chunk(safe_text)
                     emit_buffer = ""
                     suppressed = True
                     continue
@@ -359,7 +375,7 @@ async def send_message_stream(
                 if fin_idx != -1:
                     safe_text = emit_buffer[:fin_idx].rstrip()
                     if safe_text:
-                        yield {"event": "chunk", "data": safe_text}
+                        yield _sse_chunk(safe_text)
                     emit_buffer = ""
                     suppressed = True
                     continue
@@ -369,33 +385,38 @@ async def send_message_stream(
                 if marker_start is not None:
                     safe_text = emit_buffer[:marker_start]
                     if safe_text:
-                        yield {"event": "chunk", "data": safe_text}
+                        yield _sse_chunk(safe_text)
                     emit_buffer = emit_buffer[marker_start:]
                 else:
                     if emit_buffer:
-                        yield {"event": "chunk", "data": emit_buffer}
+                        yield _sse_chunk(emit_buffer)
                     emit_buffer = ""
 
         except LLMError as e:
             yield {"event": "error", "data": str(e)}
             return
 
+        full_response = "".join(response_parts)
+
         # Flush remaining buffer that turned out not to be a marker
         if emit_buffer and not suppressed:
             cleaned_buf = emit_buffer.replace(FINALIZE_MARKER, "")
             cleaned_buf = _CONTEXT_RE.sub("", cleaned_buf).strip()
             if cleaned_buf:
-                yield {"event": "chunk", "data": cleaned_buf}
+                yield _sse_chunk(cleaned_buf)
 
         # Detect and strip finalize marker / design_context
         cleaned_response, has_finalize, design_context = _clean_response(full_response)
 
-        # Save assistant response (with design_context preserved for finalize extraction)
+        # Persist the turn with a short-lived, insert-only session: the user
+        # message and the assistant response (with design_context preserved
+        # for finalize extraction) are committed together.
         stored_response = full_response.replace(FINALIZE_MARKER, "").strip()
-        await repo.add_message(
-            session.id, models.MessageRole.assistant, stored_response
-        )
-        await repo.commit()
+        async with async_session() as write_db:
+            write_repo = DesignSessionRepository(write_db)
+            await write_repo.add_message(session_id, models.MessageRole.user, body.content)
+            await write_repo.add_message(session_id, models.MessageRole.assistant, stored_response)
+            await write_repo.commit()
 
         yield {"event": "done", "data": cleaned_response}
 
@@ -422,7 +443,7 @@ async def finalize_design(
     """
     # ── Phase 1: Read session & prepare LLM messages (short DB scope) ──
     session_repo = DesignSessionRepository(db)
-    session = await session_repo.get_by_id(session_id)
+    session = await session_repo.get_by_id(session_id, chat_only=True)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -449,7 +470,7 @@ async def finalize_design(
     if design_context:
         finalize_prompt = finalize_template.format(design_context=design_context)
         messages = [
-            {"role": "system", "content": get_prompt("architect", "system")},
+            _system_message(),
             {"role": "user", "content": finalize_prompt},
         ]
     else:
@@ -461,7 +482,7 @@ async def finalize_design(
 
     # ── Phase 2: LLM call (DB not used — reads are done) ────────────────
     config = _build_llm_config(llm_config_dict)
-    client = LLMClient(config)
+    client = get_llm_client(config)
 
     try:
         result = await client.structured_output(
@@ -499,7 +520,7 @@ async def finalize_design(
         await write_session_repo.add_message(
             session.id,
             models.MessageRole.assistant,
-            json.dumps(result, ensure_ascii=False),
+            orjson.dumps(result).decode(),
             message_type=models.MessageType.internal,
         )
 
@@ -515,97 +536,90 @@ async def finalize_design(
                 project_llm_config["pm"]["model"] = body.pm_llm_config.model
             if body.pm_llm_config.base_url:
                 project_llm_config["pm"]["base_url"] = body.pm_llm_config.base_url
+            if body.pm_llm_config.parsing_model:
+                project_llm_config["pm"]["parsing_model"] = body.pm_llm_config.parsing_model
+
+        phases_data = result.get("phases", [])
+        if not phases_data:
+            raise HTTPException(status_code=400, detail="Design must contain at least one phase with tasks")
 
-        # Create project
+        # IDs are assigned up front so dependency wiring and phase gating are
+        # resolved in Python, and the unit of work can insert the project,
+        # all phases and all tasks in one flush (batched per table).
         project = models.Project(
+            id=uuid.uuid4(),
             name=result.get("project_name", "Untitled Project"),
             description=result.get("project_description", ""),
             repo_path=body.repo_path,
             status=models.ProjectStatus.design,
             llm_config=project_llm_config,
         )
-        write_db.add(project)
-        await write_db.flush()
-
-        # Create phases and tasks, collecting all tasks in a flat list for dependency resolution
-        all_tasks: list[models.Task] = []
-        phases_data = result.get("phases", [])
-        phases_by_order: dict[int, models.Phase] = {}
-
-        # Track which flat indices belong to each phase
-        phase_task_indices: dict[int, set[int]] = {}  # phase_order -> set of flat indices
-        flat_idx_counter = 0
 
+        # Flatten tasks so depends_on_indices can be resolved against all tasks
+        flat_tasks: list[tuple[int, dict[str, Any]]] = [
+            (phase_order, task_data)
+            for phase_order, phase_data in enumerate(phases_data, start=1)
+            for task_data in phase_data.get("tasks", [])
+        ]
+        task_ids = [uuid.uuid4() for _ in flat_tasks]
+        dependency_pairs: list[tuple[uuid.UUID, uuid.UUID]] = []
+        tasks_with_deps: set[int] = set()
+        for flat_index, (_, task_data) in enumerate(flat_tasks):
+            for idx in task_data.get("depends_on_indices", []):
+                if 0 <= idx < len(task_ids):
+                    dependency_pairs.append((task_ids[flat_index], task_ids[idx]))
+                    tasks_with_deps.add(flat_index)
+
+        # Phase-gated task status: only the first phase is active, and its
+        # dep-free tasks are ready. All other tasks start out waiting.
+        new_rows: list[models.Phase | models.Task] = []
+        phase_ids: dict[int, uuid.UUID] = {}
+        branch_names: dict[int, str] = {}
         for phase_order, phase_data in enumerate(phases_data, start=1):
             phase_name = phase_data.get("name", f"Phase {phase_order}")
-            branch_name = f"phase/{_slugify(phase_name)}"
-
-            phase = models.Phase(
-                project_id=project.id,
-                name=phase_name,
-                description=phase_data.get("description"),
-                branch_name=branch_name,
-                order=phase_order,
+            phase_ids[phase_order] = uuid.uuid4()
+            branch_names[phase_order] = f"phase/{slugify(phase_name)}"
+            new_rows.append(
+                models.Phase(
+                    id=phase_ids[phase_order],
+                    project_id=project.id,
+                    name=phase_name,
+                    description=phase_data.get("description"),
+                    branch_name=branch_names[phase_order],
+                    order=phase_order,
+                    status=models.PhaseStatus.active if phase_order == 1 else models.PhaseStatus.pending,
+                )
             )
-            write_db.add(phase)
-            await write_db.flush()
-            phases_by_order[phase_order] = phase
-
-            task_indices: set[int] = set()
-            for task_data in phase_data.get("tasks", []):
-                priority_str = task_data.get("priority", "medium")
-                try:
-                    priority = models.TaskPriority(priority_str)
-                except ValueError:
-                    priority = models.TaskPriority.medium
-
-                task = models.Task(
+
+        for flat_index, (phase_order, task_data) in enumerate(flat_tasks):
+            priority_str = task_data.get("priority", "medium")
+            try:
+                priority = models.TaskPriority(priority_str)
+            except ValueError:
+                priority = models.TaskPriority.medium
+
+            is_ready = phase_order == 1 and flat_index not in tasks_with_deps
+            new_rows.append(
+                models.Task(
+                    id=task_ids[flat_index],
                     project_id=project.id,
-                    phase_id=phase.id,
+                    phase_id=phase_ids[phase_order],
                     title=task_data.get("title", "Untitled Task"),
                     description=task_data.get("description"),
                     priority=priority,
                     worker_prompt={"prompt": task_data.get("worker_prompt", "")},
                     qa_prompt={"prompt": task_data.get("qa_prompt", "")},
-                    branch_name=branch_name,
+                    branch_name=branch_names[phase_order],
+                    status=models.TaskStatus.ready if is_ready else models.TaskStatus.waiting,
                 )
-                write_db.add(task)
-                await write_db.flush()
-                all_tasks.append(task)
-                task_indices.add(flat_idx_counter)
-                flat_idx_counter += 1
-
-            phase_task_indices[phase_order] = task_indices
+            )
 
-        # Wire up dependencies using depends_on_indices
-        task_repo = TaskRepository(write_db)
-        tasks_with_deps: set[int] = set()
-        flat_index = 0
-        for phase_data in phases_data:
-            for task_data in phase_data.get("tasks", []):
-                depends_on_indices = task_data.get("depends_on_indices", [])
-                if depends_on_indices:
-                    dep_ids = []
-                    for idx in depends_on_indices:
-                        if 0 <= idx < len(all_tasks):
-                            dep_ids.append(all_tasks[idx].id)
-                    if dep_ids:
-                        await task_repo.add_dependencies(all_tasks[flat_index].id, dep_ids)
-                        all_tasks[flat_index].status = models.TaskStatus.waiting
-                        tasks_with_deps.add(flat_index)
-                flat_index += 1
-
-        # Phase-gated task status: only first phase is active, its dep-free tasks are ready
-        if not phases_by_order:
-            raise HTTPException(status_code=400, detail="Design must contain at least one phase with tasks")
+        write_db.add(project)
+        write_db.add_all(new_rows)
+        await write_db.flush()
 
-        first_order = min(phases_by_order.keys())
-        phases_by_order[first_order].status = models.PhaseStatus.active
-        first_phase_indices = phase_task_indices.get(first_order, set())
-        for i, task in enumerate(all_tasks):
-            if i not in tasks_with_deps and i in first_phase_indices:
-                task.status = models.TaskStatus.ready
-            # All other tasks remain in default waiting status
+        # All dependency edges in one executemany, after the tasks exist
+        await TaskRepository(write_db).add_dependency_pairs(dependency_pairs)
 
         # Assign worker to project if session had a worker selected
         if session_worker_id:
@@ -669,8 +683,10 @@ async def redesign_phase(
                 llm_config_dict["model"] = body.llm_config.model
             if body.llm_config.base_url:
                 llm_config_dict["base_url"] = body.llm_config.base_url
+            if body.llm_config.parsing_model:
+                llm_config_dict["parsing_model"] = body.llm_config.parsing_model
             config = _build_llm_config(llm_config_dict)
-            client = LLMClient(config)
+            client = get_llm_client(config)
         else:
             client = create_llm_client_from_project(project, role="architect")
     except (ValueError, LLMError) as e:
@@ -712,7 +728,7 @@ async def redesign_phase(
     )
 
     llm_messages = [
-        {"role": "system", "content": get_prompt("architect", "system")},
+        _system_message(),
         {"role": "user", "content": prompt},
     ]
 
@@ -822,6 +838,7 @@ async def redesign_phase(
         all_tasks_by_id[str(t.id)] = t
         all_tasks_by_title[title] = t
 
+    rewired: dict[uuid.UUID, list[uuid.UUID]] = {}
     for item in new_task_list:
         item_id = item.get("id", "")
         item_title = item.get("title", "")
@@ -830,14 +847,13 @@ async def redesign_phase(
             continue
         depends_on_refs = item.get("depends_on", [])
         if depends_on_refs:
-            await task_repo.clear_dependencies(task_obj.id)
             dep_ids: list[uuid.UUID] = []
             for ref in depends_on_refs:
                 dep = all_tasks_by_id.get(ref) or all_tasks_by_title.get(ref)
                 if dep:
                     dep_ids.append(dep.id)
-            if dep_ids:
-                await task_repo.add_dependencies(task_obj.id, dep_ids)
+            rewired[task_obj.id] = dep_ids
+    await task_repo.replace_dependencies(rewired)
 
     # Clear intervention flags for redesign tasks in this phase
     for t in redesign_tasks:
@@ -879,31 +895,33 @@ async def add_task(
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Verify phase belongs to project
+    # The target phase is looked up in the project's phase list, which the
+    # context needs anyway; only an unknown id costs a second query to tell
+    # "not found" from "belongs to another project".
     phase_repo = PhaseRepository(db)
-    phase = await phase_repo.get_by_id(body.phase_id)
+    phases = await phase_repo.list_by_project(project_id)
+    phase = next((p for p in phases if p.id == body.phase_id), None)
 
     if phase is None:
-        raise HTTPException(status_code=404, detail="Phase not found")
-
-    if phase.project_id != project.id:
+        if await phase_repo.get_by_id(body.phase_id) is None:
+            raise HTTPException(status_code=404, detail="Phase not found")
         raise HTTPException(
             status_code=400, detail="Phase does not belong to this project"
         )
 
-    # Get project context (existing phases + tasks)
-    phases = await phase_repo.list_by_project(project_id)
+    # Only titles and descriptions go into the context, so dependencies
+    # are not loaded.
     task_repo = TaskRepository(db)
-    existing_tasks = await task_repo.list_by_project(project_id)
-
-    context = f"Project: {project.name}\nDescription: {project.description}\n\nExisting phases:\n"
-    for p in phases:
-        context += f"- {p.name}: {p.description or 'No description'}\n"
-    context += "\nExisting tasks:\n"
-    for t in existing_tasks:
-        context += (
-            f"- [{t.priority.value}] {t.title}: {t.description or 'No description'}\n"
-        )
+    existing_tasks = await task_repo.list_by_project(project_id, load_depends=False)
+
+    parts = [f"Project: {project.name}\nDescription: {project.description}\n\nExisting phases:\n"]
+    parts.extend(f"- {p.name}: {p.description or 'No description'}\n" for p in phases)
+    parts.append("\nExisting tasks:\n")
+    parts.extend(
+        f"- [{t.priority.value}] {t.title}: {t.description or 'No description'}\n"
+        for t in existing_tasks
+    )
+    context = "".join(parts)
 
     prompt = get_prompt("architect", "add_task").format(
         context=context,
@@ -919,6 +937,8 @@ async def add_task(
             llm_config_dict["model"] = body.llm_config.model
         if body.llm_config.base_url:
             llm_config_dict["base_url"] = body.llm_config.base_url
+        if body.llm_config.parsing_model:
+            llm_config_dict["parsing_model"] = body.llm_config.parsing_model
     elif project.llm_config and project.llm_config.get("architect"):
         llm_config_dict = project.llm_config["architect"]
 
@@ -929,10 +949,10 @@ async def add_task(
         )
 
     config = _build_llm_config(llm_config_dict)
-    client = LLMClient(config)
+    client = get_llm_client(config)
 
     messages = [
-        {"role": "system", "content": get_prompt("architect", "system")},
+        _system_message(),
         {"role": "user", "content": prompt},
     ]
 
@@ -962,6 +982,7 @@ async def add_task(
     )
     db.add(task)
     await db.commit()
-    await db.refresh(task)
 
+    # Every AddTaskResponse field was set on the object before the INSERT and
+    # commits do not expire it, so there is nothing to read back.
     return schemas.AddTaskResponse.model_validate(task)
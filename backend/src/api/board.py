@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import AsyncGenerator
 
 import redis.asyncio as aioredis
 from backend.src import models, schemas
+from backend.src.queue.board_events import BoardEventHub
 from backend.src.repositories.task_repository import TaskRepository
 from backend.src.storage.database import get_db
 from backend.src.utils.worker_registry import WorkerRegistry
 from fastapi import APIRouter, Depends, Request
+from pydantic_core import to_jsonable_python
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sse_starlette.sse import EventSourceResponse
@@ -19,37 +20,30 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/board", tags=["board"])
 
+# Maximum number of tasks rendered on one board
+BOARD_TASK_LIMIT = 500
 
-def _build_task_response(task: models.Task) -> schemas.TaskResponse:
-    """Build TaskResponse from Task ORM object."""
-    dep_ids = [dep.id for dep in task.depends_on] if task.depends_on else []
-    return schemas.TaskResponse(
-        id=task.id,
-        project_id=task.project_id,
-        phase_id=task.phase_id,
-        title=task.title,
-        description=task.description,
-        status=schemas.TaskStatus(task.status.value),
-        priority=schemas.TaskPriority(task.priority.value),
-        worker_prompt=task.worker_prompt,
-        qa_prompt=task.qa_prompt,
-        branch_name=task.branch_name,
-        commit_hash=task.commit_hash,
-        worker_id=task.worker_id,
-        reviewer_id=task.reviewer_id,
-        qa_result=task.qa_result,
-        output_path=task.output_path,
-        error_message=task.error_message,
-        retry_count=task.retry_count,
-        max_retries=task.max_retries,
-        qa_feedback_history=task.qa_feedback_history,
-        version=task.version,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        started_at=task.started_at,
-        completed_at=task.completed_at,
-        depends_on=dep_ids,
-    )
+
+# Every TaskResponse field except ``depends_on`` maps to a Task column of the
+# same name, so a new column cannot silently go missing from the board.
+_TASK_BOARD_FIELDS = tuple(name for name in schemas.TaskResponse.model_fields if name != "depends_on")
+
+
+def _task_board_entry(task: models.Task, dep_ids: list) -> dict:
+    """Plain-dict equivalent of ``build_task_response(task, dep_ids)``, skipping validation.
+
+    ``dep_ids`` comes from ``TaskRepository.list_with_dependency_ids`` so the
+    ``depends_on`` relationship is never touched.
+
+    Values are left as UUIDs and datetimes; ``_get_board_data`` converts the
+    whole board to JSON-compatible values in one pass, using the same
+    encoding as ``model_dump(mode="json")``.
+    """
+    entry = {name: getattr(task, name) for name in _TASK_BOARD_FIELDS}
+    entry["status"] = task.status.value
+    entry["priority"] = task.priority.value
+    entry["depends_on"] = dep_ids
+    return entry
 
 
 async def _get_board_data(
@@ -62,42 +56,40 @@ async def _get_board_data(
 
     pid = _uuid.UUID(project_id)
     repo = TaskRepository(db)
-    tasks = await repo.list_by_project(pid, limit=500)
+    tasks = await repo.list_with_dependency_ids(pid, limit=BOARD_TASK_LIMIT)
 
     # Group tasks by status — redesign tasks go into a separate list
     kanban_statuses = [s for s in models.TaskStatus if s != models.TaskStatus.redesign]
     columns: dict[str, list] = {status.value: [] for status in kanban_statuses}
     redesign_tasks: list[dict] = []
-    for task in tasks:
-        task_resp = _build_task_response(task)
+    stats: dict[str, int] = {status.value: 0 for status in models.TaskStatus}
+    for task, dep_ids in tasks:
+        stats[task.status.value] += 1
+        entry = _task_board_entry(task, dep_ids)
         if task.status == models.TaskStatus.redesign:
-            redesign_tasks.append(task_resp.model_dump(mode="json"))
+            redesign_tasks.append(entry)
         else:
-            columns[task.status.value].append(task_resp.model_dump(mode="json"))
+            columns[task.status.value].append(entry)
 
-    # Stats
-    status_counts = await repo.count_by_status(pid)
-    total = sum(status_counts.values())
-    stats: dict[str, int] = {"total": total}
-    for status in models.TaskStatus:
-        stats[status.value] = status_counts.get(status.value, 0)
+    # Stats — counted in the loop above unless the task list was truncated
+    if len(tasks) >= BOARD_TASK_LIMIT:
+        status_counts = await repo.count_by_status(pid)
+        stats = {status.value: status_counts.get(status.value, 0) for status in models.TaskStatus}
+    stats = {"total": sum(stats.values()), **stats}
 
     # Worker stats — only workers assigned to this project
     registry = WorkerRegistry(redis_client)
     assigned_ids: list[str] = []
-    workers: list[dict] = []
+    worker_counts = {"idle": 0, "busy": 0, "offline": 0}
     try:
         result = await db.execute(
             select(models.Worker.id).where(models.Worker.project_id == pid)
         )
         assigned_ids = [str(row[0]) for row in result.all()]
-        if assigned_ids:
-            workers = await registry.get_workers_by_ids(assigned_ids)
+        worker_counts = await registry.count_statuses(assigned_ids)
     except Exception:
         logger.warning("Failed to fetch assigned workers for project %s", pid, exc_info=True)
-    idle = sum(1 for w in workers if w.get("status") == "idle")
-    busy = sum(1 for w in workers if w.get("status") == "busy")
-    offline = len(assigned_ids) - len(workers)
+        worker_counts["offline"] = len(assigned_ids)
 
     # Phase lookup: id -> {name, order, status}
     phase_result = await db.execute(
@@ -109,14 +101,14 @@ async def _get_board_data(
         for row in phase_result.all()
     }
 
-    return {
+    return to_jsonable_python({
         "project_id": project_id,
         "columns": {status: {"tasks": task_list} for status, task_list in columns.items()},
         "stats": stats,
-        "workers": {"total": len(assigned_ids), "idle": idle, "busy": busy, "offline": offline},
+        "workers": {"total": len(assigned_ids), **worker_counts},
         "phases": phases,
         "redesign_tasks": redesign_tasks,
-    }
+    })
 
 
 @router.get("/{project_id}")
@@ -132,28 +124,19 @@ async def get_board(
 
 async def _board_event_generator(
     project_id: str,
-    redis_client: aioredis.Redis,
+    hub: BoardEventHub,
 ) -> AsyncGenerator[dict, None]:
-    """Subscribe to events:board stream and yield matching events."""
-    last_id = "$"
-    while True:
-        try:
-            messages = await redis_client.xread(
-                streams={"events:board": last_id},
-                count=10,
-                block=5000,
-            )
-            if messages:
-                for _stream_name, entries in messages:
-                    for msg_id, data in entries:
-                        last_id = msg_id
-                        event_project_id = data.get("project_id", "")
-                        if event_project_id == project_id:
-                            yield {
-                                "data": json.dumps(data),
-                            }
-        except asyncio.CancelledError:
-            break
+    """Yield this project's board events as they arrive from the shared hub."""
+    async with hub.subscribe(project_id) as queue:
+        while True:
+            try:
+                payload = await queue.get()
+            except asyncio.CancelledError:
+                break
+            if payload is None:
+                # Dropped for falling behind; ending the stream makes the client reconnect
+                break
+            yield {"data": payload}
 
 
 @router.get("/{project_id}/events")
@@ -162,5 +145,5 @@ async def board_events(
     request: Request,
 ) -> EventSourceResponse:
     """SSE stream for board events."""
-    redis_client: aioredis.Redis = request.app.state.redis
-    return EventSourceResponse(_board_event_generator(project_id, redis_client))
+    hub: BoardEventHub = request.app.state.board_events
+    return EventSourceResponse(_board_event_generator(project_id, hub))
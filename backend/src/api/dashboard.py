@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from sqlalchemy import func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src import models, schemas
@@ -13,45 +13,61 @@ router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"])
 @router.get("/stats", response_model=schemas.DashboardStatsResponse)
 async def get_dashboard_stats(db: AsyncSession = Depends(get_db)) -> schemas.DashboardStatsResponse:
     """Return aggregated dashboard statistics for projects, tasks, and workers."""
-    # Project stats
-    project_result = await db.execute(select(models.Project))
-    projects = project_result.scalars().all()
-    total_projects = len(projects)
-    active_projects = sum(1 for p in projects if p.status == models.ProjectStatus.active)
-    completed_projects = sum(1 for p in projects if p.status == models.ProjectStatus.completed)
-
-    # Task stats
-    task_result = await db.execute(select(models.Task))
-    tasks = task_result.scalars().all()
-    total_tasks = len(tasks)
-    active_tasks = sum(
-        1
-        for t in tasks
-        if t.status in (models.TaskStatus.ready, models.TaskStatus.queued, models.TaskStatus.in_progress, models.TaskStatus.review)
-    )
-    in_progress_tasks = sum(1 for t in tasks if t.status == models.TaskStatus.in_progress)
-    done_tasks = sum(1 for t in tasks if t.status == models.TaskStatus.done)
-    completion_rate = round((done_tasks / total_tasks * 100), 1) if total_tasks > 0 else 0.0
+    # Each table is reduced to its counters in the database instead of
+    # loading every row into Python to count it. The three one-row
+    # aggregates are cross-joined so all counters come back in one round trip.
+    project_counts = select(
+        func.count().label("total_projects"),
+        func.count().filter(models.Project.status == models.ProjectStatus.active).label("active_projects"),
+        func.count().filter(models.Project.status == models.ProjectStatus.completed).label("completed_projects"),
+    ).subquery()
 
-    # Worker stats
-    worker_result = await db.execute(select(models.Worker))
-    workers = worker_result.scalars().all()
-    total_workers = len(workers)
-    online_workers = sum(
-        1 for w in workers if w.status in (models.WorkerStatus.idle, models.WorkerStatus.busy)
-    )
-    busy_workers = sum(1 for w in workers if w.status == models.WorkerStatus.busy)
+    task_counts = select(
+        func.count().label("total_tasks"),
+        func.count()
+        .filter(
+            models.Task.status.in_(
+                (
+                    models.TaskStatus.ready,
+                    models.TaskStatus.queued,
+                    models.TaskStatus.in_progress,
+                    models.TaskStatus.review,
+                )
+            )
+        )
+        .label("active_tasks"),
+        func.count().filter(models.Task.status == models.TaskStatus.in_progress).label("in_progress_tasks"),
+        func.count().filter(models.Task.status == models.TaskStatus.done).label("done_tasks"),
+    ).subquery()
+
+    worker_counts = select(
+        func.count().label("total_workers"),
+        func.count()
+        .filter(models.Worker.status.in_((models.WorkerStatus.idle, models.WorkerStatus.busy)))
+        .label("online_workers"),
+        func.count().filter(models.Worker.status == models.WorkerStatus.busy).label("busy_workers"),
+    ).subquery()
+
+    counts = (
+        await db.execute(
+            select(project_counts, task_counts, worker_counts).select_from(
+                project_counts.join(task_counts, true()).join(worker_counts, true())
+            )
+        )
+    ).one()
+    total_tasks, done_tasks = counts.total_tasks, counts.done_tasks
+    completion_rate = round((done_tasks / total_tasks * 100), 1) if total_tasks > 0 else 0.0
 
     return schemas.DashboardStatsResponse(
-        total_projects=total_projects,
-        active_projects=active_projects,
-        completed_projects=completed_projects,
+        total_projects=counts.total_projects,
+        active_projects=counts.active_projects,
+        completed_projects=counts.completed_projects,
         total_tasks=total_tasks,
-        active_tasks=active_tasks,
-        in_progress_tasks=in_progress_tasks,
+        active_tasks=counts.active_tasks,
+        in_progress_tasks=counts.in_progress_tasks,
         done_tasks=done_tasks,
         completion_rate=completion_rate,
-        total_workers=total_workers,
-        online_workers=online_workers,
-        busy_workers=busy_workers,
+        total_workers=counts.total_workers,
+        online_workers=counts.online_workers,
+        busy_workers=counts.busy_workers,
     )
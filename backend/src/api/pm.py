@@ -7,6 +7,7 @@ import uuid
 from backend.src import models
 from backend.src.core.orchestrator import PMOrchestrator
 from backend.src.core.state_machine import TaskStateMachine
+from backend.src.queue.streams import RedisStreamManager
 from backend.src.repositories.phase_repository import PhaseRepository
 from backend.src.repositories.task_repository import TaskRepository
 from backend.src.storage.database import async_session, get_db
@@ -18,6 +19,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/pm", tags=["pm"])
 
+# Stateless; shared by every endpoint and orchestrator built here
+state_machine = TaskStateMachine()
+
 
 # -- Dependency helpers --------------------------------------------------------
 
@@ -32,34 +36,55 @@ def _get_stream_manager(request: Request) -> object:
     return request.app.state.stream_manager
 
 
-def _ensure_orchestrators(request: Request) -> dict[str, dict]:
-    """Ensure the orchestrators dict exists on app.state and return it."""
-    if not hasattr(request.app.state, "orchestrators"):
-        request.app.state.orchestrators = {}
+def _get_orchestrators(request: Request) -> dict[str, dict]:
+    """Get the per-project orchestrator entries (created at startup) from app state."""
     return request.app.state.orchestrators
 
 
+def _get_orchestrator(
+    project_id: uuid.UUID,
+    orchestrators: dict[str, dict] = Depends(_get_orchestrators),
+    registry: WorkerRegistry = Depends(_get_registry),
+    stream_manager: object = Depends(_get_stream_manager),
+) -> PMOrchestrator:
+    """Return the project's orchestrator, creating an idle entry on first use."""
+    pid = str(project_id)
+    entry = orchestrators.get(pid)
+    if entry is None:
+        entry = orchestrators[pid] = {
+            "orchestrator": PMOrchestrator(
+                stream_manager=stream_manager,
+                worker_registry=registry,
+                state_machine=state_machine,
+            ),
+            "task": None,
+            "running": False,
+        }
+    return entry["orchestrator"]
+
+
 # -- Endpoints ----------------------------------------------------------------
 
 
 @router.post("/{project_id}/start")
 async def start_orchestration(
     project_id: uuid.UUID,
-    request: Request,
+    orchestrators: dict[str, dict] = Depends(_get_orchestrators),
+    registry: WorkerRegistry = Depends(_get_registry),
+    stream_manager: object = Depends(_get_stream_manager),
 ) -> dict:
     """Start orchestration for a project."""
-    orchestrators = _ensure_orchestrators(request)
     pid = str(project_id)
 
+    # No await between this check and storing the new entry below, so
+    # concurrent start requests on the event loop cannot both pass it.
     if pid in orchestrators and orchestrators[pid].get("running"):
         raise HTTPException(
             status_code=409, detail="Orchestrator already running for this project"
         )
 
-    stream_manager = _get_stream_manager(request)
-    registry = _get_registry(request)
-    state_machine = TaskStateMachine()
-
+    # A fresh orchestrator per run: a paused one only flips its running flag,
+    # so its loops may still be winding down.
     orchestrator = PMOrchestrator(
         stream_manager=stream_manager,
         worker_registry=registry,
@@ -90,10 +115,9 @@ async def start_orchestration(
 @router.post("/{project_id}/pause")
 async def pause_orchestration(
     project_id: uuid.UUID,
-    request: Request,
+    orchestrators: dict[str, dict] = Depends(_get_orchestrators),
 ) -> dict:
     """Pause orchestration for a project."""
-    orchestrators = _ensure_orchestrators(request)
     pid = str(project_id)
 
     entry = orchestrators.get(pid)
@@ -112,33 +136,30 @@ async def pause_orchestration(
 @router.get("/{project_id}/status")
 async def get_orchestration_status(
     project_id: uuid.UUID,
-    request: Request,
     db: AsyncSession = Depends(get_db),
+    orchestrators: dict[str, dict] = Depends(_get_orchestrators),
+    registry: WorkerRegistry = Depends(_get_registry),
 ) -> dict:
     """Get orchestration status for a project."""
-    orchestrators = _ensure_orchestrators(request)
     pid = str(project_id)
 
     entry = orchestrators.get(pid)
     running = bool(entry and entry.get("running"))
 
-    # Worker counts
-    registry = _get_registry(request)
-    workers = await registry.get_all_workers()
-    idle_count = sum(1 for w in workers if w["status"] == "idle")
-    busy_count = sum(1 for w in workers if w["status"] == "busy")
-
-    # Task counts by status
+    # Worker counts come from the Redis status indexes; task counts from the
+    # DB. The two are independent, so both requests are in flight at once.
     repo = TaskRepository(db)
-    task_counts = await repo.count_by_status(project_id)
+    worker_counts, task_counts = await asyncio.gather(
+        registry.count_by_status(), repo.count_by_status(project_id)
+    )
 
     return {
         "project_id": pid,
         "running": running,
         "workers": {
-            "idle": idle_count,
-            "busy": busy_count,
-            "total": len(workers),
+            "idle": worker_counts["idle"],
+            "busy": worker_counts["busy"],
+            "total": worker_counts["idle"] + worker_counts["busy"],
         },
         "tasks": task_counts,
     }
@@ -148,51 +169,47 @@ async def get_orchestration_status(
 async def promote_waiting_tasks(
     project_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
+    stream_manager: RedisStreamManager = Depends(_get_stream_manager),
 ) -> dict:
     """Promote WAITING tasks in the active phase with all dependencies met to READY."""
     phase_repo = PhaseRepository(db)
     task_repo = TaskRepository(db)
-    state_machine = TaskStateMachine()
 
     active_phase = await phase_repo.get_active_phase(project_id)
     if active_phase is None:
         return {"detail": "No active phase", "promoted": []}
 
-    waiting_tasks = await task_repo.list_waiting_in_phase(active_phase.id)
+    # One query finds every promotable task; the transitions below only touch
+    # session state, and the commit flushes the status updates and history
+    # rows as batched executemany statements.
+    promotable_tasks = await task_repo.list_promotable_in_phase(active_phase.id)
 
     promoted: list[dict] = []
-    for task in waiting_tasks:
-        if await task_repo.check_dependencies_met(task.id):
-            await state_machine.transition(
-                task=task,
-                new_status=models.TaskStatus.ready,
-                reason="All dependencies met",
-                actor="system",
-                db_session=db,
-            )
-            promoted.append({"task_id": str(task.id), "title": task.title})
+    board_events: list[tuple[str, dict]] = []
+    for task in promotable_tasks:
+        await state_machine.transition(
+            task=task,
+            new_status=models.TaskStatus.ready,
+            reason="All dependencies met",
+            actor="system",
+            db_session=db,
+            event_buffer=board_events,
+        )
+        promoted.append({"task_id": str(task.id), "title": task.title})
 
     await db.commit()
+    # Board events go out only once the promotions are durable, in one round trip
+    await stream_manager.publish_board_events(board_events)
     return {"detail": f"Promoted {len(promoted)} tasks to ready", "promoted": promoted}
 
 
 @router.post("/{project_id}/queue-next")
 async def queue_next_task(
     project_id: uuid.UUID,
-    request: Request,
     db: AsyncSession = Depends(get_db),
+    orchestrator: PMOrchestrator = Depends(_get_orchestrator),
 ) -> dict:
     """Manually queue the highest-priority READY task."""
-    stream_manager = _get_stream_manager(request)
-    registry = _get_registry(request)
-    state_machine = TaskStateMachine()
-
-    orchestrator = PMOrchestrator(
-        stream_manager=stream_manager,
-        worker_registry=registry,
-        state_machine=state_machine,
-    )
-
     task = await orchestrator.queue_next(project_id, db)
     if not task:
         raise HTTPException(status_code=404, detail="No ready tasks to queue")
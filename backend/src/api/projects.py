@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import re
-import unicodedata
 from typing import Optional
 from uuid import UUID
 
@@ -9,22 +7,15 @@ from backend.src import models, schemas
 from backend.src.repositories.phase_repository import PhaseRepository
 from backend.src.repositories.project_repository import ProjectRepository
 from backend.src.storage.database import get_db
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from backend.src.utils.responses import validated_json
+from backend.src.utils.text import slugify
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # -- Helpers -------------------------------------------------------------------
 
 
-def slugify(value: str) -> str:
-    """Convert a string to a URL-friendly slug."""
-    value = (
-        unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
-    )
-    value = re.sub(r"[^\w\s-]", "", value.lower())
-    return re.sub(r"[-\s]+", "-", value).strip("-")
-
-
 class PhaseUpdate(BaseModel):
     """Local schema for partial phase updates."""
 
@@ -33,6 +24,11 @@ class PhaseUpdate(BaseModel):
     status: Optional[schemas.PhaseStatus] = None
 
 
+# Validate and encode the read-only list endpoints' rows in one compiled call
+_PROJECT_LIST_ADAPTER = TypeAdapter(list[schemas.ProjectResponse])
+_PHASE_LIST_ADAPTER = TypeAdapter(list[schemas.PhaseResponse])
+
+
 # -- Router --------------------------------------------------------------------
 
 router = APIRouter(prefix="/api/v1/projects", tags=["projects"], redirect_slashes=False)
@@ -53,12 +49,14 @@ async def create_project(
         name=project_data.name,
         description=project_data.description,
         repo_path=project_data.repo_path,
+        phases=[],
     )
     await repo.add(project)
+    # Timestamps come back via RETURNING, so with the unset columns recorded
+    # as NULL no reload is needed.
+    repo.mark_unset_columns_null(project)
     await repo.commit()
 
-    # Reload with phases eagerly loaded
-    project = await repo.get_by_id(project.id)
     return schemas.ProjectResponse.model_validate(project)
 
 
@@ -67,11 +65,10 @@ async def list_projects(
     limit: int = Query(50, le=200),
     offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
-) -> list[schemas.ProjectResponse]:
+) -> Response:
     """List all projects with pagination."""
     repo = ProjectRepository(db)
-    projects = await repo.list_all(limit=limit, offset=offset)
-    return [schemas.ProjectResponse.model_validate(p) for p in projects]
+    return validated_json(_PROJECT_LIST_ADAPTER, await repo.list_rows(limit=limit, offset=offset))
 
 
 @router.get("/{project_id}", response_model=schemas.ProjectResponse)
@@ -86,8 +83,6 @@ async def get_project(
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Sort phases by order before returning
-    project.phases.sort(key=lambda p: p.order)
     return schemas.ProjectResponse.model_validate(project)
 
 
@@ -113,8 +108,8 @@ async def update_project(
 
     await repo.commit()
 
-    # Reload with phases eagerly loaded
-    project = await repo.get_by_id(project_id)
+    # Phases are still loaded; only the server-side updated_at was expired
+    await db.refresh(project, ["updated_at"])
     return schemas.ProjectResponse.model_validate(project)
 
 
@@ -195,7 +190,7 @@ async def create_phase(
 async def list_phases(
     project_id: UUID,
     db: AsyncSession = Depends(get_db),
-) -> list[schemas.PhaseResponse]:
+) -> Response:
     """List all phases for a project, ordered by phase order."""
     project_repo = ProjectRepository(db)
     phase_repo = PhaseRepository(db)
@@ -204,8 +199,7 @@ async def list_phases(
     if not await project_repo.exists(project_id):
         raise HTTPException(status_code=404, detail="Project not found")
 
-    phases = await phase_repo.list_by_project(project_id)
-    return [schemas.PhaseResponse.model_validate(p) for p in phases]
+    return validated_json(_PHASE_LIST_ADAPTER, await phase_repo.list_rows_by_project(project_id))
 
 
 @router.patch("/phases/{phase_id}", response_model=schemas.PhaseResponse)
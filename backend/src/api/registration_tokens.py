@@ -2,21 +2,27 @@ from __future__ import annotations
 
 import secrets
 import uuid
+from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src import models, schemas
 from backend.src.config import settings
 from backend.src.storage.database import get_db
+from backend.src.utils.responses import validated_json
 
 router = APIRouter(prefix="/api/v1/registration-tokens", tags=["registration-tokens"])
 
+_TOKEN_LIST_ADAPTER = TypeAdapter(list[schemas.RegistrationTokenResponse])
+
 
 def _generate_token() -> str:
     """Generate a registration token with ``glrt-`` prefix."""
-    return f"glrt-{secrets.token_hex(20)}"
+    return "glrt-" + secrets.token_bytes(20).hex()
 
 
 @router.post("")
@@ -53,13 +59,26 @@ async def create_registration_token(
 
 @router.get("", response_model=list[schemas.RegistrationTokenResponse])
 async def list_registration_tokens(
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[datetime] = Query(None, description="Return tokens created before this time (keyset cursor)"),
+    before_id: Optional[uuid.UUID] = Query(None, description="Tie-breaker for ``before``: the last token's id"),
     db: AsyncSession = Depends(get_db),
-) -> list[models.RegistrationToken]:
-    """List all registration tokens."""
-    result = await db.execute(
-        select(models.RegistrationToken).order_by(models.RegistrationToken.created_at.desc())
-    )
-    return list(result.scalars().all())
+) -> Response:
+    """List registration tokens, newest first.
+
+    Pages are keyed on ``(created_at, id)``: pass the last token's
+    ``created_at`` as ``before`` and its ``id`` as ``before_id`` to fetch the
+    next page, so tokens sharing a timestamp are not skipped at a boundary.
+    """
+    tokens = models.RegistrationToken.__table__
+    # relies on ix_registration_tokens_created_at; id only orders ties
+    query = select(tokens).order_by(tokens.c.created_at.desc(), tokens.c.id.desc()).limit(limit)
+    if before is not None and before_id is not None:
+        query = query.where(tuple_(tokens.c.created_at, tokens.c.id) < tuple_(before, before_id))
+    elif before is not None:
+        query = query.where(tokens.c.created_at < before)
+    result = await db.execute(query)
+    return validated_json(_TOKEN_LIST_ADAPTER, result.mappings().all())
 
 
 @router.delete("/{token_id}")
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src import models, schemas
@@ -9,7 +13,57 @@ from backend.src.storage.database import get_db
 
 router = APIRouter(prefix="/api/v1/settings", tags=["settings"])
 
-_LLM_SETTING_KEYS = ("llm_api_key", "llm_model", "llm_base_url")
+_LLM_SETTING_KEYS = ("llm_api_key", "llm_model", "llm_base_url", "llm_parsing_model")
+
+# Dialect-specific INSERTs that support ON CONFLICT (SQLite is used in tests)
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Seconds a cached GET response is served before settings are re-read. Writes
+# through update_settings invalidate immediately; other worker processes see
+# the change once their copy expires.
+SETTINGS_CACHE_TTL = 30.0
+
+# (monotonic timestamp, response) of the last settings read
+_settings_cache: tuple[float, schemas.GlobalSettingsResponse] | None = None
+_settings_cache_lock = asyncio.Lock()
+# Bumped by every invalidation; a read only caches its result if no
+# invalidation happened while it was in flight
+_settings_generation = 0
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the cached settings response so the next read hits the DB."""
+    global _settings_cache, _settings_generation
+    _settings_cache = None
+    _settings_generation += 1
+
+
+def _cached_settings() -> schemas.GlobalSettingsResponse | None:
+    if _settings_cache is None:
+        return None
+    cached_at, response = _settings_cache
+    if time.monotonic() - cached_at >= SETTINGS_CACHE_TTL:
+        return None
+    return response
+
+
+def _store_settings(response: schemas.GlobalSettingsResponse, generation: int) -> None:
+    """Cache ``response`` unless the cache was invalidated since ``generation`` was taken."""
+    global _settings_cache
+    if generation == _settings_generation:
+        _settings_cache = (time.monotonic(), response)
+
+
+async def _read_settings(db: AsyncSession) -> schemas.GlobalSettingsResponse:
+    """Build the masked settings response from the DB, bypassing the cache."""
+    result = await db.execute(select(models.Setting))
+    settings_map: dict[str, str] = {s.key: s.value for s in result.scalars().all()}
+    return schemas.GlobalSettingsResponse(
+        llm_api_key=mask_api_key(settings_map.get("llm_api_key")),
+        llm_model=settings_map.get("llm_model"),
+        llm_base_url=settings_map.get("llm_base_url"),
+        llm_parsing_model=settings_map.get("llm_parsing_model"),
+    )
 
 
 async def get_raw_llm_config(db: AsyncSession) -> dict[str, str]:
@@ -29,15 +83,24 @@ def mask_api_key(key: str | None) -> str | None:
 
 @router.get("", response_model=schemas.GlobalSettingsResponse)
 async def get_settings(db: AsyncSession = Depends(get_db)) -> schemas.GlobalSettingsResponse:
-    """Return global LLM settings with masked API key."""
-    result = await db.execute(select(models.Setting))
-    settings_map: dict[str, str] = {s.key: s.value for s in result.scalars().all()}
+    """Return global LLM settings with masked API key.
 
-    return schemas.GlobalSettingsResponse(
-        llm_api_key=mask_api_key(settings_map.get("llm_api_key")),
-        llm_model=settings_map.get("llm_model"),
-        llm_base_url=settings_map.get("llm_base_url"),
-    )
+    The response is cached for SETTINGS_CACHE_TTL seconds. Concurrent misses
+    wait on one lock so only the first of them queries the DB.
+    """
+    response = _cached_settings()
+    if response is not None:
+        return response
+
+    async with _settings_cache_lock:
+        response = _cached_settings()
+        if response is not None:
+            return response
+
+        generation = _settings_generation
+        response = await _read_settings(db)
+        _store_settings(response, generation)
+        return response
 
 
 @router.put("", response_model=schemas.GlobalSettingsResponse)
@@ -46,18 +109,28 @@ async def update_settings(
     db: AsyncSession = Depends(get_db),
 ) -> schemas.GlobalSettingsResponse:
     """Upsert global LLM settings. Returns the updated settings with masked API key."""
-    for field_name, value in body.model_dump(exclude_unset=True).items():
-        if value is not None:
-            existing = await db.execute(
-                select(models.Setting).where(models.Setting.key == field_name)
-            )
-            setting = existing.scalar_one_or_none()
-            if setting:
-                setting.value = value
-            else:
-                db.add(models.Setting(key=field_name, value=value))
+    rows = [
+        {"key": field_name, "value": value}
+        for field_name, value in body.model_dump(exclude_unset=True).items()
+        if value is not None
+    ]
+    if rows:
+        # One INSERT ... ON CONFLICT DO UPDATE for every field instead of a
+        # SELECT plus INSERT/UPDATE per field.
+        insert = _DIALECT_INSERTS[db.get_bind().dialect.name]
+        stmt = insert(models.Setting).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[models.Setting.key],
+            set_={"value": stmt.excluded.value, "updated_at": func.now()},
+        )
+        await db.execute(stmt)
 
     await db.commit()
+    invalidate_settings_cache()
 
-    # Return updated settings (with masking)
-    return await get_settings(db)
+    # Read past the cache: a GET that missed before the commit may still be
+    # holding the lock with the old rows, and must not answer for this write
+    generation = _settings_generation
+    response = await _read_settings(db)
+    _store_settings(response, generation)
+    return response
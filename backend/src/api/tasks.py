@@ -8,28 +8,47 @@ from backend.src.core.state_machine import TaskStateMachine
 from backend.src.models import Task
 from backend.src.repositories.task_repository import TaskRepository
 from backend.src.storage.database import get_db
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from backend.src.utils.responses import validated_json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.base import NO_VALUE
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
 
 state_machine = TaskStateMachine()
 
+# Validates and encodes a whole task list in one compiled call
+_TASK_LIST_ADAPTER = TypeAdapter(list[schemas.TaskResponse])
+
 
 # -- Helpers -------------------------------------------------------------------
 
 
-def build_task_response(task: Task) -> schemas.TaskResponse:
-    """Build TaskResponse from Task ORM object."""
-    dep_ids = [dep.id for dep in task.depends_on] if task.depends_on else []
-    return schemas.TaskResponse(
+def build_task_response(task: Task, dep_ids: list[uuid.UUID] | None = None) -> schemas.TaskResponse:
+    """Build TaskResponse from Task ORM object.
+
+    Pass ``dep_ids`` when they were fetched separately; otherwise they are
+    read from the ``depends_on`` relationship, which must already be loaded
+    so building a response never emits a lazy load. Every field comes from a
+    typed ORM column, so the model is constructed without re-validation; the
+    endpoint's ``response_model`` still checks what is sent.
+    """
+    if dep_ids is None:
+        dependencies = sa_inspect(task).attrs.depends_on.loaded_value
+        if dependencies is NO_VALUE:
+            raise RuntimeError(f"depends_on of task {task.id} is not loaded; pass dep_ids")
+        dep_ids = [dep.id for dep in dependencies]
+    return schemas.TaskResponse.model_construct(
         id=task.id,
         project_id=task.project_id,
         phase_id=task.phase_id,
         title=task.title,
         description=task.description,
-        status=schemas.TaskStatus(task.status.value),
-        priority=schemas.TaskPriority(task.priority.value),
+        status=schemas.TASK_STATUS_BY_VALUE[task.status.value],
+        priority=schemas.TASK_PRIORITY_BY_VALUE[task.priority.value],
         worker_prompt=task.worker_prompt,
         qa_prompt=task.qa_prompt,
         branch_name=task.branch_name,
@@ -63,21 +82,13 @@ async def create_task(
     """Create a new task."""
     repo = TaskRepository(db)
 
-    # Validate depends_on tasks exist
-    if task_data.depends_on:
-        missing = await repo.validate_dependencies_exist(task_data.depends_on)
-        if missing:
-            raise HTTPException(
-                status_code=400, detail=f"Dependency tasks not found: {missing}"
-            )
-
-        # Detect circular dependencies (use a temporary UUID since the task doesn't exist yet)
-        temp_id = uuid.uuid4()
-        if await repo.detect_circular_dependency(temp_id, task_data.depends_on):
-            raise HTTPException(status_code=400, detail="Circular dependency detected")
+    # Duplicates collapse so the edge insert cannot trip its primary key.
+    # No cycle check: the task is new, so no existing task can depend on it
+    # and its dependency edges cannot close a cycle.
+    dependency_ids = list(dict.fromkeys(task_data.depends_on))
 
     # Determine initial status based on phase and dependencies
-    if task_data.depends_on:
+    if dependency_ids:
         initial_status = models.TaskStatus.waiting
     else:
         # Only set to ready if the phase is active
@@ -96,25 +107,29 @@ async def create_task(
         phase_id=task_data.phase_id,
         title=task_data.title,
         description=task_data.description,
-        priority=models.TaskPriority(task_data.priority.value),
+        priority=models.TASK_PRIORITY_BY_VALUE[task_data.priority.value],
         worker_prompt={"prompt": task_data.worker_prompt},
         qa_prompt={"prompt": task_data.qa_prompt},
         status=initial_status,
         version=1,
     )
     await repo.add(task)
-
-    # Add dependency relationships
-    if task_data.depends_on:
-        await repo.add_dependencies(task.id, task_data.depends_on)
-
+    # The edges' foreign key checks that every dependency exists, so the
+    # usual case needs no SELECT up front; only a rejected insert pays for
+    # the lookup that names the missing ids.
+    try:
+        await repo.add_dependency_pairs([(task.id, dep_id) for dep_id in dependency_ids])
+    except IntegrityError as e:
+        await db.rollback()
+        found = await repo.list_existing_ids(dependency_ids)
+        missing = [d for d in dependency_ids if d not in found]
+        raise HTTPException(status_code=400, detail=f"Dependency tasks not found: {missing}") from e
+    # Timestamps come back via RETURNING and the dependency ids are the ones
+    # just inserted, so the response needs no reload.
+    repo.mark_unset_columns_null(task)
     await repo.commit()
 
-    # Reload with relationships
-    created_task = await repo.get_by_id(task.id)
-    if created_task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    return build_task_response(created_task)
+    return build_task_response(task, dependency_ids)
 
 
 @router.get("/{task_id}", response_model=schemas.TaskResponse)
@@ -123,16 +138,21 @@ async def get_task(
     include_history: bool = Query(False),
     db: AsyncSession = Depends(get_db),
 ) -> schemas.TaskResponse:
-    """Get a task by ID."""
+    """Get a task by ID.
+
+    Not cached by (task_id, version): only state transitions bump
+    ``version``, while PATCH, QA results, redesigns and dependency rewiring
+    change the response without touching it, so such a key would serve stale
+    tasks. The read is one query plus an unvalidated model build.
+    """
     repo = TaskRepository(db)
-    task = await repo.get_by_id(
-        task_id, load_depends=True, load_history=include_history
-    )
+    row = await repo.get_with_dependency_ids(task_id, load_history=include_history)
 
-    if task is None:
+    if row is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return build_task_response(task)
+    task, dep_ids = row
+    return build_task_response(task, dep_ids)
 
 
 @router.patch("/{task_id}", response_model=schemas.TaskResponse)
@@ -162,20 +182,19 @@ async def update_task(
             detail="Task can only be updated in waiting or ready status",
         )
 
-    update_data = task_data.model_dump(exclude_unset=True, exclude={"expected_version"})
-    for field, value in update_data.items():
+    # Read the sent fields straight off the model rather than dumping a dict
+    for field in task_data.model_fields_set - {"expected_version"}:
+        value = getattr(task_data, field)
         if field == "priority" and value is not None:
-            setattr(task, field, models.TaskPriority(value))
+            setattr(task, field, models.TASK_PRIORITY_BY_VALUE[value.value])
         else:
             setattr(task, field, value)
 
     await repo.commit()
 
-    # Reload with depends_on
-    updated_task = await repo.get_by_id(task_id, load_depends=True)
-    if updated_task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    return build_task_response(updated_task)
+    # depends_on is still loaded; only the server-side updated_at was expired
+    await db.refresh(task, ["updated_at"])
+    return build_task_response(task)
 
 
 @router.post("/{task_id}/transition", response_model=schemas.TransitionResponse)
@@ -187,21 +206,21 @@ async def transition_task(
 ) -> schemas.TransitionResponse:
     """Transition a task to a new status."""
     repo = TaskRepository(db)
-    task = await repo.get_by_id(task_id, load_depends=False)
+    # The version check rides on the locked load, so a concurrent transition
+    # cannot slip in between the check and the commit.
+    task = await repo.get_for_transition(task_id, transition.expected_version)
 
     if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    # Optimistic locking check
-    if transition.expected_version is not None:
-        if task.version != transition.expected_version:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Version conflict: expected {transition.expected_version}, current {task.version}",
-            )
+        current_version = await repo.get_version(task_id)
+        if current_version is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        raise HTTPException(
+            status_code=409,
+            detail=f"Version conflict: expected {transition.expected_version}, current {current_version}",
+        )
 
     # Convert schema TaskStatus to model TaskStatus
-    model_status = models.TaskStatus(transition.new_status.value)
+    model_status = models.TASK_STATUS_BY_VALUE[transition.new_status.value]
 
     # Get stream_manager from app state
     stream_manager = request.app.state.stream_manager
@@ -209,6 +228,7 @@ async def transition_task(
     # Store previous status for response
     previous_status = task.status
 
+    board_events: list[tuple[str, dict]] = []
     try:
         await state_machine.transition(
             task,
@@ -217,16 +237,18 @@ async def transition_task(
             actor=transition.actor,
             db_session=db,
             stream_manager=stream_manager,
+            event_buffer=board_events,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
     await repo.commit()
+    await stream_manager.publish_board_events(board_events)
 
     return schemas.TransitionResponse(
         task_id=task.id,
-        status=schemas.TaskStatus(task.status.value),
-        previous_status=schemas.TaskStatus(previous_status.value),
+        status=schemas.TASK_STATUS_BY_VALUE[task.status.value],
+        previous_status=schemas.TASK_STATUS_BY_VALUE[previous_status.value],
         transition={
             "from": previous_status.value,
             "to": task.status.value,
@@ -245,14 +267,18 @@ async def list_project_tasks(
     limit: int = Query(50, le=200),
     offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
-) -> list[schemas.TaskResponse]:
-    """List tasks for a project with optional filters."""
+) -> Response:
+    """List tasks for a project with optional filters.
+
+    Tasks are read as plain rows with their dependency ids; no ORM objects
+    are built on this read-only path.
+    """
     repo = TaskRepository(db)
 
     status_filter = models.TaskStatus(status) if status is not None else None
     priority_filter = models.TaskPriority(priority) if priority is not None else None
 
-    tasks = await repo.list_by_project(
+    rows = await repo.list_rows_by_project(
         project_id,
         status=status_filter,
         phase_id=phase_id,
@@ -260,5 +286,4 @@ async def list_project_tasks(
         limit=limit,
         offset=offset,
     )
-
-    return [build_task_response(task) for task in tasks]
+    return validated_json(_TASK_LIST_ADAPTER, rows)
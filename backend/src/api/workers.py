@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 import uuid
 from datetime import datetime, timezone
 
@@ -33,18 +34,51 @@ def _get_registry(request: Request) -> WorkerRegistry:
 
 # -- Auth dependency -----------------------------------------------------------
 
+# Seconds a resolved worker token is trusted without asking Redis. Deregister
+# and re-registration invalidate immediately; other API processes stop
+# accepting a revoked token once their copy expires.
+WORKER_TOKEN_CACHE_TTL = 30.0
+
+# token -> (monotonic expiry, worker_id); only valid tokens are cached.
+# Expired entries are swept once the cache grows past _TOKEN_CACHE_SWEEP_SIZE.
+_token_cache: dict[str, tuple[float, str]] = {}
+_TOKEN_CACHE_SWEEP_SIZE = 1024
+
+
+def invalidate_worker_token_cache(worker_id: str | None = None) -> None:
+    """Forget cached tokens of ``worker_id``, or every cached token if None."""
+    if worker_id is None:
+        _token_cache.clear()
+        return
+    for token in [t for t, (_, cached_id) in _token_cache.items() if cached_id == worker_id]:
+        del _token_cache[token]
+
 
 async def verify_worker_token(request: Request) -> str:
-    """Validate ``Authorization: Bearer {token}`` and return the worker_id."""
+    """Validate ``Authorization: Bearer {token}`` and return the worker_id.
+
+    Valid tokens are cached for WORKER_TOKEN_CACHE_TTL seconds, so the
+    heartbeat and poll loops of a registered worker skip the Redis lookup.
+    """
     auth = request.headers.get("Authorization")
     if not auth or not auth.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing or invalid token")
 
     token = auth.split(" ", 1)[1]
+    now = time.monotonic()
+    cached = _token_cache.get(token)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     registry = _get_registry(request)
     worker_id = await registry.resolve_token(token)
     if not worker_id:
+        _token_cache.pop(token, None)
         raise HTTPException(status_code=401, detail="Invalid token")
+    if len(_token_cache) >= _TOKEN_CACHE_SWEEP_SIZE:
+        for stale in [t for t, (expires_at, _) in _token_cache.items() if expires_at <= now]:
+            del _token_cache[stale]
+    _token_cache[token] = (now + WORKER_TOKEN_CACHE_TTL, worker_id)
     return worker_id
 
 
@@ -98,6 +132,7 @@ async def register_worker(
 
         # Invalidate old Redis token before issuing a new one
         await registry.deregister(worker_id)
+        invalidate_worker_token_cache(worker_id)
     else:
         worker_id = str(uuid.uuid4())
 
@@ -242,6 +277,7 @@ async def deregister_worker(
     """Deregister (remove) a worker."""
     registry = _get_registry(request)
     await registry.deregister(str(worker_id))
+    invalidate_worker_token_cache(str(worker_id))
     return {"detail": "Worker deregistered", "worker_id": str(worker_id)}
 
 
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+
+class StructuredOutputCache:
+    """Content-addressed cache of parsed ``structured_output`` results.
+
+    Entries live in Redis under ``llm:so:{sha256}`` with a TTL, so every API
+    process shares them, and the most recent ``local_size`` entries are also
+    kept in an in-process LRU. The key covers everything that shapes the
+    answer (credentials, model, endpoint, sampling options, response format
+    and messages), so a hit returns what the same request returned before.
+
+    The cache never fails a call: Redis errors are logged and treated as a
+    miss.
+    """
+
+    PREFIX = "llm:so:"
+
+    def __init__(self, redis_client: redis.Redis | None, ttl: int, local_size: int = 256) -> None:
+        self.redis = redis_client
+        self.ttl = ttl
+        self.local_size = local_size
+        # key -> (monotonic expiry, encoded result), least recently used first.
+        # Results are kept encoded so every hit hands out a fresh dict.
+        self._local: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    @staticmethod
+    def make_key(*fields: Any) -> str:
+        """Hash ``fields`` into a cache key.
+
+        Each field is canonical JSON (sorted keys) prefixed with its 8-byte
+        length, so no two different field lists hash the same bytes.
+        """
+        digest = hashlib.sha256()
+        for field in fields:
+            data = orjson.dumps(field, option=orjson.OPT_SORT_KEYS)
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached result for ``key``, or None on a miss."""
+        now = time.monotonic()
+        entry = self._local.get(key)
+        if entry is not None and entry[0] > now:
+            self._local.move_to_end(key)
+            return self._decode(entry[1])
+
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(self.PREFIX + key)  # type: ignore[misc]
+        except redis.RedisError as e:
+            logger.warning("structured_output cache read failed: %s", e)
+            return None
+        if raw is None:
+            return None
+        data = raw.encode() if isinstance(raw, str) else raw
+        result = self._decode(data)
+        if result is not None:
+            self._remember(key, data, now)
+        return result
+
+    async def set(self, key: str, result: dict[str, Any]) -> None:
+        """Store ``result`` under ``key`` for ``ttl`` seconds."""
+        data = orjson.dumps(result)
+        self._remember(key, data, time.monotonic())
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(self.PREFIX + key, data, ex=self.ttl)  # type: ignore[misc]
+        except redis.RedisError as e:
+            logger.warning("structured_output cache write failed: %s", e)
+
+    @staticmethod
+    def _decode(data: bytes) -> dict[str, Any] | None:
+        """Parse a stored result; anything but a JSON object counts as a miss."""
+        try:
+            result = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return None
+        return result if isinstance(result, dict) else None
+
+    def _remember(self, key: str, data: bytes, now: float) -> None:
+        self._local[key] = (now + self.ttl, data)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
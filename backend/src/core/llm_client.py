@@ -7,13 +7,20 @@ import re
 from typing import Any, AsyncIterator, Optional, cast
 
 import litellm
+import orjson
 from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
 from litellm.types.utils import Choices, ModelResponse
 from pydantic import BaseModel
 
+from backend.src.core.llm_cache import StructuredOutputCache
+
 logger = logging.getLogger(__name__)
 
-_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*\n(.*?)\n```", re.DOTALL)
+# LiteLLM prints a "Give Feedback / Get Help" banner to stdout for every failed
+# call; errors are already wrapped in LLMError and logged here.
+litellm.suppress_debug_info = True
+
+_JSON_DECODER = json.JSONDecoder()
 
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # seconds
@@ -21,31 +28,79 @@ RETRY_MAX_DELAY = 10.0  # seconds
 REQUEST_TIMEOUT = 120  # seconds — per acompletion call (connect + read)
 
 _RETRYABLE_STRINGS = ("overloaded", "rate_limit", "timeout", "429", "503", "529")
+# One case-insensitive pass over the message instead of a scan per marker
+_RETRYABLE_RE = re.compile("|".join(map(re.escape, _RETRYABLE_STRINGS)), re.IGNORECASE)
 
 
 def _is_retryable(exc: Exception) -> bool:
     """Check if an exception is transient and worth retrying."""
-    msg = str(exc).lower()
-    return any(s in msg for s in _RETRYABLE_STRINGS)
+    return _RETRYABLE_RE.search(str(exc)) is not None
+
+
+def _fenced_block(text: str) -> str | None:
+    """Return the body of the first ```json (or bare ```) fenced block, or None.
+
+    A find-based scan: each fence costs a couple of ``str.find`` calls
+    instead of a lazy DOTALL regex walking the whole response.
+    """
+    start = text.find("```")
+    while start != -1:
+        header_end = text.find("\n", start + 3)
+        if header_end == -1:
+            return None
+        if text[start + 3:header_end].rstrip() in ("", "json"):
+            end = text.find("\n```", header_end + 1)
+            if end == -1:
+                return None
+            return text[header_end + 1:end]
+        # Not a JSON fence (another language, or ``` inside a line): keep looking
+        start = text.find("```", start + 1)
+    return None
 
 
 def _extract_json(raw: str) -> dict[str, Any]:
-    """Parse JSON from LLM response, handling markdown code blocks."""
+    """Parse JSON from LLM response, handling markdown code blocks.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    catching the stdlib type.
+    """
     text = raw.strip()
     if not text:
         raise json.JSONDecodeError("Empty response from LLM", text, 0)
     # Try direct parse first
     try:
-        return json.loads(text)
+        return orjson.loads(text)
     except json.JSONDecodeError:
         pass
     # Try extracting from markdown code block
-    match = _JSON_BLOCK_RE.search(text)
-    if match:
-        return json.loads(match.group(1))
+    block = _fenced_block(text)
+    if block is not None:
+        return orjson.loads(block)
+    # Fall back to the first JSON object, ignoring prose around it
+    start = text.find("{")
+    if start != -1:
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            pass
     raise json.JSONDecodeError("No valid JSON found in LLM response", text, 0)
 
 
+_RESHAPE_PROMPT = (
+    "Convert the answer below into a single JSON object. Keep every piece of "
+    "information it contains and add nothing; output only the JSON."
+)
+
+
+def _reshape_messages(draft: str, response_format: dict[str, Any]) -> list[dict[str, Any]]:
+    """Messages asking a parsing model to restate ``draft`` as JSON matching ``response_format``."""
+    instructions = _RESHAPE_PROMPT
+    schema = response_format.get("json_schema", {}).get("schema")
+    if schema is not None:
+        instructions += "\nThe JSON must match this schema:\n" + orjson.dumps(schema).decode()
+    return [{"role": "system", "content": instructions}, {"role": "user", "content": draft}]
+
+
 class LLMError(Exception):
     """Custom exception wrapping LiteLLM errors."""
 
@@ -61,17 +116,24 @@ class LLMConfig(BaseModel):
     api_key: str
     model: str = "anthropic/claude-sonnet-4-20250514"
     base_url: Optional[str] = None
+    # Cheaper model that reshapes structured_output answers into JSON; it is
+    # called with the same api_key/base_url, so it must be served by the same provider
+    parsing_model: Optional[str] = None
 
     def __repr__(self) -> str:
         masked_key = f"***{self.api_key[-4:]}" if len(self.api_key) >= 4 else "***"
-        return f"LLMConfig(api_key='{masked_key}', model='{self.model}', base_url={self.base_url!r})"
+        return (
+            f"LLMConfig(api_key='{masked_key}', model='{self.model}', base_url={self.base_url!r}, "
+            f"parsing_model={self.parsing_model!r})"
+        )
 
 
 class LLMClient:
     """LiteLLM-based LLM client (provider-agnostic)."""
 
-    def __init__(self, config: LLMConfig) -> None:
+    def __init__(self, config: LLMConfig, cache: StructuredOutputCache | None = None) -> None:
         self.config = config
+        self.cache = cache
 
     async def chat(
         self,
@@ -179,19 +241,63 @@ class LLMClient:
         response_format: dict[str, Any],
         temperature: float = 0.3,
         max_tokens: int = 16384,
+        parsing_model: str | None = None,
     ) -> dict[str, Any]:
         """JSON structured output via streaming with automatic retry on transient errors.
 
         Uses streaming to avoid connection timeouts on long-running requests.
         Retries only when the error occurs before any chunks have been received.
+        With a cache, an identical earlier request's parsed result is returned
+        without calling the LLM.
+
+        With a parsing model (``parsing_model`` or ``config.parsing_model``)
+        the primary model answers in free text, without JSON mode, and the
+        parsing model reshapes that answer into ``response_format``.
         """
+        parsing_model = parsing_model or self.config.parsing_model
+        cache_key: str | None = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                self.config.api_key, self.config.model, self.config.base_url, parsing_model,
+                temperature, max_tokens, response_format, messages,
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("structured_output: cache hit, model=%s", self.config.model)
+                return cached
+
+        if parsing_model is None:
+            text = await self._stream_completion(self.config.model, messages, temperature, max_tokens, response_format)
+        else:
+            draft = await self._stream_completion(self.config.model, messages, temperature, max_tokens)
+            text = await self._stream_completion(
+                parsing_model, _reshape_messages(draft, response_format), 0.0, max_tokens, response_format
+            )
+        try:
+            result = _extract_json(text)
+        except json.JSONDecodeError as e:
+            raise LLMError(f"Failed to parse structured output as JSON: {e}", original_error=e) from e
+
+        if self.cache is not None and cache_key is not None:
+            await self.cache.set(cache_key, result)
+        return result
+
+    async def _stream_completion(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+    ) -> str:
+        """Stream one completion from ``model`` and return its full text, retrying transient errors."""
         last_exc: Exception | None = None
         for attempt in range(MAX_RETRIES + 1):
             started_streaming = False
             try:
-                logger.info("structured_output: model=%s, messages=%d, attempt=%d", self.config.model, len(messages), attempt + 1)
+                logger.info("structured_output: model=%s, messages=%d, attempt=%d", model, len(messages), attempt + 1)
                 stream = cast(CustomStreamWrapper, await litellm.acompletion(
-                    model=self.config.model,
+                    model=model,
                     messages=messages,
                     api_key=self.config.api_key,
                     api_base=self.config.base_url,
@@ -201,15 +307,13 @@ class LLMClient:
                     stream=True,
                     timeout=REQUEST_TIMEOUT,
                 ))
-                raw = ""
+                parts: list[str] = []
                 async for chunk in stream:
                     content = chunk.choices[0].delta.content
                     if content:
                         started_streaming = True
-                        raw += content
-                return _extract_json(raw)
-            except json.JSONDecodeError as e:
-                raise LLMError(f"Failed to parse structured output as JSON: {e}", original_error=e) from e
+                        parts.append(content)
+                return "".join(parts)
             except LLMError:
                 raise
             except Exception as e:
@@ -245,6 +349,37 @@ def create_llm_client(config: LLMConfig) -> LLMClient:
     return LLMClient(config)
 
 
+_clients: dict[tuple[str, str, str | None, str | None], LLMClient] = {}
+_structured_output_cache: StructuredOutputCache | None = None
+
+
+def configure_structured_output_cache(cache: StructuredOutputCache | None) -> None:
+    """Give clients handed out by :func:`get_llm_client` from now on ``cache``."""
+    global _structured_output_cache
+    _structured_output_cache = cache
+    _clients.clear()
+
+
+def get_llm_client(config: LLMConfig) -> LLMClient:
+    """Return the process-wide client for ``config``, creating it on first use.
+
+    Clients are keyed by (api_key, model, base_url, parsing_model), so every
+    request using the same credentials shares one client and LiteLLM's pooled
+    HTTP connections for it instead of starting cold.
+    """
+    key = (config.api_key, config.model, config.base_url, config.parsing_model)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = LLMClient(config, _structured_output_cache)
+    return client
+
+
+async def close_llm_clients() -> None:
+    """Drop cached clients and the response cache, and close LiteLLM's pooled async HTTP clients."""
+    configure_structured_output_cache(None)
+    await litellm.close_litellm_async_clients()
+
+
 def create_llm_client_from_project(project: Any, role: str = "architect") -> LLMClient:
     """Create client from Project model's llm_config.
 
@@ -268,5 +403,6 @@ def create_llm_client_from_project(project: Any, role: str = "architect") -> LLM
         api_key=role_config["api_key"],
         model=role_config.get("model", "anthropic/claude-sonnet-4-20250514"),
         base_url=role_config.get("base_url"),
+        parsing_model=role_config.get("parsing_model"),
     )
-    return LLMClient(config)
+    return get_llm_client(config)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any
@@ -26,6 +27,14 @@ logger = logging.getLogger(__name__)
 _INTERVENTION_KEY_TTL = 86400  # 24 hours — cleared early when user triggers manual redesign
 _RECOVERY_KEY_TTL = 86400      # 24 hours — matches intervention TTL to prevent counter reset loop
 
+# The scheduling loop waits for board / tasks:events entries; this caps the wait
+# so transitions that publish nothing are still picked up
+SCHEDULING_BLOCK_MS = 30000
+# How often the scheduling loop re-publishes orphaned redesign tasks
+_REDESIGN_RECOVERY_INTERVAL = 30.0
+# Back-off before retrying after the event wait itself fails
+_SCHEDULING_RETRY_DELAY = 5.0
+
 
 class PMOrchestrator:
     """PM Orchestrator - task scheduling, result processing, and auto-retry."""
@@ -66,8 +75,10 @@ class PMOrchestrator:
         """Promote WAITING tasks in the active phase whose dependencies are all met to READY."""
         try:
             async with db_session_factory() as db:
-                await self._promote_waiting_tasks_inner(project_id, db)
+                board_events: list[tuple[str, dict]] = []
+                await self._promote_waiting_tasks_inner(project_id, db, board_events)
                 await db.commit()
+                await self.stream_manager.publish_board_events(board_events)
         except Exception:
             logger.exception("Promote waiting tasks error")
 
@@ -81,7 +92,7 @@ class PMOrchestrator:
         try:
             async with db_session_factory() as db:
                 repo = TaskRepository(db)
-                redesign_tasks = await repo.list_by_project(project_id, status=TaskStatus.redesign)
+                redesign_tasks = await repo.list_by_project(project_id, status=TaskStatus.redesign, load_depends=False)
                 for task in redesign_tasks:
                     # Skip tasks that need manual intervention (check both Redis flag and DB marker)
                     intervention_key = f"task:{task.id}:needs_intervention"
@@ -118,8 +129,14 @@ class PMOrchestrator:
         except Exception:
             logger.exception("Recover orphaned redesign tasks error")
 
-    async def _promote_waiting_tasks_inner(self, project_id: uuid.UUID, db: AsyncSession) -> None:
-        """Promote WAITING tasks in the active phase (uses existing db session)."""
+    async def _promote_waiting_tasks_inner(
+        self, project_id: uuid.UUID, db: AsyncSession, event_buffer: list[tuple[str, dict]]
+    ) -> None:
+        """Promote WAITING tasks in the active phase (uses existing db session).
+
+        Board events are appended to ``event_buffer``; the caller publishes them
+        after committing.
+        """
         phase_repo = PhaseRepository(db)
         task_repo = TaskRepository(db)
 
@@ -131,27 +148,41 @@ class PMOrchestrator:
             first_pending.status = PhaseStatus.active
             active_phase = first_pending
 
-        waiting_tasks = await task_repo.list_waiting_in_phase(active_phase.id)
-        for task in waiting_tasks:
-            if await task_repo.check_dependencies_met(task.id):
-                await self.state_machine.transition(
-                    task=task,
-                    new_status=TaskStatus.ready,
-                    reason="All dependencies met",
-                    actor="system",
-                    db_session=db,
-                    stream_manager=self.stream_manager,
-                )
+        for task in await task_repo.list_promotable_in_phase(active_phase.id):
+            await self.state_machine.transition(
+                task=task,
+                new_status=TaskStatus.ready,
+                reason="All dependencies met",
+                actor="system",
+                db_session=db,
+                stream_manager=self.stream_manager,
+                event_buffer=event_buffer,
+            )
 
     async def stop(self) -> None:
         """Stop orchestration."""
         self._running = False
 
     async def _scheduling_loop(self, project_id: uuid.UUID, db_session_factory: Any) -> None:
-        """Schedule READY tasks one at a time per project (sequential execution)."""
+        """Schedule READY tasks one at a time per project (sequential execution).
+
+        Between passes the loop blocks on the project's board stream and on
+        ``tasks:events`` (worker went idle, results committed) instead of
+        sleeping, so a dispatch follows the change that enables it. Events
+        arriving during a pass are coalesced into the next one.
+        """
         logger.info("Scheduling loop started for project %s", project_id)
-        redesign_check_counter = 0
+        streams = [RedisStreamManager.board_stream(str(project_id)), RedisStreamManager.TASKS_EVENTS]
+        last_ids: dict[str, str] | None = None
+        last_recovery = time.monotonic()
         while self._running:
+            # Taken before the pass so events published during it still wake the next wait
+            if last_ids is None:
+                try:
+                    last_ids = await self.stream_manager.last_entry_ids(streams)
+                except Exception:
+                    logger.exception("Scheduling loop could not read event stream positions")
+
             try:
                 async with db_session_factory() as db:
                     repo = TaskRepository(db)
@@ -159,14 +190,15 @@ class PMOrchestrator:
                     # Sequential constraint: only one task at a time per project
                     active_count = await repo.count_active_tasks(project_id)
                     if active_count > 0:
-                        # Release DB connection before sleeping
+                        # Release DB connection before waiting
                         pass
                     else:
                         # Check phase completion and advance to next phase if needed
                         phase_events = await self._check_and_advance_phase(project_id, db)
 
                         # Promote waiting tasks in the active phase
-                        await self._promote_waiting_tasks_inner(project_id, db)
+                        board_events: list[tuple[str, dict]] = list(phase_events)
+                        await self._promote_waiting_tasks_inner(project_id, db, board_events)
 
                         ready_tasks = await repo.list_ready_by_priority(project_id)
                         workers = await self.registry.get_all_workers()
@@ -185,19 +217,24 @@ class PMOrchestrator:
 
                         await db.commit()
 
-                        # Publish phase events after successful commit
-                        for event_type, event_data in phase_events:
-                            await self.stream_manager.publish_board_event(event_type, event_data)
+                        # Publish phase and promotion events after successful commit
+                        await self.stream_manager.publish_board_events(board_events)
             except Exception:
                 logger.exception("Scheduling loop error")
 
-            # Periodically re-publish orphaned redesign tasks (every 6 cycles = ~30s)
-            redesign_check_counter += 1
-            if redesign_check_counter >= 6:
-                redesign_check_counter = 0
+            # Periodically re-publish orphaned redesign tasks
+            if time.monotonic() - last_recovery >= _REDESIGN_RECOVERY_INTERVAL:
+                last_recovery = time.monotonic()
                 await self._recover_orphaned_redesign_tasks(project_id, db_session_factory)
 
-            await asyncio.sleep(5)
+            if last_ids is None:
+                await asyncio.sleep(_SCHEDULING_RETRY_DELAY)
+                continue
+            try:
+                await self.stream_manager.wait_for_entries(last_ids, block=SCHEDULING_BLOCK_MS)
+            except Exception:
+                logger.exception("Scheduling loop event wait failed")
+                await asyncio.sleep(_SCHEDULING_RETRY_DELAY)
 
     async def _check_and_advance_phase(
         self, project_id: uuid.UUID, db: AsyncSession
@@ -251,6 +288,9 @@ class PMOrchestrator:
         logger.info("Results loop started for project %s", project_id)
         while self._running:
             try:
+                # The BLOCK wait is an awaited socket read on redis.asyncio, so it never
+                # holds up the event loop; a polling thread would only add a second
+                # client and a cross-thread hop per result.
                 messages = await self.stream_manager.consume(
                     stream=RedisStreamManager.TASKS_RESULTS,
                     group=RedisStreamManager.GROUP_PM,
@@ -270,6 +310,9 @@ class PMOrchestrator:
                             RedisStreamManager.GROUP_PM,
                             msg["_message_id"],
                         )
+                        # Board events from this result went out before the commit; wake the
+                        # schedulers again now that the new state is visible
+                        await self.stream_manager.notify_scheduler("result_processed")
                     except Exception:
                         logger.exception("Result processing error for message %s", msg.get("_message_id"))
             except Exception:
@@ -496,6 +539,7 @@ class PMOrchestrator:
                             RedisStreamManager.GROUP_ARCHITECT,
                             msg_id,
                         )
+                        await self.stream_manager.notify_scheduler("escalation_processed")
                     except Exception:
                         logger.exception("Escalation processing error for task %s (msg %s)", task_id, msg_id)
                         # ACK to prevent infinite retry on permanently failing messages
@@ -804,6 +848,7 @@ class PMOrchestrator:
             all_tasks_by_id[str(t.id)] = t
             all_tasks_by_title[title] = t
 
+        rewired: dict[uuid.UUID, list[uuid.UUID]] = {}
         for item in new_task_list:
             item_id = item.get("id", "")
             item_title = item.get("title", "")
@@ -813,16 +858,15 @@ class PMOrchestrator:
 
             depends_on_refs = item.get("depends_on", [])
             if depends_on_refs:
-                # Clear existing dependencies first
-                await task_repo.clear_dependencies(task.id)
                 dep_ids: list[uuid.UUID] = []
                 for ref in depends_on_refs:
                     # ref can be a UUID string or a task title
                     dep_task = all_tasks_by_id.get(ref) or all_tasks_by_title.get(ref)
                     if dep_task:
                         dep_ids.append(dep_task.id)
-                if dep_ids:
-                    await task_repo.add_dependencies(task.id, dep_ids)
+                rewired[task.id] = dep_ids
+        # Existing edges of every rewired task are cleared, then all new ones added
+        await task_repo.replace_dependencies(rewired)
 
     async def queue_next(self, project_id: uuid.UUID, db: AsyncSession) -> Task | None:
         """Manually queue the next ready task (respects sequential constraint)."""
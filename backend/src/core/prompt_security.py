@@ -4,35 +4,36 @@ import json
 import time
 import uuid
 
+# Signed prompts carry this in "version"; unversioned ones use the legacy JSON pre-image
+SIGNATURE_VERSION = 2
+
+
+def _length_prefixed(*fields: bytes) -> bytes:
+    """Join ``fields``, each prefixed with its 8-byte big-endian length."""
+    return b"".join(len(field).to_bytes(8, "big") + field for field in fields)
+
 
 class PromptSigner:
     """HMAC-SHA256 based prompt signing and verification."""
 
     def __init__(self, secret_key: str) -> None:
         self.secret_key = secret_key.encode()
+        # Keyed once; copying it skips re-deriving the inner/outer pads per call
+        self._mac_template = hmac.new(self.secret_key, b"", hashlib.sha256)
 
     def sign(self, prompt: str) -> dict:
         """Sign a prompt with HMAC-SHA256."""
         nonce = str(uuid.uuid4())
         timestamp = int(time.time())
 
-        payload = json.dumps({
-            "prompt": prompt,
-            "nonce": nonce,
-            "timestamp": timestamp,
-        }, sort_keys=True)
-
-        signature = hmac.new(
-            self.secret_key,
-            payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        signature = self._signature(self._payload(prompt, nonce, timestamp))
 
         return {
             "prompt": prompt,
             "signature": signature,
             "nonce": nonce,
             "timestamp": timestamp,
+            "version": SIGNATURE_VERSION,
         }
 
     def verify(self, signed_prompt: dict, max_age: int = 3600) -> bool:
@@ -47,21 +48,38 @@ class PromptSigner:
         if age > max_age or age < 0:
             return False
 
-        # 3. Recompute HMAC and compare
-        payload = json.dumps({
-            "prompt": signed_prompt["prompt"],
-            "nonce": signed_prompt["nonce"],
-            "timestamp": signed_prompt["timestamp"],
-        }, sort_keys=True)
+        # 3. Recompute HMAC over the pre-image for the prompt's version and compare
+        version = signed_prompt.get("version")
+        if version == SIGNATURE_VERSION:
+            prompt, nonce, timestamp = signed_prompt["prompt"], signed_prompt["nonce"], signed_prompt["timestamp"]
+            if not (isinstance(prompt, str) and isinstance(nonce, str) and isinstance(timestamp, int)):
+                return False
+            payload = self._payload(prompt, nonce, timestamp)
+        elif version is None:
+            # Byte-for-byte the original json.dumps pre-image (spaces, ASCII escapes)
+            payload = json.dumps({
+                "prompt": signed_prompt["prompt"],
+                "nonce": signed_prompt["nonce"],
+                "timestamp": signed_prompt["timestamp"],
+            }, sort_keys=True).encode()
+        else:
+            return False
 
-        expected = hmac.new(
-            self.secret_key,
-            payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        expected = self._signature(payload)
 
         return hmac.compare_digest(expected, signed_prompt["signature"])
 
+    @staticmethod
+    def _payload(prompt: str, nonce: str, timestamp: int) -> bytes:
+        """Build the HMAC pre-image: length-prefixed prompt and nonce, then the timestamp."""
+        return _length_prefixed(prompt.encode(), nonce.encode()) + timestamp.to_bytes(8, "big", signed=True)
+
+    def _signature(self, payload: bytes) -> str:
+        """Return the hex HMAC-SHA256 of ``payload`` under the signer's key."""
+        mac = self._mac_template.copy()
+        mac.update(payload)
+        return mac.hexdigest()
+
     def extract_prompt(self, signed_prompt: dict) -> str | None:
         """Verify and extract the prompt. Returns None if verification fails."""
         if self.verify(signed_prompt):
@@ -1,20 +1,24 @@
 """Security headers middleware for web security hardening."""
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Adds security headers to all HTTP responses.
 
     Implements OWASP recommended security headers for XSS prevention,
     clickjacking protection, content-type sniffing prevention, and more.
+
+    A plain ASGI middleware: it only rewrites the ``http.response.start``
+    message, so streamed bodies (SSE token streams) pass through chunk by
+    chunk instead of being relayed through BaseHTTPMiddleware's task and
+    memory stream.
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         *,
         hsts_max_age: int = 31536000,
         hsts_include_subdomains: bool = True,
@@ -23,35 +27,31 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         permissions_policy: str | None = None,
         enable_hsts: bool = False,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.hsts_max_age = hsts_max_age
         self.hsts_include_subdomains = hsts_include_subdomains
         self.hsts_preload = hsts_preload
         self.enable_hsts = enable_hsts
         self.content_security_policy = content_security_policy or "default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'"
         self.permissions_policy = permissions_policy or "camera=(), microphone=(), geolocation=(), payment=()"
+        self._headers = self._build_headers()
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
-
-        # Prevent XSS attacks
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Content Security Policy
-        response.headers["Content-Security-Policy"] = self.content_security_policy
-
-        # Permissions Policy (formerly Feature-Policy)
-        response.headers["Permissions-Policy"] = self.permissions_policy
-
-        # Prevent caching of API responses (skip if Cache-Control is already set by the handler)
-        if "Cache-Control" not in response.headers:
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, proxy-revalidate"
-            response.headers["Pragma"] = "no-cache"
+    def _build_headers(self) -> dict[str, str]:
+        """Headers set on every response; they only depend on configuration."""
+        headers = {
+            # Prevent XSS attacks
+            "X-Content-Type-Options": "nosniff",
+            "X-Frame-Options": "DENY",
+            "X-XSS-Protection": "1; mode=block",
+            # Referrer policy
+            "Referrer-Policy": "strict-origin-when-cross-origin",
+            # Content Security Policy
+            "Content-Security-Policy": self.content_security_policy,
+            # Permissions Policy (formerly Feature-Policy)
+            "Permissions-Policy": self.permissions_policy,
+            # Prevent MIME type confusion attacks
+            "X-Permitted-Cross-Domain-Policies": "none",
+        }
 
         # HSTS (only enable when serving over HTTPS in production)
         if self.enable_hsts:
@@ -60,9 +60,24 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 hsts_value += "; includeSubDomains"
             if self.hsts_preload:
                 hsts_value += "; preload"
-            response.headers["Strict-Transport-Security"] = hsts_value
+            headers["Strict-Transport-Security"] = hsts_value
+
+        return headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Prevent MIME type confusion attacks
-        response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self._headers.items():
+                    headers[name] = value
+                # Prevent caching of API responses (skip if Cache-Control is already set by the handler)
+                if "Cache-Control" not in headers:
+                    headers["Cache-Control"] = "no-store, no-cache, must-revalidate, proxy-revalidate"
+                    headers["Pragma"] = "no-cache"
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-import json
 import logging
 import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from backend.src.core.prompt_security import PromptSigner
     from backend.src.utils.worker_registry import WorkerRegistry
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.models import Phase, PhaseStatus, Task, TaskHistory, TaskStatus
+from backend.src.models import Task, TaskHistory, TaskStatus
 from backend.src.queue.streams import RedisStreamManager
 from backend.src.repositories.task_repository import TaskRepository
 
@@ -54,9 +54,15 @@ class TaskStateMachine:
         actor: str = "system",
         db_session: Optional[AsyncSession] = None,
         stream_manager: Optional[RedisStreamManager] = None,
+        event_buffer: Optional[list[tuple[str, dict]]] = None,
         **kwargs: Any,
     ) -> Task:
-        """Execute a state transition with side effects."""
+        """Execute a state transition with side effects.
+
+        When ``event_buffer`` is given the board event is appended to it instead
+        of being published, so bulk callers can flush every event with
+        ``RedisStreamManager.publish_board_events`` once their commit succeeds.
+        """
         old_status = task.status
 
         # 1. Validate transition
@@ -87,18 +93,19 @@ class TaskStateMachine:
             task, old_status, new_status, db_session, stream_manager, reason=reason, **kwargs
         )
 
-        # 5. Publish board event
-        if stream_manager is not None:
-            await stream_manager.publish_board_event(
-                "task_transition",
-                {
-                    "task_id": str(task.id),
-                    "project_id": str(task.project_id),
-                    "from_status": old_status.value,
-                    "to_status": new_status.value,
-                    "actor": actor,
-                },
-            )
+        # 5. Publish (or buffer) board event
+        if event_buffer is not None or stream_manager is not None:
+            event_data = {
+                "task_id": str(task.id),
+                "project_id": str(task.project_id),
+                "from_status": old_status.value,
+                "to_status": new_status.value,
+                "actor": actor,
+            }
+            if event_buffer is not None:
+                event_buffer.append(("task_transition", event_data))
+            else:
+                await stream_manager.publish_board_event("task_transition", event_data)  # type: ignore[union-attr]
 
         return task
 
@@ -168,7 +175,9 @@ class TaskStateMachine:
             # Include worker prompt
             if task.worker_prompt:
                 prompt_text = (
-                    task.worker_prompt if isinstance(task.worker_prompt, str) else json.dumps(task.worker_prompt)
+                    task.worker_prompt
+                    if isinstance(task.worker_prompt, str)
+                    else orjson.dumps(task.worker_prompt).decode()
                 )
                 if self.prompt_signer:
                     message["signed_worker_prompt"] = self.prompt_signer.sign(prompt_text)
@@ -231,12 +240,14 @@ class TaskStateMachine:
                 repo_path = await self._get_repo_path(task, db_session)
                 if repo_path:
                     message["repo_path"] = repo_path
-            if self.prompt_signer and task.qa_prompt:
-                prompt_text = task.qa_prompt if isinstance(task.qa_prompt, str) else json.dumps(task.qa_prompt)
-                message["signed_qa_prompt"] = self.prompt_signer.sign(prompt_text)
-            elif task.qa_prompt:
-                prompt_text = task.qa_prompt if isinstance(task.qa_prompt, str) else json.dumps(task.qa_prompt)
-                message["qa_prompt"] = prompt_text
+            if task.qa_prompt:
+                prompt_text = (
+                    task.qa_prompt if isinstance(task.qa_prompt, str) else orjson.dumps(task.qa_prompt).decode()
+                )
+                if self.prompt_signer:
+                    message["signed_qa_prompt"] = self.prompt_signer.sign(prompt_text)
+                else:
+                    message["qa_prompt"] = prompt_text
             await stream_manager.publish("tasks:qa", message)
 
         if self.worker_registry and task.worker_id:
@@ -286,7 +297,7 @@ class TaskStateMachine:
                 "project_id": str(task.project_id),
                 "title": task.title,
                 "retry_count": str(task.retry_count),
-                "qa_feedback_history": json.dumps(task.qa_feedback_history or []),
+                "qa_feedback_history": orjson.dumps(task.qa_feedback_history or []).decode(),
                 "error_message": task.error_message or "",
             })
 
@@ -321,38 +332,25 @@ class TaskStateMachine:
     async def _promote_dependents(self, task: Task, repo: TaskRepository, db_session: AsyncSession) -> list[Task]:
         """Promote WAITING tasks that depend on the completed task to READY.
 
-        Only promotes tasks whose phase is currently active.
+        Only promotes tasks whose phase is currently active; the repository
+        checks that and the remaining dependencies in one query.
         """
-        waiting_tasks = await repo.find_waiting_dependents(task.id)
-
-        promoted: list[Task] = []
-        for candidate in waiting_tasks:
-            if not await self._is_phase_active(candidate.phase_id, db_session):
-                continue
-            if await repo.check_dependencies_met(candidate.id):
-                old_status = candidate.status
-                candidate.status = TaskStatus.ready
-                candidate.version += 1
-
-                history = TaskHistory(
-                    task_id=candidate.id,
-                    from_status=old_status.value,
-                    to_status=TaskStatus.ready.value,
-                    actor="system",
-                    reason=f"All dependencies met (triggered by task {task.id})",
-                )
-                db_session.add(history)
-                promoted.append(candidate)
+        promoted = await repo.find_promotable_dependents(task.id)
+        for candidate in promoted:
+            old_status = candidate.status
+            candidate.status = TaskStatus.ready
+            candidate.version += 1
 
-        return promoted
+            history = TaskHistory(
+                task_id=candidate.id,
+                from_status=old_status.value,
+                to_status=TaskStatus.ready.value,
+                actor="system",
+                reason=f"All dependencies met (triggered by task {task.id})",
+            )
+            db_session.add(history)
 
-    async def _is_phase_active(self, phase_id: uuid.UUID, db_session: AsyncSession) -> bool:
-        """Check if the given phase is in active status."""
-        result = await db_session.execute(
-            select(Phase.status).where(Phase.id == phase_id)
-        )
-        status = result.scalar_one_or_none()
-        return status == PhaseStatus.active
+        return promoted
 
     async def promote_dependents(self, task: Task, db_session: AsyncSession) -> list[Task]:
         """Promote WAITING tasks that depend on the completed task to READY (public API)."""
@@ -20,9 +20,12 @@ from backend.src.api import (
     workers,
 )
 from backend.src.config import settings as app_settings
+from backend.src.core.llm_cache import StructuredOutputCache
+from backend.src.core.llm_client import close_llm_clients, configure_structured_output_cache
 from backend.src.core.rate_limiter import RateLimitMiddleware
 from backend.src.core.security_headers import SecurityHeadersMiddleware
 from backend.src.queue.background import start_background_consumer
+from backend.src.queue.board_events import BoardEventHub
 from backend.src.queue.streams import RedisStreamManager
 from backend.src.storage.database import init_db, engine
 from backend.src.storage.redis_client import get_redis, close_redis
@@ -83,12 +86,19 @@ async def lifespan(app: FastAPI):
     await stream_manager.initialize_streams()
     app.state.redis = redis
     app.state.stream_manager = stream_manager
+    app.state.board_events = BoardEventHub(redis)
+    if app_settings.llm_cache_ttl > 0:
+        configure_structured_output_cache(
+            StructuredOutputCache(redis, app_settings.llm_cache_ttl, app_settings.llm_cache_local_size)
+        )
     await start_background_consumer(app)
 
     yield
 
     # Shutdown
+    await app.state.board_events.close()
     await close_redis()
+    await close_llm_clients()
 
 
 app = FastAPI(
@@ -9,16 +9,51 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    PrimaryKeyConstraint,
     String,
     Table,
     Text,
     Uuid,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.functions import FunctionElement
 
 from backend.src.storage.database import Base
+from backend.src.utils.ids import uuid7
+
+# Binary JSON on PostgreSQL (parsed once on write, GIN-indexable); plain JSON
+# elsewhere so the SQLite test database can still create the tables.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+# Block-range index for time columns of append-only tables, where insertion
+# order matches time order (ignored outside PostgreSQL).
+BRIN_INDEX_OPTIONS = {"postgresql_using": "brin", "postgresql_with": {"pages_per_range": 32}}
+
+
+class clock_timestamp(FunctionElement):
+    """Wall-clock time at row insert, unlike now() which is fixed per transaction.
+
+    Used for append-only event tables so rows written in one transaction still
+    get distinct, ordered timestamps. SQLite has no equivalent and falls back
+    to CURRENT_TIMESTAMP.
+    """
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(clock_timestamp)
+def _compile_clock_timestamp(element, compiler, **kw):
+    return "clock_timestamp()"
+
+
+@compiles(clock_timestamp, "sqlite")
+def _compile_clock_timestamp_sqlite(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
 
 
 # ── Enums ──────────────────────────────────────────────────────────────
@@ -54,6 +89,12 @@ class TaskPriority(str, enum.Enum):
     critical = "critical"
 
 
+# Value -> member lookups for converting request enums and query strings to
+# the ORM's enums without a call through Enum.__new__ (see schemas.py).
+TASK_STATUS_BY_VALUE: dict[str, TaskStatus] = {status.value: status for status in TaskStatus}
+TASK_PRIORITY_BY_VALUE: dict[str, TaskPriority] = {priority.value: priority for priority in TaskPriority}
+
+
 class WorkerStatus(str, enum.Enum):
     idle = "idle"
     busy = "busy"
@@ -83,6 +124,8 @@ task_dependencies = Table(
     Base.metadata,
     Column("task_id", Uuid, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
     Column("dependency_id", Uuid, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key serves task_id lookups; reverse (dependents) lookups need their own index
+    Index("ix_task_dependencies_dependency_id", "dependency_id"),
 )
 
 
@@ -93,12 +136,12 @@ class Project(Base):
     __tablename__ = "projects"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     design_doc_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
     repo_path: Mapped[str] = mapped_column(String(500), nullable=False)
     status: Mapped[ProjectStatus] = mapped_column(Enum(ProjectStatus), nullable=False, default=ProjectStatus.design)
-    llm_config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    llm_config: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -115,9 +158,9 @@ class Phase(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     project_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    branch_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    branch_name: Mapped[str] = mapped_column(Text, nullable=False)
     order: Mapped[int] = mapped_column(Integer, nullable=False)
     status: Mapped[PhaseStatus] = mapped_column(Enum(PhaseStatus), nullable=False, default=PhaseStatus.pending)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -131,9 +174,25 @@ class Phase(Base):
 class Task(Base):
     __tablename__ = "tasks"
     __table_args__ = (
-        Index("ix_tasks_project_status", "project_id", "status"),
+        Index("ix_tasks_project_status_priority", "project_id", "status", "priority"),
         Index("ix_tasks_phase_status", "phase_id", "status"),
         Index("ix_tasks_worker_id", "worker_id"),
+        # Partial covering indexes for the scheduler hot path (non-terminal tasks only)
+        Index(
+            "ix_tasks_project_open",
+            "project_id",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('ready', 'queued', 'in_progress', 'review', 'redesign')"),
+            postgresql_include=["id", "priority", "worker_id"],
+        ),
+        Index(
+            "ix_tasks_phase_open",
+            "phase_id",
+            "status",
+            postgresql_where=text("status <> 'done'"),
+            postgresql_include=["id"],
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
@@ -143,9 +202,9 @@ class Task(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus), nullable=False, default=TaskStatus.waiting)
     priority: Mapped[TaskPriority] = mapped_column(Enum(TaskPriority), nullable=False, default=TaskPriority.medium)
-    worker_prompt: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    qa_prompt: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    branch_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    worker_prompt: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
+    qa_prompt: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
+    branch_name: Mapped[str | None] = mapped_column(Text, nullable=True)
     commit_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     worker_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("workers.id", ondelete="SET NULL"), nullable=True
@@ -153,12 +212,12 @@ class Task(Base):
     reviewer_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("workers.id", ondelete="SET NULL"), nullable=True
     )
-    qa_result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    qa_result: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
     output_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     retry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     max_retries: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
-    qa_feedback_history: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    qa_feedback_history: Mapped[list | None] = mapped_column(JSONDocument, nullable=True)
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -184,16 +243,24 @@ class Task(Base):
 
 class TaskHistory(Base):
     __tablename__ = "task_history"
-    __table_args__ = (Index("ix_task_history_task_timestamp", "task_id", "timestamp"),)
+    # Partitioned by RANGE (timestamp) on PostgreSQL, which requires the
+    # partition key in the primary key; the ORM still identifies rows by id.
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "timestamp", name="task_history_pkey"),
+        Index("ix_task_history_task_id", "task_id"),
+        Index("ix_task_history_timestamp_brin", "timestamp", **BRIN_INDEX_OPTIONS),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+    __mapper_args__ = {"primary_key": ["id"]}
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, default=uuid7)
     task_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     from_status: Mapped[str] = mapped_column(String(50), nullable=False)
     to_status: Mapped[str] = mapped_column(String(50), nullable=False)
     actor: Mapped[str] = mapped_column(String(100), nullable=False)
     reason: Mapped[str | None] = mapped_column(Text, nullable=True)
-    extra_metadata: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    extra_metadata: Mapped[dict | None] = mapped_column("metadata", JSONDocument, nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=clock_timestamp())
 
     # Relationships
     task: Mapped["Task"] = relationship("Task", back_populates="history")
@@ -203,9 +270,9 @@ class Worker(Base):
     __tablename__ = "workers"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
     platform: Mapped[str] = mapped_column(String(50), nullable=False)
-    capabilities: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    capabilities: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
     status: Mapped[WorkerStatus] = mapped_column(Enum(WorkerStatus), nullable=False, default=WorkerStatus.idle)
     current_task_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, nullable=True)
     executor_type: Mapped[str] = mapped_column(String(50), nullable=False, default="claude-code")
@@ -235,26 +302,35 @@ class DesignSession(Base):
     worker_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("workers.id", ondelete="SET NULL"), nullable=True
     )
-    name: Mapped[str | None] = mapped_column(String(255), nullable=True, default=None)
+    name: Mapped[str | None] = mapped_column(Text, nullable=True, default=None)
     status: Mapped[DesignSessionStatus] = mapped_column(
         Enum(DesignSessionStatus), nullable=False, default=DesignSessionStatus.active
     )
-    llm_config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    llm_config: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     project: Mapped["Project | None"] = relationship("Project", back_populates="design_sessions")
+    # Ordered in SQL; ids are UUIDv7, strictly increasing per process, so they
+    # break created_at ties between messages written by the same process.
     messages: Mapped[list["DesignMessage"]] = relationship(
-        "DesignMessage", back_populates="session", cascade="all, delete-orphan"
+        "DesignMessage",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        order_by="(DesignMessage.created_at, DesignMessage.id)",
     )
 
 
 class DesignMessage(Base):
     __tablename__ = "design_messages"
-    __table_args__ = (Index("ix_design_messages_session_created", "session_id", "created_at"),)
+    __table_args__ = (
+        # Serves the chat-only, (created_at, id)-ordered messages eager load.
+        Index("ix_design_messages_session_type_created", "session_id", "message_type", "created_at", "id"),
+        Index("ix_design_messages_created_brin", "created_at", **BRIN_INDEX_OPTIONS),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     session_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("design_sessions.id", ondelete="CASCADE"), nullable=False
     )
@@ -263,7 +339,7 @@ class DesignMessage(Base):
     message_type: Mapped[MessageType] = mapped_column(
         Enum(MessageType), nullable=False, default=MessageType.chat, server_default="chat"
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=clock_timestamp())
 
     # Relationships
     session: Mapped["DesignSession"] = relationship("DesignSession", back_populates="messages")
@@ -272,7 +348,7 @@ class DesignMessage(Base):
 class Setting(Base):
     __tablename__ = "settings"
 
-    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
     value: Mapped[str] = mapped_column(Text, default="")
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -285,8 +361,8 @@ class RegistrationToken(Base):
     __tablename__ = "registration_tokens"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
-    token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    token: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     revoked: Mapped[bool] = mapped_column(default=False)
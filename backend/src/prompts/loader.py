@@ -7,6 +7,7 @@ import yaml
 
 _PROMPTS_DIR = Path(__file__).parent
 _cache: dict[str, dict[str, Any]] = {}
+_prompt_cache: dict[tuple[str, str], str] = {}
 
 
 def load_prompts(name: str) -> dict[str, Any]:
@@ -33,9 +34,16 @@ def get_prompt(name: str, key: str) -> str:
         key: The key within the YAML file (e.g., "system", "finalize").
 
     Returns:
-        The prompt string with leading/trailing whitespace stripped.
+        The prompt string with leading/trailing whitespace stripped. The
+        stripped string is cached, so repeated calls return the same object.
     """
+    cached = _prompt_cache.get((name, key))
+    if cached is not None:
+        return cached
+
     prompts = load_prompts(name)
     if key not in prompts:
         raise KeyError(f"Prompt key '{key}' not found in '{name}.yaml'")
-    return str(prompts[key]).strip()
+    prompt = str(prompts[key]).strip()
+    _prompt_cache[(name, key)] = prompt
+    return prompt
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import orjson
+import redis.asyncio as redis
+
+from backend.src.queue.streams import RedisStreamManager
+
+logger = logging.getLogger(__name__)
+
+# Delay before a reader retries after a Redis error
+READER_RETRY_DELAY = 1.0
+# Events buffered per subscriber; a client that falls this far behind is dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class BoardEventHub:
+    """Fan out board events from Redis to in-process subscribers.
+
+    One reader task per project blocks on that project's board stream with
+    ``XREAD BLOCK 0`` and pushes each event, serialized once, onto every
+    subscriber's queue. Readers start with the first subscriber of a project
+    and stop when its last subscriber leaves, so Redis work scales with the
+    number of watched projects rather than the number of open connections.
+
+    Subscriber queues hold at most SUBSCRIBER_QUEUE_SIZE events. A subscriber
+    whose queue fills up (a client that stopped reading) is dropped from the
+    fan-out: its backlog is discarded and it receives ``None``, which ends
+    its stream.
+    """
+
+    def __init__(self, redis_client: redis.Redis) -> None:
+        self.redis = redis_client
+        self._streams = RedisStreamManager(redis_client)
+        self._subscribers: dict[str, set[asyncio.Queue[str | None]]] = {}
+        self._readers: dict[str, asyncio.Task[None]] = {}
+
+    @asynccontextmanager
+    async def subscribe(self, project_id: str) -> AsyncIterator[asyncio.Queue[str | None]]:
+        """Yield a queue receiving the JSON payload of every event for ``project_id``.
+
+        ``None`` on the queue means the subscriber fell behind and was dropped.
+        """
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        subscribers = self._subscribers.setdefault(project_id, set())
+        subscribers.add(queue)
+        if project_id not in self._readers:
+            self._readers[project_id] = asyncio.create_task(self._read(project_id))
+        try:
+            yield queue
+        finally:
+            subscribers.discard(queue)
+            # A dropped subscriber may leave after the project was already torn down
+            if not subscribers and self._subscribers.get(project_id) is subscribers:
+                del self._subscribers[project_id]
+                reader = self._readers.pop(project_id, None)
+                if reader is not None:
+                    reader.cancel()
+
+    async def _read(self, project_id: str) -> None:
+        stream = RedisStreamManager.board_stream(project_id)
+        # Resolved to a concrete id before the first XREAD, so a retry after a
+        # Redis error resumes where the reader was instead of re-reading "$"
+        last_id: str | None = None
+        while True:
+            try:
+                if last_id is None:
+                    last_id = (await self._streams.last_entry_ids([stream]))[stream]
+                messages = await self.redis.xread(streams={stream: last_id}, block=0)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Board event reader for project %s failed, retrying", project_id, exc_info=True)
+                await asyncio.sleep(READER_RETRY_DELAY)
+                continue
+            for _stream_name, entries in messages or []:
+                for msg_id, data in entries:
+                    last_id = msg_id
+                    payload = orjson.dumps(data).decode()
+                    for queue in list(self._subscribers.get(project_id, ())):
+                        try:
+                            queue.put_nowait(payload)
+                        except asyncio.QueueFull:
+                            self._drop(project_id, queue)
+
+    def _drop(self, project_id: str, queue: asyncio.Queue[str | None]) -> None:
+        """Stop fanning out to a subscriber that stopped reading and end its stream."""
+        logger.warning("Dropping a board event subscriber of project %s that fell behind", project_id)
+        self._subscribers.get(project_id, set()).discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def close(self) -> None:
+        """Cancel every reader task."""
+        readers = list(self._readers.values())
+        self._readers.clear()
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
@@ -2,6 +2,10 @@ import json
 
 import redis.asyncio as redis
 
+BOARD_STREAM_MAXLEN = 5000
+# tasks:events entries are only wake-ups for the scheduler, so a short tail is enough
+TASKS_EVENTS_MAXLEN = 1000
+
 
 class RedisStreamManager:
     """Redis Streams abstraction layer."""
@@ -11,6 +15,7 @@ class RedisStreamManager:
     TASKS_RESULTS = "tasks:results"
     TASKS_QA = "tasks:qa"
     TASKS_ESCALATION = "tasks:escalation"
+    TASKS_EVENTS = "tasks:events"
     EVENTS_BOARD = "events:board"
 
     # Consumer group name constants
@@ -38,15 +43,16 @@ class RedisStreamManager:
                 if "BUSYGROUP" not in str(e):
                     raise  # Ignore if consumer group already exists
 
-    async def publish(self, stream: str, data: dict) -> str:
-        """Publish a message to a stream."""
-        flat_data: dict[str, str] = {
-            str(k): json.dumps(v) if isinstance(v, (dict, list)) else str(v)
-            for k, v in data.items()
-        }
-        message_id = await self.redis.xadd(stream, flat_data)  # type: ignore[arg-type]
+    async def publish(self, stream: str, data: dict, maxlen: int | None = None) -> str:
+        """Publish a message to a stream, optionally capping it at ~maxlen entries."""
+        message_id = await self.redis.xadd(stream, self._flatten(data), maxlen=maxlen, approximate=True)  # type: ignore[arg-type]
         return message_id
 
+    @staticmethod
+    def _flatten(data: dict) -> dict[str, str]:
+        """Encode a message as the flat string mapping XADD expects."""
+        return {str(k): json.dumps(v) if isinstance(v, (dict, list)) else str(v) for k, v in data.items()}
+
     async def consume(
         self,
         stream: str,
@@ -83,12 +89,72 @@ class RedisStreamManager:
         """Acknowledge message processing completion."""
         await self.redis.xack(stream, group, message_id)
 
+    @classmethod
+    def board_stream(cls, project_id: str) -> str:
+        """Name of the board event stream for one project."""
+        return f"{cls.EVENTS_BOARD}:{project_id}"
+
     async def publish_board_event(self, event: str, data: dict) -> None:
-        """Publish a kanban board event."""
-        await self.publish(self.EVENTS_BOARD, {"event": event, **data})
+        """Publish a kanban board event to its project's board stream."""
+        await self.publish(
+            self.board_stream(str(data["project_id"])),
+            {"event": event, **data},
+            maxlen=BOARD_STREAM_MAXLEN,
+        )
+
+    async def publish_board_events(self, events: list[tuple[str, dict]]) -> None:
+        """Publish several board events with one pipelined round trip.
+
+        ``events`` holds ``(event, data)`` pairs as buffered by
+        ``TaskStateMachine.transition``; callers flush them after their DB
+        commit so subscribers never see a transition that was rolled back.
+        """
+        if not events:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for event, data in events:
+            pipe.xadd(
+                self.board_stream(str(data["project_id"])),
+                self._flatten({"event": event, **data}),  # type: ignore[arg-type]
+                maxlen=BOARD_STREAM_MAXLEN,
+                approximate=True,
+            )
+        await pipe.execute()
+
+    async def notify_scheduler(self, event: str) -> None:
+        """Wake the scheduling loops: something they act on (a task or a worker) changed."""
+        await self.redis.xadd(  # type: ignore[arg-type]
+            self.TASKS_EVENTS, {"event": event}, maxlen=TASKS_EVENTS_MAXLEN, approximate=True
+        )
+
+    async def last_entry_ids(self, streams: list[str]) -> dict[str, str]:
+        """Return the newest entry ID of each stream ("0-0" if empty) in one round trip.
+
+        Reading from these IDs instead of ``$`` means entries added between
+        this call and the next XREAD are not missed.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        for stream in streams:
+            pipe.xrevrange(stream, count=1)
+        results = await pipe.execute()
+        return {stream: entries[0][0] if entries else "0-0" for stream, entries in zip(streams, results)}
+
+    async def wait_for_entries(self, last_ids: dict[str, str], block: int) -> int:
+        """Block until a stream has entries past its ID in ``last_ids``, or ``block`` ms pass.
+
+        ``last_ids`` is advanced past every entry read. Returns how many
+        entries arrived, so a burst of events becomes a single wake-up.
+        """
+        messages = await self.redis.xread(streams=last_ids, count=100, block=block)  # type: ignore[arg-type]
+        received = 0
+        for stream_name, entries in messages or []:
+            if entries:
+                last_ids[stream_name] = entries[-1][0]
+                received += len(entries)
+        return received
 
     async def trim_streams(self, maxlen: int = 1000) -> None:
         """Trim old messages from streams."""
+        # Per-project board streams are capped on every publish instead.
         for stream in [self.TASKS_QUEUE, self.TASKS_RESULTS, self.TASKS_QA, self.TASKS_ESCALATION]:
             await self.redis.xtrim(stream, maxlen=maxlen, approximate=True)
-        await self.redis.xtrim(self.EVENTS_BOARD, maxlen=5000, approximate=True)
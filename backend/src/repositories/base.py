@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+@functools.cache
+def _null_on_insert(model: type) -> frozenset[str]:
+    """Nullable columns without a default: NULL after an INSERT that did not set them."""
+    return frozenset(
+        attr.key
+        for attr in sa_inspect(model).column_attrs
+        if all(col.nullable and col.default is None and col.server_default is None for col in attr.columns)
+    )
 
 
 class BaseRepository:
@@ -17,6 +30,17 @@ class BaseRepository:
         await self.db.flush()
         return entity
 
+    def mark_unset_columns_null(self, entity: Any) -> None:
+        """Record the columns a just-flushed INSERT left NULL as loaded ``None``.
+
+        Those columns stay unloaded after the flush, and reading one on an
+        AsyncSession would lazy-load. Marking them committed avoids a reload;
+        assigning None instead would store a JSON null in the JSON columns.
+        """
+        state = sa_inspect(entity)
+        for key in _null_on_insert(type(entity)) & state.unloaded:
+            set_committed_value(entity, key, None)
+
     async def commit(self) -> None:
         """Commit the current transaction."""
         await self.db.commit()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Load, selectinload
 
 from backend.src.models import DesignMessage, DesignSession, DesignSessionStatus, MessageRole, MessageType
 from backend.src.repositories.base import BaseRepository
@@ -12,11 +12,27 @@ from backend.src.repositories.base import BaseRepository
 class DesignSessionRepository(BaseRepository):
     """Data access layer for DesignSession and DesignMessage entities."""
 
-    async def get_by_id(self, session_id: uuid.UUID, *, load_messages: bool = True) -> DesignSession | None:
-        """Get a session by ID with optional message loading."""
+    @staticmethod
+    def _messages_loader(chat_only: bool) -> Load:
+        """Eager-load messages, optionally only chat ones (filtered in SQL)."""
+        if chat_only:
+            return selectinload(DesignSession.messages.and_(DesignMessage.message_type == MessageType.chat))
+        return selectinload(DesignSession.messages)
+
+    async def get_by_id(
+        self,
+        session_id: uuid.UUID,
+        *,
+        load_messages: bool = True,
+        chat_only: bool = False,
+    ) -> DesignSession | None:
+        """Get a session by ID with optional message loading.
+
+        With ``chat_only`` the internal finalize messages are never fetched.
+        """
         query = select(DesignSession).where(DesignSession.id == session_id)
         if load_messages:
-            query = query.options(selectinload(DesignSession.messages))
+            query = query.options(self._messages_loader(chat_only))
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
@@ -25,13 +41,14 @@ class DesignSessionRepository(BaseRepository):
         *,
         status: DesignSessionStatus | None = None,
         load_messages: bool = True,
+        chat_only: bool = False,
     ) -> list[DesignSession]:
         """List all design sessions, optionally filtered by status."""
         query = select(DesignSession).order_by(DesignSession.created_at.desc())
         if status is not None:
             query = query.where(DesignSession.status == status)
         if load_messages:
-            query = query.options(selectinload(DesignSession.messages))
+            query = query.options(self._messages_loader(chat_only))
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
@@ -21,6 +21,13 @@ class PhaseRepository(BaseRepository):
         result = await self.db.execute(select(Phase).where(Phase.project_id == project_id).order_by(Phase.order.asc()))
         return list(result.scalars().all())
 
+    async def list_rows_by_project(self, project_id: uuid.UUID) -> list[dict]:
+        """Read-only :meth:`list_by_project` returning plain column dicts via Core."""
+        result = await self.db.execute(
+            select(Phase.__table__).where(Phase.project_id == project_id).order_by(Phase.order.asc())
+        )
+        return [dict(row) for row in result.mappings()]
+
     async def get_next_order(self, project_id: uuid.UUID) -> int:
         """Calculate the next order value for a project."""
         result = await self.db.execute(
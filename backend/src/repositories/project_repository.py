@@ -3,9 +3,9 @@ from __future__ import annotations
 import uuid
 
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager
 
-from backend.src.models import Project
+from backend.src.models import Phase, Project
 from backend.src.repositories.base import BaseRepository
 
 
@@ -13,29 +13,45 @@ class ProjectRepository(BaseRepository):
     """Data access layer for Project entities."""
 
     async def get_by_id(self, project_id: uuid.UUID, *, load_phases: bool = True) -> Project | None:
-        """Get a project by ID with optional phase loading."""
+        """Get a project by ID with optional phase loading.
+
+        Phases are joined into the same SELECT and arrive ordered by phase
+        order.
+        """
         query = select(Project).where(Project.id == project_id)
         if load_phases:
-            query = query.options(selectinload(Project.phases))
+            query = (
+                query.outerjoin(Project.phases)
+                .options(contains_eager(Project.phases))
+                .order_by(Phase.order.asc())
+            )
         result = await self.db.execute(query)
-        return result.scalar_one_or_none()
-
-    async def list_all(
-        self,
-        *,
-        limit: int = 50,
-        offset: int = 0,
-    ) -> list[Project]:
-        """List projects with pagination."""
-        query = (
-            select(Project)
-            .options(selectinload(Project.phases))
-            .order_by(Project.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        return result.unique().scalar_one_or_none()
+
+    async def list_rows(self, *, limit: int = 50, offset: int = 0) -> list[dict]:
+        """List projects with pagination as plain column dicts, read via Core.
+
+        Each project dict carries its phase dicts, ordered by phase order,
+        under ``phases``; they are read with one IN query for the whole page.
+        """
+        result = await self.db.execute(
+            select(Project.__table__).order_by(Project.created_at.desc()).limit(limit).offset(offset)
         )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        projects = [dict(row) for row in result.mappings()]
+        if not projects:
+            return projects
+
+        phases_by_project: dict[uuid.UUID, list[dict]] = {project["id"]: [] for project in projects}
+        result = await self.db.execute(
+            select(Phase.__table__)
+            .where(Phase.project_id.in_(phases_by_project))
+            .order_by(Phase.order.asc())
+        )
+        for phase in result.mappings():
+            phases_by_project[phase["project_id"]].append(dict(phase))
+        for project in projects:
+            project["phases"] = phases_by_project[project["id"]]
+        return projects
 
     async def exists(self, project_id: uuid.UUID) -> bool:
         """Check if a project exists."""
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import uuid
-from typing import Optional
+from collections.abc import Mapping
+from typing import Any, Optional
 
-from sqlalchemy import delete, func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Select, Uuid, cast, delete, exists, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import aliased, selectinload
 
-from backend.src.models import Task, TaskPriority, TaskStatus, task_dependencies
+from backend.src.models import Phase, PhaseStatus, Task, TaskPriority, TaskStatus, task_dependencies
 from backend.src.repositories.base import BaseRepository
 
 # Priority ordering for scheduling (critical first)
@@ -31,12 +33,40 @@ class TaskRepository(BaseRepository):
         """Get a task by ID with optional relationship loading."""
         options = []
         if load_depends:
-            options.append(selectinload(Task.depends_on))
+            options.append(self._dependency_ids_loader())
         if load_history:
             options.append(selectinload(Task.history))
         result = await self.db.execute(select(Task).where(Task.id == task_id).options(*options))
         return result.scalar_one_or_none()
 
+    async def get_for_transition(self, task_id: uuid.UUID, expected_version: Optional[int] = None) -> Task | None:
+        """Load a task and lock its row until the transaction ends.
+
+        With ``expected_version`` only a row still at that version matches, so
+        the optimistic-lock check and the load are one statement and nothing
+        can change the version before commit. Returns None if the task is
+        missing or stale; use :meth:`get_version` to tell which.
+        """
+        query = select(Task).where(Task.id == task_id)
+        if expected_version is not None:
+            query = query.where(Task.version == expected_version)
+        result = await self.db.execute(query.with_for_update())
+        return result.scalar_one_or_none()
+
+    async def get_version(self, task_id: uuid.UUID) -> int | None:
+        """Get a task's current version, or None if it does not exist."""
+        return await self.db.scalar(select(Task.version).where(Task.id == task_id))
+
+    async def get_with_dependency_ids(
+        self, task_id: uuid.UUID, *, load_history: bool = False
+    ) -> tuple[Task, list[uuid.UUID]] | None:
+        """Get a task by ID together with its dependency IDs (see :meth:`_with_dependency_ids`)."""
+        query = select(Task).where(Task.id == task_id)
+        if load_history:
+            query = query.options(selectinload(Task.history))
+        rows = await self._with_dependency_ids(query)
+        return rows[0] if rows else None
+
     async def list_by_project(
         self,
         project_id: uuid.UUID,
@@ -46,57 +76,182 @@ class TaskRepository(BaseRepository):
         priority: Optional[TaskPriority] = None,
         limit: int = 50,
         offset: int = 0,
+        load_depends: bool = True,
     ) -> list[Task]:
-        """List tasks for a project with optional filters."""
-        query = select(Task).where(Task.project_id == project_id)
+        """List tasks for a project with optional filters.
+
+        With ``load_depends`` the whole page's dependencies come from one
+        extra IN query (see :meth:`_dependency_ids_loader`); pass False when
+        they are not needed at all.
+        """
+        query = self._project_query(project_id, status, phase_id, priority, limit, offset)
+        if load_depends:
+            query = query.options(self._dependency_ids_loader())
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def list_with_dependency_ids(
+        self,
+        project_id: uuid.UUID,
+        *,
+        status: Optional[TaskStatus] = None,
+        phase_id: Optional[uuid.UUID] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[tuple[Task, list[uuid.UUID]]]:
+        """Like :meth:`list_by_project`, pairing each task with its dependency IDs."""
+        return await self._with_dependency_ids(
+            self._project_query(project_id, status, phase_id, priority, limit, offset)
+        )
+
+    async def list_rows_by_project(
+        self,
+        project_id: uuid.UUID,
+        *,
+        status: Optional[TaskStatus] = None,
+        phase_id: Optional[uuid.UUID] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[Mapping[str, Any]]:
+        """Read-only :meth:`list_with_dependency_ids` returning plain column mappings.
+
+        The query runs through Core, so no Task objects are built, tracked in
+        the identity map or instrumented. Each row carries the task's
+        dependency IDs under ``depends_on``. On PostgreSQL the rows are the
+        result's own read-only mappings, with no per-row copy in Python.
+        """
+        query = self._project_query(project_id, status, phase_id, priority, limit, offset, select(Task.__table__))
+        if self.db.get_bind().dialect.name == "postgresql":
+            # array_agg over no edges is NULL; coalesce so rows need no fix-up
+            depends_on = func.coalesce(self._dependency_ids_subquery(), cast(literal("{}"), ARRAY(Uuid)))
+            result = await self.db.execute(query.add_columns(depends_on.label("depends_on")))
+            return list(result.mappings())
+
+        rows = [dict(row) for row in (await self.db.execute(query)).mappings()]
+        dep_map = await self.get_dependency_map([row["id"] for row in rows])
+        for row in rows:
+            row["depends_on"] = dep_map.get(row["id"], [])
+        return rows
+
+    @staticmethod
+    def _project_query(
+        project_id: uuid.UUID,
+        status: Optional[TaskStatus],
+        phase_id: Optional[uuid.UUID],
+        priority: Optional[TaskPriority],
+        limit: int,
+        offset: int,
+        query: Select | None = None,
+    ) -> Select:
+        """Filter, order and page ``query`` (``select(Task)`` by default) to one project's tasks."""
+        # relies on ix_tasks_project_status_priority
+        query = (select(Task) if query is None else query).where(Task.project_id == project_id)
         if status is not None:
             query = query.where(Task.status == status)
         if phase_id is not None:
             query = query.where(Task.phase_id == phase_id)
         if priority is not None:
             query = query.where(Task.priority == priority)
-        query = query.order_by(Task.created_at.desc()).limit(limit).offset(offset)
-        query = query.options(selectinload(Task.depends_on))
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return query.order_by(Task.created_at.desc()).limit(limit).offset(offset)
+
+    async def _with_dependency_ids(self, query: Select[tuple[Task]]) -> list[tuple[Task, list[uuid.UUID]]]:
+        """Run ``query`` and pair each task with its dependency IDs.
+
+        On PostgreSQL the IDs come back in the same round trip as an
+        ``array_agg`` subquery column, so dependencies are never hydrated as
+        Task objects. Other dialects fall back to :meth:`get_dependency_map`.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            result = await self.db.execute(query.add_columns(self._dependency_ids_subquery()))
+            return [(task, ids or []) for task, ids in result.all()]
+
+        tasks = list((await self.db.execute(query)).scalars().all())
+        dep_map = await self.get_dependency_map([task.id for task in tasks])
+        return [(task, dep_map.get(task.id, [])) for task in tasks]
+
+    @staticmethod
+    def _dependency_ids_loader():
+        """Eager-load ``depends_on`` with one IN query selecting only the dependencies' IDs.
+
+        Callers only read ``dep.id`` from the collection, so the dependency
+        rows are not hydrated with every column.
+        """
+        return selectinload(Task.depends_on).load_only(Task.id)
+
+    @staticmethod
+    def _dependency_ids_subquery():
+        """``array_agg`` of the dependency IDs of the outer query's task (PostgreSQL only)."""
+        edges = task_dependencies.c
+        return (
+            select(func.array_agg(edges.dependency_id))
+            .where(edges.task_id == Task.id)
+            .correlate(Task)
+            .scalar_subquery()
+        )
 
     async def add_dependencies(self, task_id: uuid.UUID, dependency_ids: list[uuid.UUID]) -> None:
         """Insert task dependency relationships."""
-        for dep_id in dependency_ids:
-            await self.db.execute(task_dependencies.insert().values(task_id=task_id, dependency_id=dep_id))
+        await self.add_dependency_pairs([(task_id, dep_id) for dep_id in dependency_ids])
 
-    async def validate_dependencies_exist(self, dependency_ids: list[uuid.UUID]) -> list[uuid.UUID]:
-        """Return list of dependency IDs that do NOT exist."""
-        if not dependency_ids:
-            return []
-        result = await self.db.execute(select(Task.id).where(Task.id.in_(dependency_ids)))
-        found = set(result.scalars().all())
-        return [d for d in dependency_ids if d not in found]
+    async def add_dependency_pairs(self, pairs: list[tuple[uuid.UUID, uuid.UUID]]) -> None:
+        """Insert ``(task_id, dependency_id)`` edges in a single executemany."""
+        if not pairs:
+            return
+        await self.db.execute(
+            task_dependencies.insert(),
+            [{"task_id": task_id, "dependency_id": dep_id} for task_id, dep_id in pairs],
+        )
 
-    async def detect_circular_dependency(self, task_id: uuid.UUID, depends_on: list[uuid.UUID]) -> bool:
-        """Detect circular dependencies using DFS."""
-        visited: set[uuid.UUID] = set()
-
-        async def dfs(current_id: uuid.UUID) -> bool:
-            if current_id == task_id:
-                return True
-            if current_id in visited:
-                return False
-            visited.add(current_id)
-            result = await self.db.execute(
-                select(task_dependencies.c.dependency_id).where(task_dependencies.c.task_id == current_id)
+    async def replace_dependencies(self, dependencies: dict[uuid.UUID, list[uuid.UUID]]) -> None:
+        """Rewire several tasks' dependencies with one DELETE and one executemany.
+
+        Every key is cleared as by :meth:`clear_dependencies` (edges in both
+        directions) before any new edge is inserted, so the result does not
+        depend on the order the tasks are listed in.
+        """
+        if not dependencies:
+            return
+        task_ids = list(dependencies)
+        await self.db.execute(
+            task_dependencies.delete().where(
+                or_(task_dependencies.c.task_id.in_(task_ids), task_dependencies.c.dependency_id.in_(task_ids))
             )
-            for dep_id in result.scalars().all():
-                if await dfs(dep_id):
-                    return True
-            return False
+        )
+        await self.add_dependency_pairs(
+            [(task_id, dep_id) for task_id, dep_ids in dependencies.items() for dep_id in dep_ids]
+        )
 
-        for dep_id in depends_on:
-            if dep_id == task_id:
-                return True
-            if await dfs(dep_id):
-                return True
-        return False
+    async def list_existing_ids(self, task_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+        """Return the IDs among ``task_ids`` that belong to an existing task."""
+        if not task_ids:
+            return set()
+        result = await self.db.execute(select(Task.id).where(Task.id.in_(task_ids)))
+        return set(result.scalars().all())
+
+    async def detect_circular_dependency(self, task_id: uuid.UUID, depends_on: list[uuid.UUID]) -> bool:
+        """Return True if ``task_id`` is among or reachable from ``depends_on``.
+
+        The dependency graph is walked by one recursive CTE; UNION drops
+        already-reached ids, so cycles elsewhere in the graph terminate and
+        no node is expanded twice. PostgreSQL evaluates the CTE only as far
+        as the outer EXISTS pulls rows, so the walk stops at the first hit
+        instead of materializing the whole reachable subgraph.
+        """
+        if task_id in depends_on:
+            return True
+        if not depends_on:
+            return False
+        edges = task_dependencies.c
+        reach = (
+            select(edges.dependency_id.label("id"))
+            .where(edges.task_id.in_(depends_on))
+            .cte("reach", recursive=True)
+        )
+        reach = reach.union(select(edges.dependency_id).join(reach, edges.task_id == reach.c.id))
+        result = await self.db.execute(select(exists().where(reach.c.id == task_id)))
+        return bool(result.scalar())
 
     async def get_dependency_ids(self, task_id: uuid.UUID) -> list[uuid.UUID]:
         """Get all dependency IDs for a task."""
@@ -105,6 +260,20 @@ class TaskRepository(BaseRepository):
         )
         return list(result.scalars().all())
 
+    async def get_dependency_map(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, list[uuid.UUID]]:
+        """Map each of ``task_ids`` to its dependency IDs with one query over the edge table."""
+        dep_map: dict[uuid.UUID, list[uuid.UUID]] = {}
+        if not task_ids:
+            return dep_map
+        result = await self.db.execute(
+            select(task_dependencies.c.task_id, task_dependencies.c.dependency_id).where(
+                task_dependencies.c.task_id.in_(task_ids)
+            )
+        )
+        for task_id, dep_id in result.all():
+            dep_map.setdefault(task_id, []).append(dep_id)
+        return dep_map
+
     async def get_incomplete_dependency_count(self, task_id: uuid.UUID) -> int:
         """Count dependencies that are not in DONE status."""
         dep_ids = await self.get_dependency_ids(task_id)
@@ -122,16 +291,6 @@ class TaskRepository(BaseRepository):
         """Check if all dependency tasks are in DONE status."""
         return await self.get_incomplete_dependency_count(task_id) == 0
 
-    async def find_waiting_dependents(self, task_id: uuid.UUID) -> list[Task]:
-        """Find WAITING tasks that depend on the given task."""
-        result = await self.db.execute(
-            select(Task).where(
-                Task.id.in_(select(task_dependencies.c.task_id).where(task_dependencies.c.dependency_id == task_id)),
-                Task.status == TaskStatus.waiting,
-            )
-        )
-        return list(result.scalars().all())
-
     async def count_by_status(self, project_id: uuid.UUID) -> dict[str, int]:
         """Count tasks grouped by status for a project."""
         result = await self.db.execute(
@@ -170,12 +329,57 @@ class TaskRepository(BaseRepository):
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    def _has_unfinished_dependency() -> Any:
+        """EXISTS clause, correlated to ``Task``, for a dependency that is not DONE."""
+        dependency = aliased(Task)
+        return (
+            select(task_dependencies.c.task_id)
+            .join(dependency, dependency.id == task_dependencies.c.dependency_id)
+            .where(task_dependencies.c.task_id == Task.id, dependency.status != TaskStatus.done)
+            .exists()
+        )
+
+    async def list_promotable_in_phase(self, phase_id: uuid.UUID) -> list[Task]:
+        """Get waiting tasks within a phase whose dependencies are all done.
+
+        Dependency satisfaction is checked in the same query (NOT EXISTS an
+        unfinished dependency) instead of one lookup per waiting task.
+        """
+        result = await self.db.execute(
+            select(Task).where(
+                Task.phase_id == phase_id,
+                Task.status == TaskStatus.waiting,
+                ~self._has_unfinished_dependency(),
+            )
+        )
+        return list(result.scalars().all())
+
+    async def find_promotable_dependents(self, task_id: uuid.UUID) -> list[Task]:
+        """Find WAITING dependents of ``task_id`` that can move to READY.
+
+        A dependent qualifies when its phase is active and none of its
+        dependencies is unfinished; both are checked in this one query.
+        """
+        # relies on ix_task_dependencies_dependency_id
+        result = await self.db.execute(
+            select(Task)
+            .join(Phase, Phase.id == Task.phase_id)
+            .where(
+                Task.id.in_(select(task_dependencies.c.task_id).where(task_dependencies.c.dependency_id == task_id)),
+                Task.status == TaskStatus.waiting,
+                Phase.status == PhaseStatus.active,
+                ~self._has_unfinished_dependency(),
+            )
+        )
+        return list(result.scalars().all())
+
     async def list_incomplete_in_phase(self, phase_id: uuid.UUID) -> list[Task]:
         """Get all incomplete (non-done) tasks within a phase."""
         result = await self.db.execute(
             select(Task)
             .where(Task.phase_id == phase_id, Task.status != TaskStatus.done)
-            .options(selectinload(Task.depends_on))
+            .options(self._dependency_ids_loader())
         )
         return list(result.scalars().all())
 
@@ -202,6 +406,7 @@ class TaskRepository(BaseRepository):
         await self.db.execute(
             task_dependencies.delete().where(task_dependencies.c.task_id == task_id)
         )
+        # relies on ix_task_dependencies_dependency_id
         await self.db.execute(
             task_dependencies.delete().where(task_dependencies.c.dependency_id == task_id)
         )
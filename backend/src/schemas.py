@@ -39,6 +39,12 @@ class TaskPriority(str, enum.Enum):
     critical = "critical"
 
 
+# Value -> member lookups for converting the ORM's enums in hot response
+# builders without a call through Enum.__new__ per field.
+TASK_STATUS_BY_VALUE: dict[str, TaskStatus] = {status.value: status for status in TaskStatus}
+TASK_PRIORITY_BY_VALUE: dict[str, TaskPriority] = {priority.value: priority for priority in TaskPriority}
+
+
 class ProjectStatus(str, enum.Enum):
     design = "design"
     active = "active"
@@ -289,6 +295,7 @@ class LLMConfigInput(BaseModel):
     api_key: str
     model: Optional[str] = None
     base_url: Optional[str] = None
+    parsing_model: Optional[str] = None
 
 
 class CreateSessionRequest(BaseModel):
@@ -383,12 +390,14 @@ class GlobalSettingsResponse(BaseModel):
     llm_api_key: Optional[str] = None
     llm_model: Optional[str] = None
     llm_base_url: Optional[str] = None
+    llm_parsing_model: Optional[str] = None
 
 
 class GlobalSettingsUpdate(BaseModel):
     llm_api_key: Optional[str] = None
     llm_model: Optional[str] = None
     llm_base_url: Optional[str] = None
+    llm_parsing_model: Optional[str] = None
 
 
 # ── Batch Delete Schemas ────────────────────────────────────────────
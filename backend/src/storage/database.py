@@ -1,10 +1,50 @@
 from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Any
 
 from backend.src.config import settings
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+
+@lru_cache
+def get_engine(url: str) -> AsyncEngine:
+    """Return the process-wide engine for ``url``, creating it on first use.
+
+    Every caller asking for the same URL shares one engine and its pool, so
+    startup code paths never build a second pool to the same database.
+    """
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        query_cache_size=settings.db_query_cache_size,
+        **_engine_options(url),
+    )
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool and driver options for server databases (none for SQLite)."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return {}
+    options: dict[str, Any] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if parsed.get_driver_name() == "asyncpg":
+        # Repeated queries reuse their server-side prepared statement instead
+        # of being parsed and planned again on every execution.
+        options["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+    return options
+
+
+engine = get_engine(settings.database_url)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
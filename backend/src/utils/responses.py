@@ -0,0 +1,17 @@
+"""Response helpers shared by the API layer."""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def validated_json(adapter: TypeAdapter[Any], data: Any) -> Response:
+    """Validate ``data`` with ``adapter`` and return it encoded as a JSON response.
+
+    Read-only list endpoints hand plain row dicts to a module-level adapter
+    built for their ``response_model``. Validation and JSON encoding each run
+    once in pydantic-core, and FastAPI does not validate the returned value a
+    second time because it is already a Response.
+    """
+    return Response(content=adapter.dump_json(adapter.validate_python(data)), media_type="application/json")
@@ -0,0 +1,22 @@
+"""Text helpers shared by the API layer."""
+
+import functools
+import re
+import unicodedata
+
+_NON_SLUG_RE = re.compile(r"[^\w\s-]")
+_SEPARATORS_RE = re.compile(r"[-\s]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def slugify(value: str) -> str:
+    """Convert a string to a URL-friendly slug.
+
+    Non-ASCII characters are folded to their ASCII base where one exists
+    ("café" -> "cafe") and dropped otherwise. Results are cached because the
+    same phase names are slugified again on every finalize and rename.
+    """
+    if not value.isascii():
+        value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    value = _NON_SLUG_RE.sub("", value.lower())
+    return _SEPARATORS_RE.sub("-", value).strip("-")
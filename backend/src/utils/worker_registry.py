@@ -3,9 +3,33 @@ from __future__ import annotations
 import asyncio
 import json
 import secrets
+import time
 
 import redis.asyncio as redis
 
+from backend.src.queue.streams import TASKS_EVENTS_MAXLEN, RedisStreamManager
+
+# KEYS: worker hash, then the status sets; ARGV: ttl, expiry score, worker id,
+# then the status each set indexes. Runs atomically, so the status read here
+# always matches the index it writes.
+_HEARTBEAT_SCRIPT = """
+if redis.call('EXPIRE', KEYS[1], ARGV[1]) == 0 then
+    for i = 2, #KEYS do
+        redis.call('ZREM', KEYS[i], ARGV[3])
+    end
+    return 0
+end
+local status = redis.call('HGET', KEYS[1], 'status')
+for i = 2, #KEYS do
+    if ARGV[i + 2] == status then
+        redis.call('ZADD', KEYS[i], ARGV[2], ARGV[3])
+    else
+        redis.call('ZREM', KEYS[i], ARGV[3])
+    end
+end
+return 1
+"""
+
 
 class WorkerRegistry:
     """Redis Hash + TTL based Worker Registry.
@@ -13,12 +37,17 @@ class WorkerRegistry:
     Each worker is stored as a Redis Hash at key ``worker:{id}``.
     An authentication token is stored at ``worker:token:{token}`` pointing to the worker id.
     The worker hash expires after ``ttl`` seconds; heartbeat renews the TTL.
+
+    Two sorted sets, ``workers:idle`` and ``workers:busy``, index workers by
+    status with their expiry time as score, so fleet-wide counts are a
+    ``ZCOUNT`` over unexpired members instead of a scan of every hash.
     """
 
     PREFIX = "worker:"
     TOKEN_PREFIX = "worker:token:"
     DB_HB_PREFIX = "worker:db_heartbeat:"
     TOKEN_TTL = 86400  # 24 hours
+    STATUS_INDEX = {"idle": "workers:idle", "busy": "workers:busy"}
 
     def __init__(self, redis_client: redis.Redis, ttl: int = 90) -> None:
         self.redis = redis_client
@@ -32,6 +61,39 @@ class WorkerRegistry:
     def _token_key(self, token: str) -> str:
         return f"{self.TOKEN_PREFIX}{token}"
 
+    def _index_status(self, pipe: redis.client.Pipeline, worker_id: str, status: str) -> None:
+        """Queue moving ``worker_id`` into the ``status`` index, scored by its expiry."""
+        expires_at = time.time() + self.ttl
+        pipe.zadd(self.STATUS_INDEX[status], {worker_id: expires_at})
+        for other, index_key in self.STATUS_INDEX.items():
+            if other != status:
+                pipe.zrem(index_key, worker_id)
+
+    @staticmethod
+    def _announce_idle(pipe: redis.client.Pipeline) -> None:
+        """Queue a ``tasks:events`` entry so blocked scheduling loops look for work."""
+        pipe.xadd(
+            RedisStreamManager.TASKS_EVENTS, {"event": "worker_idle"}, maxlen=TASKS_EVENTS_MAXLEN, approximate=True
+        )
+
+    async def _write_status(
+        self, worker_id: str, status: str, fields: dict[str, str] | None = None, *, announce: bool = False
+    ) -> None:
+        """Write ``fields``, renew the TTL and re-index ``worker_id`` in one MULTI/EXEC.
+
+        With ``announce`` the same transaction also wakes the schedulers.
+        """
+        key = self._worker_key(worker_id)
+        pipe = self.redis.pipeline(transaction=True)
+        if fields:
+            pipe.hset(key, mapping=fields)
+        pipe.expire(key, self.ttl)
+        if status in self.STATUS_INDEX:
+            self._index_status(pipe, worker_id, status)
+        if announce:
+            self._announce_idle(pipe)
+        await pipe.execute()
+
     # -- public API ------------------------------------------------------------
 
     async def register(
@@ -57,11 +119,15 @@ class WorkerRegistry:
             "token": token,
         }
 
-        await self.redis.hset(key, mapping=mapping)  # type: ignore[misc]
-        await self.redis.expire(key, self.ttl)  # type: ignore[misc]
-
-        # Store token -> worker_id mapping
-        await self.redis.set(self._token_key(token), worker_id, ex=self.TOKEN_TTL)  # type: ignore[misc]
+        # Hash, token -> worker_id mapping and status index land together in
+        # one round trip, so no worker is visible without its token
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, self.ttl)
+        pipe.set(self._token_key(token), worker_id, ex=self.TOKEN_TTL)
+        self._index_status(pipe, worker_id, "idle")
+        self._announce_idle(pipe)
+        await pipe.execute()
 
         return {
             "worker_id": worker_id,
@@ -74,13 +140,18 @@ class WorkerRegistry:
         }
 
     async def heartbeat(self, worker_id: str) -> bool:
-        """Renew the TTL for a worker. Returns True if the worker exists."""
-        key = self._worker_key(worker_id)
-        exists = await self.redis.exists(key)  # type: ignore[misc]
-        if not exists:
-            return False
-        await self.redis.expire(key, self.ttl)  # type: ignore[misc]
-        return True
+        """Renew the TTL for a worker. Returns True if the worker exists.
+
+        One Lua script renews the hash and re-indexes the worker under the
+        ``status`` stored in it, so a worker missing from the status sets
+        (e.g. registered before they existed) is backfilled, and a
+        concurrent ``set_busy`` / ``set_idle`` is never undone by a stale
+        status read. A missing hash drops the worker from every set.
+        """
+        keys = [self._worker_key(worker_id), *self.STATUS_INDEX.values()]
+        args = [self.ttl, time.time() + self.ttl, worker_id, *self.STATUS_INDEX]
+        renewed = await self.redis.eval(_HEARTBEAT_SCRIPT, len(keys), *keys, *args)  # type: ignore[misc]
+        return bool(renewed)
 
     async def get_worker(self, worker_id: str) -> dict | None:
         """Return worker info dict, or None if the key has expired / doesn't exist."""
@@ -130,21 +201,51 @@ class WorkerRegistry:
         results = await asyncio.gather(*(self.get_worker(wid) for wid in worker_ids))
         return [w for w in results if w is not None]
 
+    async def count_statuses(self, worker_ids: list[str]) -> dict[str, int]:
+        """Count idle / busy / offline workers among ``worker_ids``.
+
+        Only the ``status`` field of each hash is read, and all reads go out
+        in one pipelined round trip. Workers whose hash has expired count as
+        offline.
+        """
+        counts = {"idle": 0, "busy": 0, "offline": 0}
+        if not worker_ids:
+            return counts
+        pipe = self.redis.pipeline(transaction=False)
+        for worker_id in worker_ids:
+            pipe.hget(self._worker_key(worker_id), "status")
+        for status in await pipe.execute():
+            if status is None:
+                counts["offline"] += 1
+            elif status in ("idle", "busy"):
+                counts[status] += 1
+        return counts
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Count all live idle and busy workers from the status indexes.
+
+        Expired entries are pruned and the unexpired ones counted in one
+        pipelined round trip, so the cost does not grow with the fleet.
+        """
+        now = time.time()
+        pipe = self.redis.pipeline(transaction=False)
+        for index_key in self.STATUS_INDEX.values():
+            pipe.zremrangebyscore(index_key, "-inf", now)
+            pipe.zcount(index_key, now, "+inf")
+        results = await pipe.execute()
+        return {status: results[2 * i + 1] for i, status in enumerate(self.STATUS_INDEX)}
+
     async def set_busy(self, worker_id: str, task_id: str) -> None:
         """Set worker status to busy and record the current task."""
-        key = self._worker_key(worker_id)
-        if not await self.redis.exists(key):  # type: ignore[misc]
+        if not await self.redis.exists(self._worker_key(worker_id)):  # type: ignore[misc]
             return
-        await self.redis.hset(key, mapping={"status": "busy", "current_task_id": task_id})  # type: ignore[misc]
-        await self.redis.expire(key, self.ttl)  # type: ignore[misc]
+        await self._write_status(worker_id, "busy", {"status": "busy", "current_task_id": task_id})
 
     async def set_idle(self, worker_id: str) -> None:
         """Set worker status to idle and clear the current task."""
-        key = self._worker_key(worker_id)
-        if not await self.redis.exists(key):  # type: ignore[misc]
+        if not await self.redis.exists(self._worker_key(worker_id)):  # type: ignore[misc]
             return
-        await self.redis.hset(key, mapping={"status": "idle", "current_task_id": ""})  # type: ignore[misc]
-        await self.redis.expire(key, self.ttl)  # type: ignore[misc]
+        await self._write_status(worker_id, "idle", {"status": "idle", "current_task_id": ""}, announce=True)
 
     async def deregister(self, worker_id: str) -> None:
         """Remove a worker and its token from Redis."""
@@ -152,10 +253,14 @@ class WorkerRegistry:
 
         # Retrieve the token before deleting the worker hash
         token = await self.redis.hget(key, "token")  # type: ignore[misc]
-        await self.redis.delete(key)  # type: ignore[misc]
 
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(key)
+        for index_key in self.STATUS_INDEX.values():
+            pipe.zrem(index_key, worker_id)
         if token:
-            await self.redis.delete(self._token_key(token))  # type: ignore[misc]
+            pipe.delete(self._token_key(token))
+        await pipe.execute()
 
     async def resolve_token(self, token: str) -> str | None:
         """Resolve an auth token to a worker_id. Returns None if invalid/expired."""
@@ -6,11 +6,14 @@ os.environ.setdefault("TESTING", "1")
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from backend.src.api.settings import invalidate_settings_cache
+from backend.src.api.workers import invalidate_worker_token_cache
 from backend.src.main import app
 from backend.src.storage.database import Base, get_db
 
@@ -22,6 +25,14 @@ import backend.src.models  # noqa: F401
 TEST_DATABASE_URL = "sqlite+aiosqlite://"
 
 
+@pytest.fixture(autouse=True)
+def _clear_worker_token_cache():
+    """Tokens resolved in one test must not authenticate requests in the next."""
+    invalidate_worker_token_cache()
+    yield
+    invalidate_worker_token_cache()
+
+
 @pytest_asyncio.fixture
 async def db_engine():
     """Create a test database engine."""
@@ -82,6 +93,9 @@ async def client(db_session, mock_stream_manager):
     # Disable rate limiting in tests to prevent cross-test interference
     app.state.rate_limit_disabled = True
 
+    # Every test starts on a fresh DB, so no settings response may carry over
+    invalidate_settings_cache()
+
     # NOTE: async_session is already patched via the db_session fixture,
     # so finalize_design's fresh-session write scope uses the test DB.
 
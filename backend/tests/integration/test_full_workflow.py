@@ -1,6 +1,7 @@
 """Integration tests for full end-to-end workflows."""
 from __future__ import annotations
 
+import re
 import uuid as uuid_mod
 from unittest.mock import AsyncMock, MagicMock
 
@@ -254,3 +255,66 @@ async def test_board_snapshot(client: AsyncClient, db_session: AsyncSession, moc
     assert stats["ready"] == 1
     assert stats["queued"] == 1
     assert stats["waiting"] == 1
+
+
+async def test_list_endpoints_match_single_object_responses(client: AsyncClient):
+    """Project and phase lists, read without the ORM, match the single-object responses."""
+    project = await _create_project(client)
+    for order in (2, 1):
+        resp = await client.post(
+            f"/api/v1/projects/{project['id']}/phases",
+            json={"name": f"Phase {order}", "description": "d", "order": order},
+        )
+        assert resp.status_code == 201
+
+    detail = (await client.get(f"/api/v1/projects/{project['id']}")).json()
+    listed = {p["id"]: p for p in (await client.get("/api/v1/projects")).json()}
+    assert listed[project["id"]] == detail
+    assert [p["order"] for p in detail["phases"]] == [1, 2]
+
+    phases = (await client.get(f"/api/v1/projects/{project['id']}/phases")).json()
+    assert phases == detail["phases"]
+
+
+async def test_list_registration_tokens(client: AsyncClient):
+    """Registration tokens are listed newest first with the response schema's fields."""
+    created = (await client.post("/api/v1/registration-tokens", json={"name": "ci"})).json()
+    assert re.fullmatch(r"glrt-[0-9a-f]{40}", created["token"])
+
+    resp = await client.get("/api/v1/registration-tokens")
+
+    assert resp.status_code == 200
+    token = next(t for t in resp.json() if t["id"] == created["id"])
+    assert token["name"] == "ci"
+    assert token["token"] == created["token"]
+    assert token["revoked"] is False
+    assert set(token) == {"id", "token", "name", "created_at", "expires_at", "revoked"}
+
+
+async def test_list_registration_tokens_keyset_pages(client: AsyncClient, db_session: AsyncSession):
+    """`limit` caps a page and `before` continues from the previous page's last created_at."""
+    from datetime import datetime, timedelta, timezone
+
+    from backend.src.models import RegistrationToken
+
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all(
+        RegistrationToken(token=f"glrt-page-{i}", name=f"t{i}", created_at=base + timedelta(minutes=i))
+        for i in range(5)
+    )
+    await db_session.commit()
+
+    first = (await client.get("/api/v1/registration-tokens", params={"limit": 2})).json()
+    assert [t["name"] for t in first] == ["t4", "t3"]
+
+    second = (
+        await client.get("/api/v1/registration-tokens", params={"limit": 2, "before": first[-1]["created_at"]})
+    ).json()
+    assert [t["name"] for t in second] == ["t2", "t1"]
+
+    last = (
+        await client.get("/api/v1/registration-tokens", params={"limit": 2, "before": second[-1]["created_at"]})
+    ).json()
+    assert [t["name"] for t in last] == ["t0"]
+
+    assert (await client.get("/api/v1/registration-tokens", params={"limit": 201})).status_code == 422
@@ -47,6 +47,7 @@ async def test_worker_registration_and_list(db_session: AsyncSession):
     mock_redis.set = AsyncMock()
     mock_redis.get = AsyncMock(return_value=None)
     mock_redis.delete = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
     mock_redis.scan_iter = MagicMock(return_value=_async_iter([]))
 
     app.state.redis = mock_redis
@@ -134,6 +135,7 @@ async def test_worker_heartbeat(db_session: AsyncSession):
     mock_redis.set = AsyncMock()
     mock_redis.get = AsyncMock(return_value=None)
     mock_redis.delete = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
     mock_redis.scan_iter = MagicMock(return_value=_async_iter([]))
 
     app.state.redis = mock_redis
@@ -167,6 +169,9 @@ async def test_worker_heartbeat(db_session: AsyncSession):
         mock_redis.get = AsyncMock(return_value=worker_id)
         # worker exists
         mock_redis.exists = AsyncMock(return_value=1)
+        mock_redis.hget = AsyncMock(return_value="idle")
+        # heartbeat: the script found and renewed the worker hash
+        mock_redis.eval = AsyncMock(return_value=1)
         # get_worker data
         mock_redis.hgetall = AsyncMock(return_value={
             "id": worker_id,
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Callable, Iterator
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection
+
+from backend.alembic.helpers import fast_copy, paginated_update
+
+items = sa.table("items", sa.column("id", sa.Integer), sa.column("status", sa.String))
+
+
+# ── Fixtures ─────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def connection() -> Iterator[Connection]:
+    """A real SQLite connection holding five ``pending`` items."""
+    engine = sa.create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(sa.text("CREATE TABLE items (id INTEGER PRIMARY KEY, status TEXT NOT NULL)"))
+        conn.execute(items.insert(), [{"id": i, "status": "pending"} for i in range(1, 6)])
+        conn.commit()
+        yield conn
+    engine.dispose()
+
+
+@pytest.fixture
+def migration(connection: Connection) -> Iterator[MigrationContext]:
+    """Route ``alembic.op`` to ``connection``, as inside a transactional migration run."""
+    context = MigrationContext.configure(connection, opts={"transactional_ddl": True})
+    with Operations.context(context):
+        yield context
+
+
+def _run_and_fail(migration: MigrationContext, step: Callable[[], object]) -> None:
+    """Run ``step`` in the migration transaction, then fail the migration."""
+    with pytest.raises(RuntimeError):
+        with migration.begin_transaction():
+            step()
+            raise RuntimeError("later step failed")
+
+
+def _mark_done(bind: Connection, row: sa.Row) -> None:
+    bind.execute(items.update().where(items.c.id == row.id).values(status="done"))
+
+
+def _statuses(connection: Connection) -> list[str]:
+    return list(connection.execute(sa.select(items.c.status).order_by(items.c.id)).scalars())
+
+
+# ── paginated_update ─────────────────────────────────────────────────────
+
+
+def test_paginated_update_visits_rows_moved_out_of_the_filter(
+    connection: Connection, migration: MigrationContext
+) -> None:
+    """Keyset paging reaches every row even though each page leaves the WHERE clause."""
+    select_stmt = sa.select(items.c.id).where(items.c.status == "pending")
+
+    with migration.begin_transaction():
+        processed = paginated_update(select_stmt, _mark_done, items.c.id, page_size=2)
+
+    assert processed == 5
+    assert _statuses(connection) == ["done"] * 5
+
+
+def test_paginated_update_commits_each_page(connection: Connection, migration: MigrationContext) -> None:
+    """Pages are committed as they go, so a failure later in the revision does not undo them."""
+    _run_and_fail(migration, lambda: paginated_update(sa.select(items.c.id), _mark_done, items.c.id, page_size=2))
+
+    assert _statuses(connection) == ["done"] * 5
+
+
+def test_paginated_update_without_commit_pages_stays_in_the_transaction(
+    connection: Connection, migration: MigrationContext
+) -> None:
+    """With commit_pages=False the update rolls back with the migration transaction."""
+    _run_and_fail(
+        migration,
+        lambda: paginated_update(sa.select(items.c.id), _mark_done, items.c.id, page_size=2, commit_pages=False),
+    )
+
+    assert _statuses(connection) == ["pending"] * 5
+
+
+def test_paginated_update_is_a_no_op_offline() -> None:
+    """In --sql mode there are no rows to read, so nothing is emitted."""
+    buffer = io.StringIO()
+    context = MigrationContext.configure(dialect_name="sqlite", opts={"as_sql": True, "output_buffer": buffer})
+    with Operations.context(context):
+        assert paginated_update(sa.select(items.c.id), _mark_done, items.c.id) == 0
+    assert buffer.getvalue() == ""
+
+
+# ── fast_copy ────────────────────────────────────────────────────────────
+
+
+def test_fast_copy_falls_back_to_bulk_insert(connection: Connection, migration: MigrationContext) -> None:
+    """Drivers without COPY get the rows through op.bulk_insert."""
+    with migration.begin_transaction():
+        fast_copy("items", ["id", "status"], [(6, "seeded"), (7, "seeded")])
+
+    rows = connection.execute(sa.select(items.c.id, items.c.status).where(items.c.id > 5).order_by(items.c.id)).all()
+    assert [tuple(row) for row in rows] == [(6, "seeded"), (7, "seeded")]
+
+
+def test_fast_copy_offline_emits_inserts() -> None:
+    """In --sql mode the rows are rendered as INSERT statements."""
+    buffer = io.StringIO()
+    context = MigrationContext.configure(dialect_name="sqlite", opts={"as_sql": True, "output_buffer": buffer})
+    with Operations.context(context):
+        fast_copy("items", ["id", "status"], [(6, None), (7, "seeded")])
+    assert "INSERT INTO items (id, status) VALUES (6, NULL)" in buffer.getvalue()
+    assert "INSERT INTO items (id, status) VALUES (7, 'seeded')" in buffer.getvalue()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 import uuid
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from backend.src.models import (
+    DesignMessage,
     DesignSession,
     DesignSessionStatus,
     MessageRole,
@@ -20,6 +22,7 @@ from backend.src.models import (
 )
 from fastapi import HTTPException
 from httpx import AsyncClient
+from sqlalchemy import select
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
@@ -166,7 +169,7 @@ async def test_list_sessions_with_messages_for_resume(client: AsyncClient, db_se
     session_id = session_data["id"]
 
     # Send a message to build history
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.chat = AsyncMock(return_value="I can help!")
         await client.post(
@@ -300,7 +303,7 @@ async def test_send_message_success(client: AsyncClient, db_session):
     mock_choice.message.content = "I can help with that!"
     mock_response.choices = [mock_choice]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.chat = AsyncMock(return_value="I can help with that!")
 
@@ -321,7 +324,7 @@ async def test_send_message_saves_user_message(client: AsyncClient, db_session):
     session_data = await create_session_via_api(client, db_session)
     session_id = session_data["id"]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.chat = AsyncMock(return_value="Response")
 
@@ -371,7 +374,7 @@ async def test_send_message_llm_error(client: AsyncClient, db_session):
     session_data = await create_session_via_api(client, db_session)
     session_id = session_data["id"]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         from backend.src.core.llm_client import LLMError
 
         instance = MockClient.return_value
@@ -398,7 +401,7 @@ async def test_stream_message_success(client: AsyncClient, db_session):
         for chunk in ["Hello", " world", "!"]:
             yield chunk
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.stream_chat = mock_stream_chat
 
@@ -486,7 +489,7 @@ async def test_finalize_design_success(client: AsyncClient, db_session):
     session_data = await create_session_via_api(client, db_session)
     session_id = session_data["id"]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -534,7 +537,7 @@ async def test_finalize_assigns_worker_to_project(client: AsyncClient, db_sessio
     )
     session_id = response.json()["id"]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -559,7 +562,7 @@ async def test_finalize_design_with_pm_config(client: AsyncClient, db_session):
     session_data = await create_session_via_api(client, db_session)
     session_id = session_data["id"]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -614,7 +617,7 @@ async def test_finalize_llm_error(client: AsyncClient, db_session):
     session_data = await create_session_via_api(client, db_session)
     session_id = session_data["id"]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         from backend.src.core.llm_client import LLMError
 
         instance = MockClient.return_value
@@ -633,7 +636,7 @@ async def test_finalize_creates_task_dependencies(client: AsyncClient, db_sessio
     session_data = await create_session_via_api(client, db_session)
     session_id = session_data["id"]
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -669,7 +672,7 @@ async def test_add_task_success(client: AsyncClient, db_session):
     """POST /api/architect/add-task/{project_id} creates a task."""
     project, phase = await create_project_with_phase(db_session)
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.structured_output = AsyncMock(return_value=MOCK_ADD_TASK_RESPONSE)
 
@@ -692,11 +695,42 @@ async def test_add_task_success(client: AsyncClient, db_session):
     assert data["qa_prompt"] == {"prompt": "Verify the feature works correctly..."}
 
 
+async def test_add_task_does_not_reload(client: AsyncClient, db_session, db_engine):
+    """POST /api/architect/add-task/{project_id} answers from the INSERT without reading the task back."""
+    from sqlalchemy import event
+
+    project, phase = await create_project_with_phase(db_session)
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
+        instance = MockClient.return_value
+        instance.structured_output = AsyncMock(return_value=MOCK_ADD_TASK_RESPONSE)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = await client.post(
+                f"/api/v1/architect/add-task/{project.id}",
+                json={"phase_id": str(phase.id), "request_text": "Add a feature"},
+            )
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 201
+    # The handler lists the project's tasks for the prompt; none is fetched by id
+    assert not [sql for sql in statements if sql.lstrip().upper().startswith("SELECT") and "WHERE tasks.id" in sql]
+    task_id = response.json()["id"]
+    stored = (await client.get(f"/api/v1/tasks/{task_id}")).json()
+    assert stored["title"] == "New Feature Task"
+
+
 async def test_add_task_with_llm_override(client: AsyncClient, db_session):
     """POST /api/architect/add-task/{project_id} uses override llm_config when provided."""
     project, phase = await create_project_with_phase(db_session)
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         instance = MockClient.return_value
         instance.structured_output = AsyncMock(return_value=MOCK_ADD_TASK_RESPONSE)
 
@@ -831,7 +865,7 @@ async def test_add_task_llm_error(client: AsyncClient, db_session):
     """POST /api/architect/add-task/{project_id} returns 502 on LLM failure."""
     project, phase = await create_project_with_phase(db_session)
 
-    with patch("backend.src.api.architect.LLMClient") as MockClient:
+    with patch("backend.src.api.architect.get_llm_client") as MockClient:
         from backend.src.core.llm_client import LLMError
 
         instance = MockClient.return_value
@@ -860,52 +894,52 @@ class TestSlugifyDirect:
     """Direct tests for the _slugify helper."""
 
     def test_simple_string(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("Hello World") == "hello-world"
 
     def test_special_characters(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("Phase 1: Setup & Config!") == "phase-1-setup-config"
 
     def test_unicode_characters(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("Deja vu") == "deja-vu"
 
     def test_multiple_spaces_and_dashes(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("hello   ---   world") == "hello-world"
 
     def test_leading_trailing_dashes(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("---hello---") == "hello"
 
     def test_empty_string(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("") == ""
 
     def test_only_special_characters(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("!@#$%") == ""
 
     def test_already_slug(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("already-a-slug") == "already-a-slug"
 
     def test_uppercase(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         assert _slugify("UPPERCASE STRING") == "uppercase-string"
 
     def test_accented_characters(self):
-        from backend.src.api.architect import _slugify
+        from backend.src.utils.text import slugify as _slugify
 
         result = _slugify("caf\u00e9 na\u00efve r\u00e9sum\u00e9")
         assert result == "cafe-naive-resume"
@@ -981,14 +1015,14 @@ class TestBuildMessageHistoryDirect:
         msg2.created_at = datetime(2099, 1, 2, tzinfo=timezone.utc)
         msg2.message_type = MessageType.chat
 
-        session.messages = [msg2, msg1]  # intentionally reversed to test sorting
+        session.messages = [msg1, msg2]  # chronological, as the relationship loads them
 
         with patch(
             "backend.src.api.architect.get_prompt", return_value="System prompt"
         ):
             result = _build_message_history(session)
         assert len(result) == 3
-        # First should be system prompt, then sorted messages
+        # First should be system prompt, then messages in loaded order
         assert result[0] == {"role": "system", "content": "System prompt"}
         assert result[1] == {"role": "assistant", "content": "Hello"}
         assert result[2] == {"role": "user", "content": "Help me"}
@@ -1022,6 +1056,29 @@ class TestBuildMessageHistoryDirect:
         assert result[0]["role"] == "system"
         assert result[1]["role"] == "user"
 
+    def test_prefix_is_stable_across_turns(self):
+        """A new turn only appends; earlier messages are rendered identically."""
+        from backend.src.api.architect import _build_message_history
+
+        def _msg(role, content):
+            msg = MagicMock()
+            msg.role = role
+            msg.content = content
+            msg.message_type = MessageType.chat
+            return msg
+
+        first = _msg(MessageRole.user, "Build a todo app")
+        reply = _msg(MessageRole.assistant, "Which stack?")
+        session = MagicMock()
+        session.messages = [first, reply]
+        with patch("backend.src.api.architect.get_prompt", return_value="System prompt"):
+            turn_one = _build_message_history(session)
+            session.messages = [first, reply, _msg(MessageRole.user, "FastAPI")]
+            turn_two = _build_message_history(session)
+
+        assert json.dumps(turn_two[: len(turn_one)]) == json.dumps(turn_one)
+        assert turn_two[-1] == {"role": "user", "content": "FastAPI"}
+
     def test_excludes_internal_messages(self):
         """Internal messages should be excluded from LLM message history."""
         from backend.src.api.architect import _build_message_history
@@ -1237,7 +1294,7 @@ class TestInternalMessageFiltering:
         session = await create_session_in_db(db_session)
         body = schemas.FinalizeRequest(repo_path="/test/repo")
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -1270,7 +1327,7 @@ class TestSendMessageDirect:
         session = await create_session_in_db(db_session)
         body = schemas.MessageRequest(content="Help me design an API")
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.chat = AsyncMock(return_value="Sure, I can help!")
 
@@ -1312,7 +1369,7 @@ class TestSendMessageDirect:
         session = await create_session_in_db(db_session)
         body = schemas.MessageRequest(content="Hello")
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.chat = AsyncMock(side_effect=LLMError("Rate limited"))
 
@@ -1339,7 +1396,7 @@ class TestSendMessageStreamDirect:
             for chunk in ["Hello", " world"]:
                 yield chunk
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.stream_chat = mock_stream_chat
 
@@ -1389,7 +1446,7 @@ class TestSendMessageStreamDirect:
             for chunk in ["A", "B", "C"]:
                 yield chunk
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.stream_chat = mock_stream_chat
 
@@ -1404,6 +1461,14 @@ class TestSendMessageStreamDirect:
         # The generator should have produced chunk events and a done event
         assert len(chunks_received) > 0
 
+        # Both sides of the turn are persisted, in order
+        result = await db_session.execute(
+            select(DesignMessage.role, DesignMessage.content)
+            .where(DesignMessage.session_id == session.id)
+            .order_by(DesignMessage.created_at, DesignMessage.id)
+        )
+        assert result.all() == [(MessageRole.user, "Hello"), (MessageRole.assistant, "ABC")]
+
     async def test_stream_event_generator_llm_error(self, db_session):
         """Test the event generator handles LLM errors gracefully."""
         from backend.src import schemas
@@ -1417,7 +1482,7 @@ class TestSendMessageStreamDirect:
             raise LLMError("Stream failed")
             yield  # make it a generator  # noqa: E501
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.stream_chat = mock_stream_chat_error
 
@@ -1446,7 +1511,7 @@ class TestFinalizeDesignDirect:
         session = await create_session_in_db(db_session)
         body = schemas.FinalizeRequest(repo_path="/test/repo")
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -1472,7 +1537,7 @@ class TestFinalizeDesignDirect:
             ),
         )
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -1519,7 +1584,7 @@ class TestFinalizeDesignDirect:
         session = await create_session_in_db(db_session)
         body = schemas.FinalizeRequest(repo_path="/test/repo")
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(side_effect=LLMError("API error"))
 
@@ -1556,7 +1621,7 @@ class TestFinalizeDesignDirect:
             ],
         }
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(
                 return_value=response_with_bad_priority
@@ -1580,7 +1645,7 @@ class TestFinalizeDesignDirect:
             pm_llm_config=schemas.LLMConfigInput(api_key="sk-pm-only"),
         )
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=MOCK_FINALIZE_RESPONSE)
 
@@ -1607,7 +1672,7 @@ class TestFinalizeDesignDirect:
             "phases": [],
         }
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=empty_response)
 
@@ -1647,7 +1712,7 @@ class TestFinalizeDesignDirect:
             ],
         }
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=response_with_bad_dep)
 
@@ -1687,7 +1752,7 @@ class TestFinalizeDesignDirect:
         body = schemas.FinalizeRequest(repo_path="/test/repo")
         captured_messages = None
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
 
             async def capture_structured_output(messages, **kwargs):
@@ -1740,7 +1805,7 @@ class TestFinalizeDesignDirect:
         body = schemas.FinalizeRequest(repo_path="/test/repo")
         captured_messages = None
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
 
             async def capture_structured_output(messages, **kwargs):
@@ -1781,7 +1846,7 @@ class TestFinalizeDesignDirect:
             ],
         }
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=minimal_response)
 
@@ -1809,7 +1874,7 @@ class TestAddTaskDirect:
             request_text="Add a user authentication feature",
         )
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=MOCK_ADD_TASK_RESPONSE)
 
@@ -1832,7 +1897,7 @@ class TestAddTaskDirect:
             ),
         )
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=MOCK_ADD_TASK_RESPONSE)
 
@@ -1942,7 +2007,7 @@ class TestAddTaskDirect:
             request_text="Add something",
         )
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(side_effect=LLMError("API error"))
 
@@ -1969,7 +2034,7 @@ class TestAddTaskDirect:
             "qa_prompt": "Check something",
         }
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=bad_priority_response)
 
@@ -1989,7 +2054,7 @@ class TestAddTaskDirect:
             # No llm_config override, so it uses project.llm_config["architect"]
         )
 
-        with patch("backend.src.api.architect.LLMClient") as MockClient:
+        with patch("backend.src.api.architect.get_llm_client") as MockClient:
             instance = MockClient.return_value
             instance.structured_output = AsyncMock(return_value=MOCK_ADD_TASK_RESPONSE)
 
@@ -2319,7 +2384,7 @@ class TestRedesignPhaseDirect:
         )
 
         with (
-            patch("backend.src.api.architect.LLMClient") as MockLLMClient,
+            patch("backend.src.api.architect.get_llm_client") as MockLLMClient,
             patch("backend.src.storage.redis_client.get_redis", new_callable=AsyncMock) as mock_get_redis,
         ):
             instance = MockLLMClient.return_value
@@ -2393,3 +2458,18 @@ class TestCleanResponse:
         assert cleaned == "Summary"
         assert has_finalize is False
         assert design_ctx == "Spec here"
+
+
+# ── _sse_chunk unit tests ────────────────────────────────────────────
+
+
+class TestSseChunk:
+    """_sse_chunk must encode exactly like sse-starlette's ServerSentEvent."""
+
+    @pytest.mark.parametrize("text", ["Hello", "", "line1\nline2", "a\r\nb\rc\n", "유니코드 ✓"])
+    def test_matches_server_sent_event_encoding(self, text):
+        from sse_starlette.event import ServerSentEvent
+
+        from backend.src.api.architect import _sse_chunk
+
+        assert _sse_chunk(text) == ServerSentEvent(event="chunk", data=text).encode()
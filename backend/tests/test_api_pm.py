@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -35,6 +36,10 @@ async def mock_redis() -> AsyncMock:
     r.get = AsyncMock(return_value=None)
     r.delete = AsyncMock()
     r.scan_iter = MagicMock(return_value=_async_iter([]))
+    # Status-index counts: (pruned, live) per index, idle then busy
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[0, 2, 0, 1])
+    r.pipeline = MagicMock(return_value=pipe)
     return r
 
 
@@ -72,6 +77,28 @@ async def test_start_orchestration(api_client: AsyncClient) -> None:
     assert data["project_id"] == project_id
 
 
+async def test_concurrent_starts_create_one_orchestrator(api_client: AsyncClient) -> None:
+    """Two simultaneous start requests for one project: one starts, the other gets 409."""
+    project_id = str(uuid.uuid4())
+
+    with patch("backend.src.api.pm.PMOrchestrator") as MockOrchestrator:
+        never_done = asyncio.Event()
+
+        async def run_forever(*_args) -> None:
+            await never_done.wait()
+
+        MockOrchestrator.return_value.start = AsyncMock(side_effect=run_forever)
+
+        responses = await asyncio.gather(
+            api_client.post(f"/api/v1/pm/{project_id}/start"),
+            api_client.post(f"/api/v1/pm/{project_id}/start"),
+        )
+
+        assert sorted(r.status_code for r in responses) == [200, 409]
+        assert MockOrchestrator.call_count == 1
+        app.state.orchestrators[project_id]["task"].cancel()
+
+
 async def test_start_orchestration_already_running(api_client: AsyncClient) -> None:
     """POST /api/v1/pm/start should return 409 if orchestrator already running."""
     project_id = str(uuid.uuid4())
@@ -195,11 +222,47 @@ async def test_get_status_running(api_client: AsyncClient, mock_redis: AsyncMock
     assert response.status_code == 200
     data = response.json()
     assert data["running"] is True
+    assert data["workers"] == {"idle": 2, "busy": 1, "total": 3}
+    assert data["tasks"] == {"ready": 3, "done": 5}
 
     # Cleanup
     del app.state.orchestrators[project_id]
 
 
+async def test_get_status_overlaps_redis_and_db(api_client: AsyncClient, mock_redis: AsyncMock) -> None:
+    """The worker count and the task count run concurrently, not one after the other."""
+    project_id = str(uuid.uuid4())
+    db_started = asyncio.Event()
+
+    async def worker_counts():
+        # Only completes if the DB query was started without waiting for Redis
+        await asyncio.wait_for(db_started.wait(), timeout=1)
+        return [0, 1, 0, 0]
+
+    async def task_counts(_project_id):
+        db_started.set()
+        return {"ready": 1}
+
+    mock_redis.pipeline.return_value.execute = AsyncMock(side_effect=worker_counts)
+
+    from backend.src.storage.database import get_db as real_get_db
+
+    async def override_get_db():
+        yield AsyncMock()
+
+    app.dependency_overrides[real_get_db] = override_get_db
+
+    with patch("backend.src.api.pm.TaskRepository") as MockRepo:
+        MockRepo.return_value.count_by_status = AsyncMock(side_effect=task_counts)
+        response = await api_client.get(f"/api/v1/pm/{project_id}/status")
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["workers"]["idle"] == 1
+    assert response.json()["tasks"] == {"ready": 1}
+
+
 # -- POST /api/v1/pm/{project_id}/queue-next -------------------------------------
 
 
@@ -261,3 +324,128 @@ async def test_queue_next_no_ready_tasks(api_client: AsyncClient, mock_redis: As
 
     assert response.status_code == 404
     assert "No ready tasks" in response.json()["detail"]
+
+
+async def test_queue_next_reuses_project_orchestrator(api_client: AsyncClient, mock_redis: AsyncMock) -> None:
+    """Repeated queue-next calls for one project build a single orchestrator."""
+    project_id = str(uuid.uuid4())
+
+    with patch("backend.src.api.pm.PMOrchestrator") as MockOrchestrator:
+        mock_instance = AsyncMock()
+        mock_instance.queue_next = AsyncMock(return_value=None)
+        MockOrchestrator.return_value = mock_instance
+
+        from backend.src.storage.database import get_db as real_get_db
+
+        async def override_get_db():
+            yield AsyncMock()
+
+        app.dependency_overrides[real_get_db] = override_get_db
+
+        await api_client.post(f"/api/v1/pm/{project_id}/queue-next")
+        await api_client.post(f"/api/v1/pm/{project_id}/queue-next")
+
+        app.dependency_overrides.clear()
+
+    assert MockOrchestrator.call_count == 1
+    assert mock_instance.queue_next.await_count == 2
+    assert app.state.orchestrators[project_id]["running"] is False
+
+
+async def test_queue_next_uses_running_orchestrator(api_client: AsyncClient, mock_redis: AsyncMock) -> None:
+    """queue-next goes through the running orchestrator of the project."""
+    project_id = str(uuid.uuid4())
+    running = AsyncMock()
+    running.queue_next = AsyncMock(return_value=None)
+    app.state.orchestrators[project_id] = {"orchestrator": running, "task": MagicMock(), "running": True}
+
+    with patch("backend.src.api.pm.PMOrchestrator") as MockOrchestrator:
+        from backend.src.storage.database import get_db as real_get_db
+
+        async def override_get_db():
+            yield AsyncMock()
+
+        app.dependency_overrides[real_get_db] = override_get_db
+
+        response = await api_client.post(f"/api/v1/pm/{project_id}/queue-next")
+
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 404
+    MockOrchestrator.assert_not_called()
+    running.queue_next.assert_awaited_once()
+
+
+# -- POST /api/v1/pm/{project_id}/promote-waiting --------------------------------
+
+
+async def test_promote_waiting_promotes_only_tasks_with_done_dependencies(
+    client: AsyncClient, db_session, mock_stream_manager
+) -> None:
+    """POST /promote-waiting should promote exactly the waiting tasks whose dependencies are all done."""
+    from datetime import datetime, timezone
+
+    from sqlalchemy import select
+
+    from backend.src.models import (
+        Phase,
+        PhaseStatus,
+        Project,
+        ProjectStatus,
+        Task,
+        TaskHistory,
+        TaskPriority,
+        TaskStatus,
+    )
+    from backend.src.repositories.task_repository import TaskRepository
+
+    now = datetime.now(timezone.utc)
+    project = Project(
+        id=uuid.uuid4(), name="P", description="", repo_path="/p",
+        status=ProjectStatus.active, created_at=now, updated_at=now,
+    )
+    phase = Phase(
+        id=uuid.uuid4(), project_id=project.id, name="Phase 1", branch_name="phase-1",
+        order=1, status=PhaseStatus.active, created_at=now, updated_at=now,
+    )
+    db_session.add_all([project, phase])
+    await db_session.flush()
+
+    def _task(title: str, status: TaskStatus) -> Task:
+        return Task(
+            id=uuid.uuid4(), project_id=project.id, phase_id=phase.id, title=title,
+            status=status, priority=TaskPriority.medium, version=1, created_at=now, updated_at=now,
+        )
+
+    done = _task("done", TaskStatus.done)
+    met = _task("met", TaskStatus.waiting)
+    no_deps = _task("no deps", TaskStatus.waiting)
+    unmet = _task("unmet", TaskStatus.waiting)
+    db_session.add_all([done, met, no_deps, unmet])
+    await db_session.flush()
+    await TaskRepository(db_session).add_dependency_pairs(
+        [(met.id, done.id), (unmet.id, done.id), (unmet.id, no_deps.id)]
+    )
+    await db_session.commit()
+    met_id, no_deps_id, unmet_id = met.id, no_deps.id, unmet.id
+
+    response = await client.post(f"/api/v1/pm/{project.id}/promote-waiting")
+
+    assert response.status_code == 200
+    promoted = {item["task_id"] for item in response.json()["promoted"]}
+    assert promoted == {str(met_id), str(no_deps_id)}
+
+    db_session.expire_all()
+    statuses = dict((await db_session.execute(select(Task.id, Task.status))).all())
+    assert statuses[met_id] == TaskStatus.ready
+    assert statuses[no_deps_id] == TaskStatus.ready
+    assert statuses[unmet_id] == TaskStatus.waiting
+    history = (await db_session.execute(select(TaskHistory.task_id))).scalars().all()
+    assert sorted(history) == sorted([met_id, no_deps_id])
+
+    # Both board events go out together in a single batched publish
+    mock_stream_manager.publish_board_event.assert_not_called()
+    mock_stream_manager.publish_board_events.assert_called_once()
+    events = mock_stream_manager.publish_board_events.call_args.args[0]
+    assert {data["task_id"] for _, data in events} == {str(met_id), str(no_deps_id)}
+    assert all(event == "task_transition" and data["to_status"] == "ready" for event, data in events)
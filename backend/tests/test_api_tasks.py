@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timezone
 
+import pytest
 from httpx import AsyncClient
 
 from backend.src.models import Phase, PhaseStatus, Project, ProjectStatus, Task, TaskPriority, TaskStatus
@@ -67,6 +68,7 @@ async def test_create_task_success(client: AsyncClient, db_session):
 async def test_create_task_dependency_not_found_400(client: AsyncClient, db_session):
     """POST /api/tasks/ with non-existent dependency returns 400."""
     project, phase = await create_project_and_phase(db_session)
+    project_id = project.id  # the endpoint's rollback expires the shared session's objects
     fake_dep_id = str(uuid.uuid4())
 
     response = await client.post(
@@ -85,6 +87,120 @@ async def test_create_task_dependency_not_found_400(client: AsyncClient, db_sess
 
     assert response.status_code == 400
     assert "Dependency tasks not found" in response.json()["detail"]
+    assert fake_dep_id in response.json()["detail"]
+    # The rejected edge insert rolled the task back with it
+    listed = await client.get(f"/api/v1/tasks/by-project/{project_id}")
+    assert listed.json() == []
+
+
+async def test_create_task_with_several_dependencies(client: AsyncClient, db_session):
+    """POST /api/tasks/ stores every dependency edge and starts WAITING."""
+    project, phase = await create_project_and_phase(db_session)
+    now = datetime.now(timezone.utc)
+    deps = [
+        Task(
+            id=uuid.uuid4(), project_id=project.id, phase_id=phase.id, title=f"Dep {i}",
+            status=TaskStatus.ready, priority=TaskPriority.medium, version=1,
+            created_at=now, updated_at=now,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(deps)
+    await db_session.commit()
+    dep_ids = [str(dep.id) for dep in deps]
+
+    response = await client.post(
+        "/api/v1/tasks/",
+        json={
+            "project_id": str(project.id),
+            "phase_id": str(phase.id),
+            "title": "Task with deps",
+            "description": "Test",
+            "priority": "medium",
+            "depends_on": dep_ids,
+            "worker_prompt": "do something",
+            "qa_prompt": "check something",
+        },
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["status"] == "waiting"
+    assert sorted(data["depends_on"]) == sorted(dep_ids)
+
+
+async def test_create_task_does_not_reload(client: AsyncClient, db_session, db_engine):
+    """The response is built from the INSERT alone; no SELECT reads the new task back."""
+    from sqlalchemy import event
+
+    project, phase = await create_project_and_phase(db_session)
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.post(
+            "/api/v1/tasks/",
+            json={
+                "project_id": str(project.id),
+                "phase_id": str(phase.id),
+                "title": "No Reload",
+                "description": "test",
+                "priority": "medium",
+                "depends_on": [],
+                "worker_prompt": "work",
+                "qa_prompt": "check",
+            },
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 201
+    assert not [sql for sql in statements if sql.lstrip().upper().startswith("SELECT") and "FROM tasks" in sql]
+    data = response.json()
+    assert data["branch_name"] is None
+    assert data["qa_result"] is None
+    assert data["created_at"] is not None
+    # NULL columns were recorded, not written: they read back as SQL NULL
+    stored = (await client.get(f"/api/v1/tasks/{data['id']}")).json()
+    assert stored == data
+
+
+async def test_create_task_with_dependencies_skips_existence_query(client: AsyncClient, db_session, db_engine):
+    """Dependencies are checked by the edge table's foreign key, not by a SELECT before the insert."""
+    from sqlalchemy import event
+
+    project, phase = await create_project_and_phase(db_session)
+    payload = {
+        "project_id": str(project.id),
+        "phase_id": str(phase.id),
+        "description": "test",
+        "priority": "medium",
+        "worker_prompt": "work",
+        "qa_prompt": "check",
+    }
+    dep_id = (await client.post("/api/v1/tasks/", json={**payload, "title": "Dep", "depends_on": []})).json()["id"]
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.post(
+            "/api/v1/tasks/", json={**payload, "title": "Child", "depends_on": [dep_id, dep_id]}
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 201
+    assert not [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    data = response.json()
+    assert data["depends_on"] == [dep_id]
+    assert data["status"] == "waiting"
+    assert (await client.get(f"/api/v1/tasks/{data['id']}")).json()["depends_on"] == [dep_id]
 
 
 async def test_get_task_success(client: AsyncClient, db_session):
@@ -171,6 +287,8 @@ async def test_update_task_waiting_status(client: AsyncClient, db_session):
     data = response.json()
     assert data["title"] == "Updated Title"
     assert data["priority"] == "critical"
+    # Fields left out of the PATCH body are untouched
+    assert data["description"] == "will wait"
 
 
 async def test_update_task_in_progress_400(client: AsyncClient, db_session):
@@ -380,6 +498,58 @@ async def test_transition_without_expected_version(client: AsyncClient, db_sessi
     assert response.status_code == 200
 
 
+async def test_transition_replayed_version_409(client: AsyncClient, db_session, mock_stream_manager):
+    """A second transition with the already-consumed version is rejected and changes nothing."""
+    project, phase = await create_project_and_phase(db_session)
+
+    create_response = await client.post(
+        "/api/v1/tasks/",
+        json={
+            "project_id": str(project.id),
+            "phase_id": str(phase.id),
+            "title": "Replay Task",
+            "description": "test",
+            "priority": "medium",
+            "depends_on": [],
+            "worker_prompt": "work",
+            "qa_prompt": "check",
+        },
+    )
+    task_id = create_response.json()["id"]
+    version = create_response.json()["version"]
+
+    first = await client.post(
+        f"/api/v1/tasks/{task_id}/transition",
+        json={"new_status": "queued", "actor": "test", "expected_version": version},
+    )
+    replay = await client.post(
+        f"/api/v1/tasks/{task_id}/transition",
+        json={"new_status": "in_progress", "actor": "test", "expected_version": version},
+    )
+
+    assert first.status_code == 200
+    assert replay.status_code == 409
+    assert f"current {version + 1}" in replay.json()["detail"]
+    assert (await client.get(f"/api/v1/tasks/{task_id}")).json()["status"] == "queued"
+    # The board event of the successful transition is published once, after commit
+    mock_stream_manager.publish_board_event.assert_not_called()
+    mock_stream_manager.publish_board_events.assert_called_once()
+    [(event, data)] = mock_stream_manager.publish_board_events.call_args.args[0]
+    assert event == "task_transition"
+    assert data["task_id"] == task_id
+    assert data["to_status"] == "queued"
+
+
+async def test_transition_unknown_task_with_version_404(client: AsyncClient):
+    """An expected_version on a missing task is still a 404, not a version conflict."""
+    response = await client.post(
+        f"/api/v1/tasks/{uuid.uuid4()}/transition",
+        json={"new_status": "queued", "actor": "test", "expected_version": 1},
+    )
+
+    assert response.status_code == 404
+
+
 async def test_update_with_mismatched_version_409(client: AsyncClient, db_session):
     """PATCH /api/tasks/{id} with wrong expected_version returns 409."""
     project, phase = await create_project_and_phase(db_session)
@@ -452,3 +622,110 @@ async def test_409_response_contains_current_version(client: AsyncClient, db_ses
     assert response.status_code == 409
     detail = response.json()["detail"]
     assert str(current_version) in detail
+
+
+async def test_list_project_tasks_matches_single_task_response(client: AsyncClient, db_session):
+    """The list endpoint returns the same JSON per task as build_task_response, dependencies included."""
+    from backend.src.api.tasks import build_task_response
+    from backend.src.repositories.task_repository import TaskRepository
+
+    project, phase = await create_project_and_phase(db_session)
+    dep_response = await client.post(
+        "/api/v1/tasks/",
+        json={
+            "project_id": str(project.id),
+            "phase_id": str(phase.id),
+            "title": "Dep",
+            "description": "dep",
+            "priority": "high",
+            "depends_on": [],
+            "worker_prompt": "work",
+            "qa_prompt": "check",
+        },
+    )
+    await client.post(
+        "/api/v1/tasks/",
+        json={
+            "project_id": str(project.id),
+            "phase_id": str(phase.id),
+            "title": "Dependent",
+            "description": "waits",
+            "priority": "low",
+            "depends_on": [dep_response.json()["id"]],
+            "worker_prompt": "work",
+            "qa_prompt": "check",
+        },
+    )
+
+    response = await client.get(f"/api/v1/tasks/by-project/{project.id}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    tasks = await TaskRepository(db_session).list_by_project(project.id)
+    expected = [build_task_response(task).model_dump(mode="json") for task in tasks]
+    assert response.json() == expected
+    assert any(row["depends_on"] for row in response.json())
+
+
+async def test_list_project_tasks_documents_response_model(client: AsyncClient):
+    """Returning a raw Response keeps list[TaskResponse] in the OpenAPI schema."""
+    spec = (await client.get("/openapi.json")).json()
+    schema = spec["paths"]["/api/v1/tasks/by-project/{project_id}"]["get"]["responses"]["200"]["content"]
+    assert schema["application/json"]["schema"]["items"]["$ref"].endswith("/TaskResponse")
+
+
+async def test_build_task_response_matches_validated_model(client: AsyncClient, db_session):
+    """Skipping validation in build_task_response yields the same model as validating the ORM row."""
+    from backend.src.api.tasks import build_task_response
+    from backend.src.repositories.task_repository import TaskRepository
+    from backend.src.schemas import TaskResponse
+
+    project, phase = await create_project_and_phase(db_session)
+    created = await client.post(
+        "/api/v1/tasks/",
+        json={
+            "project_id": str(project.id),
+            "phase_id": str(phase.id),
+            "title": "Task",
+            "description": "desc",
+            "priority": "critical",
+            "depends_on": [],
+            "worker_prompt": "work",
+            "qa_prompt": "check",
+        },
+    )
+
+    task = await TaskRepository(db_session).get_by_id(uuid.UUID(created.json()["id"]))
+    built = build_task_response(task)
+
+    assert built == TaskResponse.model_validate(task)
+    assert built.model_dump(mode="json") == created.json()
+
+
+async def test_build_task_response_never_lazy_loads_dependencies(client: AsyncClient, db_session):
+    """Without dep_ids an unloaded depends_on is an error, not a hidden per-task query."""
+    from backend.src.api.tasks import build_task_response
+    from backend.src.repositories.task_repository import TaskRepository
+
+    project, phase = await create_project_and_phase(db_session)
+    created = await client.post(
+        "/api/v1/tasks/",
+        json={
+            "project_id": str(project.id),
+            "phase_id": str(phase.id),
+            "title": "Task",
+            "description": "desc",
+            "priority": "low",
+            "depends_on": [],
+            "worker_prompt": "work",
+            "qa_prompt": "check",
+        },
+    )
+    task_id = uuid.UUID(created.json()["id"])
+    db_session.expunge_all()
+
+    task = await TaskRepository(db_session).get_by_id(task_id, load_depends=False)
+
+    with pytest.raises(RuntimeError, match="not loaded"):
+        build_task_response(task)
+    assert build_task_response(task, []).depends_on == []
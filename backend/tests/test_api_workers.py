@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest_asyncio
@@ -37,6 +38,7 @@ async def mock_redis() -> AsyncMock:
     r.set = AsyncMock()
     r.get = AsyncMock(return_value=None)
     r.delete = AsyncMock()
+    r.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
     r.scan_iter = MagicMock(return_value=_async_iter([]))
     return r
 
@@ -104,10 +106,12 @@ async def test_register_worker_success(
     assert data["consumer_groups"]["workers"] == "workers"
     assert data["consumer_groups"]["reviewers"] == "reviewers"
 
-    # Redis should have been called
-    mock_redis.hset.assert_called_once()
-    mock_redis.expire.assert_called_once()
-    mock_redis.set.assert_called_once()
+    # Redis writes went out in one pipeline
+    pipe = mock_redis.pipeline.return_value
+    pipe.hset.assert_called_once()
+    pipe.expire.assert_called_once()
+    pipe.set.assert_called_once()
+    pipe.execute.assert_awaited_once()
 
 
 async def test_register_worker_auto_name(
@@ -343,6 +347,9 @@ async def test_heartbeat_with_valid_token(api_client: AsyncClient, mock_redis: A
     mock_redis.get.return_value = worker_id
     # worker exists
     mock_redis.exists.return_value = 1
+    mock_redis.hget.return_value = "idle"
+    # heartbeat: the script found and renewed the worker hash
+    mock_redis.eval.return_value = 1
     # get_worker data
     mock_redis.hgetall.return_value = {
         "id": worker_id,
@@ -408,6 +415,51 @@ async def test_heartbeat_token_mismatch(api_client: AsyncClient, mock_redis: Asy
     assert "Token does not match" in response.json()["detail"]
 
 
+def _token_lookups(mock_redis: AsyncMock) -> int:
+    """Number of resolve_token reads that reached Redis."""
+    return sum(1 for c in mock_redis.get.call_args_list if c.args[0].startswith("worker:token:"))
+
+
+async def test_heartbeat_caches_resolved_token(api_client: AsyncClient, mock_redis: AsyncMock) -> None:
+    """A second heartbeat with the same token is authenticated without a Redis lookup."""
+    worker_id = str(uuid.uuid4())
+    mock_redis.get.return_value = worker_id
+    mock_redis.hget.return_value = "idle"
+    # heartbeat: the script found and renewed the worker hash
+    mock_redis.eval.return_value = 1
+    mock_redis.hgetall.return_value = {"id": worker_id, "status": "idle"}
+
+    for _ in range(2):
+        response = await api_client.post(
+            f"/api/v1/workers/{worker_id}/heartbeat",
+            headers={"Authorization": "Bearer cached-token"},
+        )
+        assert response.status_code == 200
+
+    assert _token_lookups(mock_redis) == 1
+
+
+async def test_deregister_invalidates_cached_token(api_client: AsyncClient, mock_redis: AsyncMock) -> None:
+    """After DELETE /api/workers/{id} the worker's cached token is no longer accepted."""
+    worker_id = str(uuid.uuid4())
+    mock_redis.get.return_value = worker_id
+    mock_redis.hget.return_value = "idle"
+    # heartbeat: the script found and renewed the worker hash
+    mock_redis.eval.return_value = 1
+    mock_redis.hgetall.return_value = {"id": worker_id, "status": "idle"}
+    headers = {"Authorization": "Bearer revoked-token"}
+
+    response = await api_client.post(f"/api/v1/workers/{worker_id}/heartbeat", headers=headers)
+    assert response.status_code == 200
+
+    await api_client.delete(f"/api/v1/workers/{worker_id}")
+    mock_redis.get.return_value = None  # token deleted from Redis
+
+    response = await api_client.post(f"/api/v1/workers/{worker_id}/heartbeat", headers=headers)
+    assert response.status_code == 401
+    assert _token_lookups(mock_redis) == 2
+
+
 # ── GET /api/workers ─────────────────────────────────────────────────────
 
 
@@ -478,7 +530,7 @@ async def test_deregister_worker(api_client: AsyncClient, mock_redis: AsyncMock)
     data = response.json()
     assert data["detail"] == "Worker deregistered"
     assert data["worker_id"] == worker_id
-    assert mock_redis.delete.call_count == 2  # worker hash + token key
+    assert mock_redis.pipeline.return_value.delete.call_count == 2  # worker hash + token key
 
 
 # ── DB upsert on register ───────────────────────────────────────────────
@@ -555,3 +607,32 @@ async def test_re_register_updates_db_worker(
     assert len(all_workers) == 1
     assert all_workers[0].name == "new-name"
     assert all_workers[0].platform == "darwin"
+
+
+# ── GET /api/v1/registration-tokens ──────────────────────────────────────
+
+
+async def test_list_registration_tokens_pages_through_equal_timestamps(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Paging with (before, before_id) returns every token, even when created_at ties across a boundary."""
+    created_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    ids = sorted((uuid.uuid4() for _ in range(5)), reverse=True)
+    for i, token_id in enumerate(ids):
+        db_session.add(
+            models.RegistrationToken(id=token_id, token=f"glrt-page-{i}", name=f"t{i}", created_at=created_at)
+        )
+    await db_session.commit()
+
+    seen: list[str] = []
+    params: dict = {"limit": 2}
+    while True:
+        response = await api_client.get("/api/v1/registration-tokens", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(token["id"] for token in page)
+        if len(page) < 2:
+            break
+        params = {"limit": 2, "before": page[-1]["created_at"], "before_id": page[-1]["id"]}
+
+    assert seen == [str(token_id) for token_id in ids]
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backend.src.api.board import _board_event_generator, _build_task_response, _get_board_data
+from backend.src.api.board import _board_event_generator, _get_board_data, board_events
+from backend.src.api.tasks import build_task_response
 from backend.src.main import app
+from backend.src.queue.board_events import BoardEventHub
 from backend.src.models import Phase, PhaseStatus, Project, ProjectStatus, Task, TaskPriority, TaskStatus
+from backend.src.schemas import TaskResponse
 
 
 async def create_project_phase_task(db_session, status: TaskStatus = TaskStatus.ready) -> tuple[Project, Phase, Task]:
@@ -276,95 +281,172 @@ async def test_get_board_workers(client, db_session, mock_redis):
 # -- SSE Board Events ----------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_board_event_generator_yields_matching_events():
-    """_board_event_generator should yield events matching the project_id."""
-    project_id = str(uuid.uuid4())
-    other_project_id = str(uuid.uuid4())
-
+def _hub_redis(xread, newest_entries: list | None = None) -> AsyncMock:
+    """Mock Redis for BoardEventHub: ``xread`` plus the XREVRANGE pipeline that picks the start id."""
     mock_redis = AsyncMock()
+    mock_redis.xread = xread
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[newest_entries or []])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return mock_redis
 
-    # Simulate xread returning messages: one matching, one not
-    call_count = 0
 
-    async def mock_xread(**kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
+@pytest.mark.asyncio
+async def test_board_event_generator_yields_project_events():
+    """_board_event_generator should yield events from the project's own board stream."""
+    project_id = str(uuid.uuid4())
+    streams_read: list[dict] = []
+    idle = asyncio.Event()
+
+    async def mock_xread(streams, block):
+        streams_read.append(streams)
+        assert block == 0
+        if len(streams_read) == 1:
             return [
                 (
-                    "events:board",
-                    [
-                        ("1-0", {"project_id": project_id, "event": "task_transition", "task_id": "t1"}),
-                        ("2-0", {"project_id": other_project_id, "event": "task_transition", "task_id": "t2"}),
-                    ],
+                    f"events:board:{project_id}",
+                    [("1-0", {"project_id": project_id, "event": "task_transition", "task_id": "t1"})],
                 )
             ]
-        # After first call, raise CancelledError to stop the generator
-        raise asyncio.CancelledError()
+        await idle.wait()
+        return []
 
-    mock_redis.xread = mock_xread
+    hub = BoardEventHub(_hub_redis(mock_xread))
 
-    events: list[dict] = []
-    try:
-        async for event in _board_event_generator(project_id, mock_redis):
-            events.append(event)
-    except asyncio.CancelledError:
-        pass
+    events = _board_event_generator(project_id, hub)
+    event = await asyncio.wait_for(events.__anext__(), timeout=1)
+    await events.aclose()
+    await hub.close()
 
-    # Only the matching event should be yielded
-    assert len(events) == 1
-    assert "event" not in events[0]  # no named SSE event key — sent as unnamed message
-    data = json.loads(events[0]["data"])
+    # An empty stream is read from "0-0", never from "$"
+    assert streams_read[0] == {f"events:board:{project_id}": "0-0"}
+    assert streams_read[1] == {f"events:board:{project_id}": "1-0"}
+    assert "event" not in event  # no named SSE event key — sent as unnamed message
+    data = json.loads(event["data"])
     assert data["event"] == "task_transition"
     assert data["task_id"] == "t1"
     assert data["project_id"] == project_id
 
 
 @pytest.mark.asyncio
-async def test_board_event_generator_handles_empty_xread():
-    """_board_event_generator should handle empty xread responses gracefully."""
+async def test_board_event_hub_shares_one_reader_per_project():
+    """Subscribers of the same project share one reader that stops with the last subscriber."""
     project_id = str(uuid.uuid4())
-    mock_redis = AsyncMock()
+    calls = 0
+    release = asyncio.Event()
 
-    call_count = 0
+    async def mock_xread(streams, block):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release.wait()
+            return [(f"events:board:{project_id}", [("1-0", {"project_id": project_id, "event": "e"})])]
+        await asyncio.Event().wait()
 
-    async def mock_xread(**kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count <= 2:
-            return []
-        raise asyncio.CancelledError()
+    hub = BoardEventHub(_hub_redis(mock_xread))
 
-    mock_redis.xread = mock_xread
+    async with hub.subscribe(project_id) as first, hub.subscribe(project_id) as second:
+        release.set()
+        first_payload = await asyncio.wait_for(first.get(), timeout=1)
+        second_payload = await asyncio.wait_for(second.get(), timeout=1)
+        reader = hub._readers[project_id]
 
-    events: list[dict] = []
-    try:
-        async for event in _board_event_generator(project_id, mock_redis):
-            events.append(event)
-    except asyncio.CancelledError:
-        pass
+    assert first_payload == second_payload
+    assert json.loads(first_payload)["event"] == "e"
+    assert calls == 2
+    await asyncio.sleep(0)
+    assert reader.cancelled()
+    assert project_id not in hub._readers
 
-    assert len(events) == 0
-    assert call_count == 3
 
 
 @pytest.mark.asyncio
-async def test_board_events_endpoint_returns_sse_response(client, db_session, mock_redis):
-    """GET /api/v1/board/{project_id}/events should return SSE content type."""
-    project, _phase, _task = await create_project_phase_task(db_session)
+async def test_board_event_hub_retries_from_the_resolved_start_id():
+    """After a failed first XREAD the reader retries from the stream's newest id, not "$"."""
+    project_id = str(uuid.uuid4())
+    streams_read: list[dict] = []
+
+    async def mock_xread(streams, block):
+        streams_read.append(dict(streams))
+        if len(streams_read) == 1:
+            raise ConnectionError("redis down")
+        await asyncio.Event().wait()
+
+    hub = BoardEventHub(_hub_redis(mock_xread, newest_entries=[("7-0", {})]))
 
-    # Configure mock_redis.xread to return empty then cancel
-    call_count = 0
+    with patch("backend.src.queue.board_events.READER_RETRY_DELAY", 0):
+        async with hub.subscribe(project_id):
+            while len(streams_read) < 2:
+                await asyncio.sleep(0)
+    await hub.close()
 
-    async def mock_xread(**kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            return []
+    assert streams_read == [{f"events:board:{project_id}": "7-0"}] * 2
+
+
+@pytest.mark.asyncio
+async def test_board_event_hub_drops_a_subscriber_that_never_drains():
+    """A full subscriber queue ends that subscriber's stream; other subscribers keep receiving."""
+    project_id = str(uuid.uuid4())
+    sent = 0
+    drained = asyncio.Semaphore(1)
+
+    async def mock_xread(streams, block):
+        # One event per read, released only once the draining subscriber took the previous one
+        nonlocal sent
+        if sent == 5:
+            await asyncio.Event().wait()
+        await drained.acquire()
+        sent += 1
+        return [(f"events:board:{project_id}", [(f"{sent}-0", {"project_id": project_id, "n": str(sent)})])]
+
+    hub = BoardEventHub(_hub_redis(mock_xread))
+
+    with patch("backend.src.queue.board_events.SUBSCRIBER_QUEUE_SIZE", 2):
+        async with hub.subscribe(project_id) as stalled, hub.subscribe(project_id) as reader:
+            received = []
+            for _ in range(5):
+                received.append(json.loads(await asyncio.wait_for(reader.get(), timeout=1))["n"])
+                drained.release()
+
+            # The stalled queue was cleared and closed instead of growing past its bound
+            assert stalled.qsize() == 1
+            assert stalled.get_nowait() is None
+            assert hub._subscribers[project_id] == {reader}
+    await hub.close()
+
+    assert received == ["1", "2", "3", "4", "5"]
+
+class _ClosedQueue:
+    async def get(self) -> str:
         raise asyncio.CancelledError()
 
-    mock_redis.xread = mock_xread
+
+class _ClosedHub:
+    @asynccontextmanager
+    async def subscribe(self, project_id: str):
+        yield _ClosedQueue()
+
+
+@pytest.mark.asyncio
+async def test_board_events_stream_is_not_run_in_threadpool():
+    """The SSE body must stay an async generator.
+
+    sse-starlette wraps sync iterators in iterate_in_threadpool, which would
+    cost a worker-thread hop (and a context copy) for every event.
+    """
+    request = MagicMock()
+    request.app.state.board_events = _ClosedHub()
+
+    response = await board_events(str(uuid.uuid4()), request)
+
+    assert inspect.isasyncgen(response.body_iterator)
+
+
+@pytest.mark.asyncio
+async def test_board_events_endpoint_returns_sse_response(client, db_session, mock_redis):
+    """GET /api/v1/board/{project_id}/events should return SSE content type."""
+    project, _phase, _task = await create_project_phase_task(db_session)
+    app.state.board_events = _ClosedHub()
 
     response = await client.get(f"/api/v1/board/{project.id}/events", headers={"Accept": "text/event-stream"})
 
@@ -374,35 +456,53 @@ async def test_board_events_endpoint_returns_sse_response(client, db_session, mo
 
 
 @pytest.mark.asyncio
-async def test_build_task_response_includes_all_fields(db_session):
-    """_build_task_response should map all Task fields to TaskResponse."""
-    project, phase, _task = await create_project_phase_task(db_session, status=TaskStatus.ready)
+async def test_board_entry_matches_task_response_json(db_session):
+    """Board entries should serialize exactly like TaskResponse.model_dump(mode="json")."""
+    project, phase, dep = await create_project_phase_task(db_session, status=TaskStatus.done)
 
     now = datetime.now(timezone.utc)
     task = Task(
         id=uuid.uuid4(), project_id=project.id, phase_id=phase.id,
-        title="T", status=TaskStatus.ready, priority=TaskPriority.high,
-        version=2, retry_count=1, max_retries=5,
-        branch_name="feat/x", commit_hash="abc123",
-        created_at=now, updated_at=now,
+        title="T", status=TaskStatus.in_progress, priority=TaskPriority.high,
+        version=3, worker_prompt={"prompt": "p"}, qa_feedback_history=[{"round": 1}],
+        created_at=now, updated_at=now, started_at=now,
     )
     db_session.add(task)
     await db_session.commit()
+    task_id, dep_id, project_id = task.id, dep.id, project.id
 
-    # Reload with eager loading via TaskRepository to avoid lazy-load issues
     from backend.src.repositories.task_repository import TaskRepository
     repo = TaskRepository(db_session)
-    loaded_task = await repo.get_by_id(task.id)
-
-    resp = _build_task_response(loaded_task)
-
-    assert resp.id == task.id
-    assert resp.title == "T"
-    assert resp.status.value == "ready"
-    assert resp.priority.value == "high"
-    assert resp.version == 2
-    assert resp.retry_count == 1
-    assert resp.max_retries == 5
-    assert resp.branch_name == "feat/x"
-    assert resp.commit_hash == "abc123"
-    assert resp.depends_on == []
+    await repo.add_dependencies(task_id, [dep_id])
+    await db_session.commit()
+    db_session.expire_all()
+    loaded_task = await db_session.get(Task, task_id)
+
+    data = await _get_board_data(str(project_id), db_session, AsyncMock())
+
+    expected = build_task_response(loaded_task, [dep_id]).model_dump(mode="json")
+    assert data["columns"]["in_progress"]["tasks"] == [expected]
+    assert expected["depends_on"] == [str(dep_id)]
+    assert list(expected) == list(TaskResponse.model_fields)
+
+
+@pytest.mark.asyncio
+async def test_board_stats_count_all_tasks_when_list_is_truncated(db_session, monkeypatch):
+    """Stats should still cover every task when the board's task list hits its limit."""
+    project, phase, _task = await create_project_phase_task(db_session, status=TaskStatus.ready)
+    now = datetime.now(timezone.utc)
+    for i in range(2):
+        db_session.add(Task(
+            id=uuid.uuid4(), project_id=project.id, phase_id=phase.id,
+            title=f"Done {i}", status=TaskStatus.done, priority=TaskPriority.low,
+            version=1, created_at=now, updated_at=now,
+        ))
+    await db_session.commit()
+
+    monkeypatch.setattr("backend.src.api.board.BOARD_TASK_LIMIT", 2)
+    data = await _get_board_data(str(project.id), db_session, AsyncMock())
+
+    assert sum(len(column["tasks"]) for column in data["columns"].values()) == 2
+    assert data["stats"]["total"] == 3
+    assert data["stats"]["ready"] == 1
+    assert data["stats"]["done"] == 2
@@ -148,6 +148,37 @@ class TestAddMessage:
 
         assert msg.message_type == MessageType.chat
 
+    async def test_chat_only_filters_and_orders_in_sql(self, db_session):
+        """chat_only loads only chat messages, oldest first, for get_by_id and list_sessions."""
+        session = await _create_session(db_session)
+        session_id = session.id
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for minute, message_type, content in [
+            (2, MessageType.chat, "second"),
+            (3, MessageType.internal, "finalize prompt"),
+            (1, MessageType.chat, "first"),
+        ]:
+            db_session.add(
+                DesignMessage(
+                    session_id=session_id,
+                    role=MessageRole.user,
+                    content=content,
+                    message_type=message_type,
+                    created_at=base.replace(minute=minute),
+                )
+            )
+        await db_session.commit()
+        db_session.expire_all()
+
+        repo = DesignSessionRepository(db_session)
+        loaded = await repo.get_by_id(session_id, chat_only=True)
+        assert loaded is not None
+        assert [m.content for m in loaded.messages] == ["first", "second"]
+
+        db_session.expire_all()
+        sessions = await repo.list_sessions(chat_only=True)
+        assert [m.content for m in sessions[0].messages] == ["first", "second"]
+
 
 class TestAddAndCommit:
     """Tests for DesignSessionRepository.add and commit."""
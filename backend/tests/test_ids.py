@@ -0,0 +1,43 @@
+"""Tests for time-ordered identifier generation."""
+
+import time
+import uuid
+from unittest.mock import patch
+
+from backend.src.utils.ids import uuid7
+
+
+class TestUuid7:
+    def test_version_and_variant(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_current_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_sorts_by_creation_time(self):
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+
+    def test_unique(self):
+        assert len({uuid7() for _ in range(1000)}) == 1000
+
+    def test_monotonic_within_one_millisecond(self):
+        with patch("backend.src.utils.ids.time.time_ns", return_value=time.time_ns()):
+            values = [uuid7() for _ in range(1000)]
+        assert values == sorted(values)
+        assert len(set(values)) == 1000
+        assert all(value.version == 7 and value.variant == uuid.RFC_4122 for value in values)
+
+    def test_monotonic_when_clock_steps_back(self):
+        first = uuid7()
+        with patch("backend.src.utils.ids.time.time_ns", return_value=0):
+            second = uuid7()
+        assert first < second
+        assert second.int >> 80 == first.int >> 80
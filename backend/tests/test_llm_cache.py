@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import redis.asyncio as redis
+
+from backend.src.core.llm_cache import StructuredOutputCache
+from backend.src.core.llm_client import (
+    LLMClient,
+    LLMConfig,
+    LLMError,
+    close_llm_clients,
+    configure_structured_output_cache,
+    get_llm_client,
+)
+
+MESSAGES = [{"role": "user", "content": "Decompose"}]
+RESPONSE_FORMAT = {"type": "json_object"}
+
+
+def _make_stream(text: str):
+    async def stream():
+        for char in text:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = char
+            yield chunk
+    return stream()
+
+
+@pytest.fixture
+def mock_redis() -> AsyncMock:
+    r = AsyncMock()
+    r.get = AsyncMock(return_value=None)
+    r.set = AsyncMock()
+    return r
+
+
+# -- StructuredOutputCache ----------------------------------------------------
+
+
+class TestStructuredOutputCache:
+    def test_key_ignores_dict_order_but_not_values(self) -> None:
+        """Keys are canonical over dict ordering and differ for any changed field."""
+        key = StructuredOutputCache.make_key("m", {"a": 1, "b": 2}, MESSAGES)
+        assert key == StructuredOutputCache.make_key("m", {"b": 2, "a": 1}, MESSAGES)
+        assert key != StructuredOutputCache.make_key("m", {"a": 1, "b": 3}, MESSAGES)
+        # Length prefixes keep field boundaries distinct
+        assert StructuredOutputCache.make_key("ab", "c") != StructuredOutputCache.make_key("a", "bc")
+
+    async def test_set_then_get_writes_redis_with_ttl(self, mock_redis: AsyncMock) -> None:
+        """set() stores the encoded result in Redis with the TTL; get() then serves it in-process."""
+        cache = StructuredOutputCache(mock_redis, ttl=600)
+        await cache.set("k", {"tasks": [1]})
+
+        mock_redis.set.assert_awaited_once_with("llm:so:k", b'{"tasks":[1]}', ex=600)
+        assert await cache.get("k") == {"tasks": [1]}
+        mock_redis.get.assert_not_awaited()
+
+    async def test_hits_return_independent_copies(self) -> None:
+        """Mutating a returned result does not change what later hits see."""
+        cache = StructuredOutputCache(None, ttl=600)
+        await cache.set("k", {"tasks": [1]})
+
+        first = await cache.get("k")
+        assert first is not None
+        first["tasks"].append(2)
+        assert await cache.get("k") == {"tasks": [1]}
+
+    async def test_redis_hit_is_kept_locally(self, mock_redis: AsyncMock) -> None:
+        """A result found in Redis is served from memory on the next lookup."""
+        mock_redis.get.return_value = '{"ok": true}'
+        cache = StructuredOutputCache(mock_redis, ttl=600)
+
+        assert await cache.get("k") == {"ok": True}
+        assert await cache.get("k") == {"ok": True}
+        mock_redis.get.assert_awaited_once_with("llm:so:k")
+
+    async def test_local_lru_evicts_oldest(self) -> None:
+        """Only the ``local_size`` most recently used entries stay in-process."""
+        cache = StructuredOutputCache(None, ttl=600, local_size=2)
+        await cache.set("a", {"n": 1})
+        await cache.set("b", {"n": 2})
+        await cache.get("a")
+        await cache.set("c", {"n": 3})
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"n": 1}
+        assert await cache.get("c") == {"n": 3}
+
+    async def test_expired_local_entry_is_a_miss(self) -> None:
+        """Entries older than the TTL are not served."""
+        cache = StructuredOutputCache(None, ttl=60)
+        with patch("backend.src.core.llm_cache.time.monotonic", return_value=1000.0):
+            await cache.set("k", {"n": 1})
+        with patch("backend.src.core.llm_cache.time.monotonic", return_value=1061.0):
+            assert await cache.get("k") is None
+
+    async def test_redis_errors_are_misses(self, mock_redis: AsyncMock) -> None:
+        """A Redis failure never fails the caller."""
+        mock_redis.get.side_effect = redis.ConnectionError("down")
+        mock_redis.set.side_effect = redis.ConnectionError("down")
+        cache = StructuredOutputCache(mock_redis, ttl=600, local_size=0)
+
+        assert await cache.get("k") is None
+        await cache.set("k", {"n": 1})
+
+    async def test_non_object_payload_is_a_miss(self, mock_redis: AsyncMock) -> None:
+        """Stored values that are not a JSON object are ignored."""
+        mock_redis.get.return_value = "[1, 2]"
+        cache = StructuredOutputCache(mock_redis, ttl=600)
+        assert await cache.get("k") is None
+
+
+# -- LLMClient.structured_output with a cache ---------------------------------
+
+
+class TestStructuredOutputCaching:
+    @pytest.fixture
+    def client(self) -> LLMClient:
+        return LLMClient(LLMConfig(api_key="sk-test", model="gpt-4o"), StructuredOutputCache(None, ttl=600))
+
+    async def test_identical_request_skips_llm(self, client: LLMClient) -> None:
+        """The second identical request is answered from the cache."""
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_ac:
+            mock_ac.return_value = _make_stream('{"tasks": []}')
+            first = await client.structured_output(messages=MESSAGES, response_format=RESPONSE_FORMAT)
+            second = await client.structured_output(messages=MESSAGES, response_format=RESPONSE_FORMAT)
+
+        assert first == second == {"tasks": []}
+        mock_ac.assert_awaited_once()
+
+    async def test_different_options_miss(self, client: LLMClient) -> None:
+        """A change to the messages or sampling options is a different request."""
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_ac:
+            mock_ac.side_effect = lambda **kwargs: _make_stream('{"n": 1}')
+            await client.structured_output(messages=MESSAGES, response_format=RESPONSE_FORMAT)
+            await client.structured_output(messages=MESSAGES, response_format=RESPONSE_FORMAT, temperature=0.9)
+            await client.structured_output(
+                messages=[{"role": "user", "content": "Other"}], response_format=RESPONSE_FORMAT
+            )
+
+        assert mock_ac.await_count == 3
+
+    async def test_unparseable_output_is_not_cached(self, client: LLMClient) -> None:
+        """A response that fails to parse is retried against the LLM next time."""
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_ac:
+            mock_ac.side_effect = [_make_stream("not json"), _make_stream('{"ok": true}')]
+            with pytest.raises(LLMError, match="Failed to parse"):
+                await client.structured_output(messages=MESSAGES, response_format=RESPONSE_FORMAT)
+            result = await client.structured_output(messages=MESSAGES, response_format=RESPONSE_FORMAT)
+
+        assert result == {"ok": True}
+        assert mock_ac.await_count == 2
+
+
+async def test_configured_cache_reaches_shared_clients() -> None:
+    """Clients from get_llm_client() use the configured cache until shutdown drops it."""
+    cache = StructuredOutputCache(None, ttl=600)
+    config = LLMConfig(api_key="sk-cache", model="gpt-4o")
+    configure_structured_output_cache(cache)
+    try:
+        assert get_llm_client(config).cache is cache
+    finally:
+        await close_llm_clients()
+    assert get_llm_client(config).cache is None
+    await close_llm_clients()
@@ -9,9 +9,12 @@ from backend.src.core.llm_client import (
     LLMClient,
     LLMConfig,
     LLMError,
+    _fenced_block,
     _is_retryable,
+    close_llm_clients,
     create_llm_client,
     create_llm_client_from_project,
+    get_llm_client,
 )
 
 
@@ -277,6 +280,84 @@ class TestLLMClientStructuredOutput:
                     response_format={"type": "json_object"},
                 )
 
+    async def test_structured_output_raises_on_invalid_fenced_json(self, client: LLMClient) -> None:
+        """A malformed fenced block still surfaces as LLMError, not a raw orjson error."""
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = self._make_stream('```json\n{"tasks": [}\n```')
+
+            with pytest.raises(LLMError, match="Failed to parse structured output as JSON"):
+                await client.structured_output(
+                    messages=[{"role": "user", "content": "Test"}],
+                    response_format={"type": "json_object"},
+                )
+
+    async def test_structured_output_parses_json_wrapped_in_prose(self, client: LLMClient) -> None:
+        """structured_output() should find a JSON object surrounded by prose and no code fence."""
+        text = 'Here is the plan:\n{"tasks": [{"title": "Task 1"}]}\nLet me know if you need changes.'
+
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = self._make_stream(text)
+            result = await client.structured_output(
+                messages=[{"role": "user", "content": "Decompose"}],
+                response_format={"type": "json_object"},
+            )
+
+        assert result == {"tasks": [{"title": "Task 1"}]}
+
+    async def test_structured_output_prefers_fenced_block(self, client: LLMClient) -> None:
+        """A fenced JSON block still wins over other braces in the response."""
+        text = 'Using {placeholders} below.\n```json\n{"count": 2}\n```'
+
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = self._make_stream(text)
+            result = await client.structured_output(
+                messages=[{"role": "user", "content": "Count"}],
+                response_format={"type": "json_object"},
+            )
+
+        assert result == {"count": 2}
+
+    async def test_structured_output_two_stage_with_parsing_model(self, config: LLMConfig) -> None:
+        """With a parsing model the primary model answers freely and the parsing model emits the JSON."""
+        client = LLMClient(config.model_copy(update={"parsing_model": "gpt-4o-mini"}))
+        messages = [{"role": "user", "content": "Decompose"}]
+        response_format = {"type": "json_object"}
+
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = [
+                self._make_stream("Two tasks: build the API, then test it."),
+                self._make_stream('{"tasks": ["build", "test"]}'),
+            ]
+            result = await client.structured_output(messages=messages, response_format=response_format)
+
+        assert result == {"tasks": ["build", "test"]}
+        draft_call, reshape_call = mock_acompletion.await_args_list
+        assert draft_call.kwargs["model"] == "gpt-4o"
+        assert draft_call.kwargs["messages"] == messages
+        assert draft_call.kwargs["response_format"] is None
+        assert reshape_call.kwargs["model"] == "gpt-4o-mini"
+        assert reshape_call.kwargs["response_format"] == response_format
+        assert reshape_call.kwargs["messages"][-1] == {
+            "role": "user", "content": "Two tasks: build the API, then test it.",
+        }
+
+    async def test_reshape_prompt_includes_json_schema(self, client: LLMClient) -> None:
+        """A json_schema response format puts its schema in the parsing model's instructions."""
+        schema = {"type": "object", "properties": {"tasks": {"type": "array"}}}
+        response_format = {"type": "json_schema", "json_schema": {"name": "plan", "schema": schema}}
+
+        with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = [self._make_stream("no tasks"), self._make_stream('{"tasks": []}')]
+            await client.structured_output(
+                messages=[{"role": "user", "content": "Plan"}],
+                response_format=response_format,
+                parsing_model="gpt-4o-mini",
+            )
+
+        system_message = mock_acompletion.await_args_list[1].kwargs["messages"][0]
+        assert system_message["role"] == "system"
+        assert '"properties":{"tasks":{"type":"array"}}' in system_message["content"]
+
     async def test_structured_output_raises_llm_error_on_exception(self, client: LLMClient) -> None:
         """structured_output() should wrap litellm exceptions in LLMError."""
         with patch("backend.src.core.llm_client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
@@ -324,6 +405,24 @@ class TestCreateLLMClient:
         assert client.config.model == "gpt-4o-mini"
 
 
+# -- get_llm_client ------------------------------------------------------------
+
+
+class TestGetLLMClient:
+    async def test_reuses_client_for_same_config(self) -> None:
+        """get_llm_client should return one shared client per (api_key, model, base_url)."""
+        await close_llm_clients()
+        first = get_llm_client(LLMConfig(api_key="sk-shared-1234", model="gpt-4o-mini"))
+        second = get_llm_client(LLMConfig(api_key="sk-shared-1234", model="gpt-4o-mini"))
+        other = get_llm_client(LLMConfig(api_key="sk-shared-1234", model="gpt-4o"))
+
+        assert first is second
+        assert other is not first
+
+        await close_llm_clients()
+        assert get_llm_client(LLMConfig(api_key="sk-shared-1234", model="gpt-4o-mini")) is not first
+
+
 # -- create_llm_client_from_project --------------------------------------------
 
 
@@ -495,6 +594,10 @@ class TestIsRetryable:
     def test_429_is_retryable(self) -> None:
         assert _is_retryable(Exception("429 too many requests")) is True
 
+    def test_match_ignores_case(self) -> None:
+        assert _is_retryable(Exception("RateLimitError: RATE_LIMIT exceeded")) is True
+        assert _is_retryable(Exception("Connection TimeOut")) is True
+
     def test_auth_error_not_retryable(self) -> None:
         assert _is_retryable(Exception("AuthenticationError: invalid API key")) is False
 
@@ -502,6 +605,23 @@ class TestIsRetryable:
         assert _is_retryable(Exception("Model not found")) is False
 
 
+# -- _fenced_block ----------------------------------------------------------------
+
+
+class TestFencedBlock:
+    def test_json_and_bare_fences(self) -> None:
+        assert _fenced_block('```json\n{"a": 1}\n```') == '{"a": 1}'
+        assert _fenced_block('Here:\n```\n{"a": 1}\n```\nDone.') == '{"a": 1}'
+
+    def test_other_language_header_is_not_a_json_fence(self) -> None:
+        assert _fenced_block('```python\nprint(1)\n') is None
+        assert _fenced_block('Use ```python``` or:\n```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_unclosed_or_missing_fence(self) -> None:
+        assert _fenced_block('```json\n{"a": 1}') is None
+        assert _fenced_block('no fences {"a": 1}') is None
+
+
 # -- Retry tests ------------------------------------------------------------------
 
 
@@ -6,8 +6,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backend.src.core.orchestrator import PMOrchestrator
+from backend.src.core.orchestrator import SCHEDULING_BLOCK_MS, PMOrchestrator
 from backend.src.models import Task, TaskPriority, TaskStatus
+from backend.src.queue.streams import RedisStreamManager
 from backend.src.repositories.task_repository import PRIORITY_ORDER
 
 
@@ -707,8 +708,7 @@ async def test_process_escalation_phase_redesign(
     mock_task_repo.list_incomplete_in_phase = AsyncMock(return_value=[task, other_task])
     mock_task_repo.list_done_in_phase = AsyncMock(return_value=[])
     mock_task_repo.hard_delete_many = AsyncMock(return_value=1)
-    mock_task_repo.clear_dependencies = AsyncMock()
-    mock_task_repo.add_dependencies = AsyncMock()
+    mock_task_repo.replace_dependencies = AsyncMock()
 
     with (
         patch("backend.src.core.orchestrator.TaskRepository") as MockTaskRepo,
@@ -992,8 +992,7 @@ async def test_process_escalation_tool_error_proceeds_with_redesign(
     mock_task_repo.list_incomplete_in_phase = AsyncMock(return_value=[task])
     mock_task_repo.list_done_in_phase = AsyncMock(return_value=[])
     mock_task_repo.hard_delete_many = AsyncMock(return_value=0)
-    mock_task_repo.clear_dependencies = AsyncMock()
-    mock_task_repo.add_dependencies = AsyncMock()
+    mock_task_repo.replace_dependencies = AsyncMock()
 
     with (
         patch("backend.src.core.orchestrator.TaskRepository") as MockTaskRepo,
@@ -1380,11 +1379,19 @@ async def test_promote_waiting_tasks_commits_on_success(
     mock_session_ctx.__aexit__ = AsyncMock(return_value=False)
     db_session_factory = MagicMock(return_value=mock_session_ctx)
 
+    event = ("task_transition", {"project_id": str(project_id)})
+
+    async def buffer_event(_project_id, _db, event_buffer):
+        event_buffer.append(event)
+
     with patch.object(orchestrator, "_promote_waiting_tasks_inner", new_callable=AsyncMock) as mock_inner:
+        mock_inner.side_effect = buffer_event
         await orchestrator._promote_waiting_tasks(project_id, db_session_factory)
 
-    mock_inner.assert_called_once_with(project_id, mock_db)
+    mock_inner.assert_called_once_with(project_id, mock_db, [event])
     mock_db.commit.assert_called_once()
+    # Buffered board events are flushed in one batch after the commit
+    orchestrator.stream_manager.publish_board_events.assert_called_once_with([event])
 
 
 async def test_promote_waiting_tasks_handles_error(
@@ -1404,6 +1411,65 @@ async def test_promote_waiting_tasks_handles_error(
         await orchestrator._promote_waiting_tasks(project_id, db_session_factory)
 
 
+# -- _scheduling_loop: event-driven wake-ups -----------------------------------
+
+
+def _session_factory() -> MagicMock:
+    mock_session_ctx = AsyncMock()
+    mock_session_ctx.__aenter__ = AsyncMock(return_value=AsyncMock())
+    mock_session_ctx.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=mock_session_ctx)
+
+
+async def test_scheduling_loop_waits_on_event_streams(orchestrator: PMOrchestrator, mock_stream: AsyncMock) -> None:
+    """After a pass the loop blocks on the board stream and tasks:events from positions taken before it."""
+    project_id = uuid.uuid4()
+    streams = [RedisStreamManager.board_stream(str(project_id)), RedisStreamManager.TASKS_EVENTS]
+    ids = {stream: "0-0" for stream in streams}
+    mock_stream.last_entry_ids = AsyncMock(return_value=ids)
+
+    async def stop_after_wait(last_ids, block):
+        orchestrator._running = False
+        return 1
+
+    mock_stream.wait_for_entries = AsyncMock(side_effect=stop_after_wait)
+    orchestrator._running = True
+
+    with (
+        patch("backend.src.core.orchestrator.TaskRepository") as MockRepo,
+        patch("backend.src.core.orchestrator.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        MockRepo.return_value.count_active_tasks = AsyncMock(return_value=1)
+        await orchestrator._scheduling_loop(project_id, _session_factory())
+
+    mock_stream.last_entry_ids.assert_awaited_once_with(streams)
+    mock_stream.wait_for_entries.assert_awaited_once_with(ids, block=SCHEDULING_BLOCK_MS)
+    mock_sleep.assert_not_awaited()
+
+
+async def test_scheduling_loop_backs_off_without_stream_positions(
+    orchestrator: PMOrchestrator, mock_stream: AsyncMock
+) -> None:
+    """If Redis cannot report stream positions the loop sleeps and retries instead of spinning."""
+    mock_stream.last_entry_ids = AsyncMock(side_effect=ConnectionError("redis down"))
+    mock_stream.wait_for_entries = AsyncMock()
+    orchestrator._running = True
+
+    async def stop_sleep(_delay):
+        orchestrator._running = False
+
+    with (
+        patch("backend.src.core.orchestrator.TaskRepository") as MockRepo,
+        patch("backend.src.core.orchestrator.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        MockRepo.return_value.count_active_tasks = AsyncMock(return_value=1)
+        mock_sleep.side_effect = stop_sleep
+        await orchestrator._scheduling_loop(uuid.uuid4(), _session_factory())
+
+    mock_sleep.assert_awaited_once()
+    mock_stream.wait_for_entries.assert_not_awaited()
+
+
 # -- _process_result: commit_hash storage -------------------------------------
 
 
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import pytest
 
-from backend.src.prompts.loader import get_prompt, load_prompts, _cache
+from backend.src.prompts.loader import get_prompt, load_prompts, _cache, _prompt_cache
 
 
 @pytest.fixture(autouse=True)
 def _clear_cache():
-    """Clear the prompt cache before each test."""
+    """Clear the prompt caches before each test."""
     _cache.clear()
+    _prompt_cache.clear()
     yield
     _cache.clear()
+    _prompt_cache.clear()
 
 
 class TestLoadPrompts:
@@ -53,6 +55,9 @@ class TestGetPrompt:
         assert "{phase_name}" in prompt
         assert "{request_text}" in prompt
 
+    def test_get_prompt_cached(self):
+        assert get_prompt("architect", "system") is get_prompt("architect", "system")
+
     def test_get_prompt_strips_whitespace(self):
         prompt = get_prompt("architect", "system")
         assert not prompt.startswith("\n")
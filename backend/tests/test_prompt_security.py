@@ -1,9 +1,12 @@
+import hashlib
+import hmac
+import json
 import time
 from unittest.mock import patch
 
 import pytest
 
-from backend.src.core.prompt_security import PromptSigner
+from backend.src.core.prompt_security import SIGNATURE_VERSION, PromptSigner
 
 SECRET_KEY = "test-secret-key-for-testing"
 
@@ -35,6 +38,12 @@ def test_verify_valid_signature(signer: PromptSigner) -> None:
     assert signer.verify(signed) is True
 
 
+def test_verify_non_ascii_prompt(signer: PromptSigner) -> None:
+    """Prompts outside ASCII sign and verify like any other text."""
+    signed = signer.sign("작업을 분해해 주세요 — ünïcode ✓")
+    assert signer.verify(signed) is True
+
+
 def test_verify_tampered_prompt(signer: PromptSigner) -> None:
     """Changing prompt text after signing fails verification."""
     signed = signer.sign("Original prompt")
@@ -124,3 +133,55 @@ def test_different_keys_fail() -> None:
 
     signed = signer1.sign("Cross-key test")
     assert signer2.verify(signed) is False
+
+
+
+def _legacy_sign(prompt: str, nonce: str, timestamp: int) -> str:
+    payload = json.dumps({"prompt": prompt, "nonce": nonce, "timestamp": timestamp}, sort_keys=True)
+    return hmac.new(SECRET_KEY.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+def test_signature_matches_fresh_hmac(signer: PromptSigner) -> None:
+    """The MAC covers the length-prefixed pre-image and matches a fresh hmac.new() each time."""
+    for prompt in ("first", "second"):
+        signed = signer.sign(prompt)
+        assert signed["version"] == SIGNATURE_VERSION
+        nonce = signed["nonce"].encode()
+        payload = (
+            len(prompt).to_bytes(8, "big") + prompt.encode()
+            + len(nonce).to_bytes(8, "big") + nonce
+            + signed["timestamp"].to_bytes(8, "big")
+        )
+        expected = hmac.new(SECRET_KEY.encode(), payload, hashlib.sha256).hexdigest()
+        assert signed["signature"] == expected
+
+
+def test_verify_field_boundaries_are_bound(signer: PromptSigner) -> None:
+    """Moving characters between prompt and nonce invalidates the signature."""
+    signed = signer.sign("prompt")
+    shifted = {**signed, "prompt": "promp", "nonce": "t" + signed["nonce"]}
+    assert signer.verify(shifted) is False
+
+
+def test_verify_unversioned_legacy_signature(signer: PromptSigner) -> None:
+    """Prompts signed before the version field existed still verify."""
+    timestamp = int(time.time())
+    signed = {
+        "prompt": "Legacy prompt",
+        "nonce": "n-1",
+        "timestamp": timestamp,
+        "signature": _legacy_sign("Legacy prompt", "n-1", timestamp),
+    }
+    assert signer.verify(signed) is True
+    # Non-ASCII prompts were signed over their \uXXXX-escaped JSON form
+    unicode_signed = {**signed, "prompt": "프롬프트 é", "signature": _legacy_sign("프롬프트 é", "n-1", timestamp)}
+    assert signer.verify(unicode_signed) is True
+    # The legacy MAC does not verify once the prompt claims the current version
+    assert signer.verify({**signed, "version": SIGNATURE_VERSION}) is False
+
+
+def test_verify_unknown_version(signer: PromptSigner) -> None:
+    """A version this signer does not know is rejected."""
+    signed = signer.sign("Test prompt")
+    assert signer.verify({**signed, "version": SIGNATURE_VERSION + 1}) is False
+    assert signer.verify({**signed, "nonce": 123}) is False
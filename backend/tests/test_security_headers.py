@@ -4,7 +4,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 from starlette.routing import Route
 
 from backend.src.core.security_headers import SecurityHeadersMiddleware
@@ -79,3 +79,24 @@ async def test_custom_permissions_policy():
         resp = await client.get("/")
 
     assert resp.headers["Permissions-Policy"] == custom_pp
+
+
+async def test_streamed_response_keeps_headers_and_chunks():
+    """Streaming bodies pass through untouched and keep a handler-set Cache-Control."""
+
+    async def chunks():
+        for part in (b"data: a\n\n", b"data: b\n\n"):
+            yield part
+
+    async def stream(request: Request) -> StreamingResponse:
+        return StreamingResponse(chunks(), media_type="text/event-stream", headers={"Cache-Control": "no-store"})
+
+    app = Starlette(routes=[Route("/stream", stream)])
+    app.add_middleware(SecurityHeadersMiddleware)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/stream")
+
+    assert resp.text == "data: a\n\ndata: b\n\n"
+    assert resp.headers["X-Frame-Options"] == "DENY"
+    assert resp.headers["Cache-Control"] == "no-store"
+    assert "Pragma" not in resp.headers
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 
+from backend.src.api import settings as settings_api
 from backend.src.api.settings import mask_api_key
+from backend.src.models import Setting
+from backend.src.schemas import GlobalSettingsUpdate
 
 
 @pytest.mark.asyncio
@@ -40,6 +45,14 @@ async def test_update_settings_base_url(client: AsyncClient) -> None:
     assert resp.json()["llm_base_url"] == "https://api.example.com"
 
 
+@pytest.mark.asyncio
+async def test_update_settings_parsing_model(client: AsyncClient) -> None:
+    """PUT /api/v1/settings updates llm_parsing_model and returns it."""
+    resp = await client.put("/api/v1/settings", json={"llm_parsing_model": "openai/gpt-4.1-mini"})
+    assert resp.status_code == 200
+    assert resp.json()["llm_parsing_model"] == "openai/gpt-4.1-mini"
+
+
 @pytest.mark.asyncio
 async def test_api_key_masked(client: AsyncClient) -> None:
     """API key is masked when returned via GET."""
@@ -118,6 +131,69 @@ async def test_update_settings_null_ignored(client: AsyncClient) -> None:
     assert resp.json()["llm_model"] == "gpt-4o"
 
 
+@pytest.mark.asyncio
+async def test_get_settings_served_from_cache(client: AsyncClient, db_session) -> None:
+    """A second GET within the TTL does not see rows written behind the API."""
+    await client.get("/api/v1/settings")
+    db_session.add(Setting(key="llm_model", value="gpt-4o"))
+    await db_session.flush()
+
+    resp = await client.get("/api/v1/settings")
+    assert resp.json()["llm_model"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_settings_cache_expires(client: AsyncClient, db_session, monkeypatch) -> None:
+    """Once the TTL has elapsed the next GET re-reads the DB."""
+    await client.get("/api/v1/settings")
+    db_session.add(Setting(key="llm_model", value="gpt-4o"))
+    await db_session.flush()
+    monkeypatch.setattr(settings_api, "SETTINGS_CACHE_TTL", 0.0)
+
+    resp = await client.get("/api/v1/settings")
+    assert resp.json()["llm_model"] == "gpt-4o"
+
+
+@pytest.mark.asyncio
+async def test_update_settings_invalidates_cache(client: AsyncClient) -> None:
+    """A GET after PUT returns the new values, not the cached ones."""
+    await client.get("/api/v1/settings")
+    await client.put("/api/v1/settings", json={"llm_model": "gpt-4o"})
+
+    resp = await client.get("/api/v1/settings")
+    assert resp.json()["llm_model"] == "gpt-4o"
+
+
+
+@pytest.mark.asyncio
+async def test_put_is_not_answered_by_a_get_read_before_it(db_session, monkeypatch) -> None:
+    """A GET that read the old rows before a PUT committed neither answers for nor caches over the write."""
+    read_done, release = asyncio.Event(), asyncio.Event()
+    execute = db_session.execute
+
+    async def paused_first_execute(*args, **kwargs):
+        result = await execute(*args, **kwargs)
+        if not read_done.is_set():
+            read_done.set()
+            await release.wait()
+        return result
+
+    monkeypatch.setattr(db_session, "execute", paused_first_execute)
+    settings_api.invalidate_settings_cache()
+    # The GET misses, reads the empty table and stalls while holding the cache lock
+    stale_get = asyncio.create_task(settings_api.get_settings(db_session))
+    await read_done.wait()
+
+    # Bounded: a PUT that waited on the stalled GET's lock would never return
+    put = await asyncio.wait_for(
+        settings_api.update_settings(GlobalSettingsUpdate(llm_model="gpt-4o"), db_session), timeout=5
+    )
+    assert put.llm_model == "gpt-4o"
+
+    release.set()
+    assert (await stale_get).llm_model is None
+    assert (await settings_api.get_settings(db_session)).llm_model == "gpt-4o"
+
 # ── Unit tests for mask_api_key ──────────────────────────────────────
 
 
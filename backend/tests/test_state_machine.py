@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from backend.src.core.state_machine import TaskStateMachine
 from backend.src.models import Task, TaskHistory, TaskPriority, TaskStatus
+from backend.src.queue.streams import RedisStreamManager
 
 
 # -- Fixtures -----------------------------------------------------------------
@@ -163,6 +164,89 @@ async def test_valid_transition_waiting_to_ready(
     mock_stream.publish_board_event.assert_called_once()
 
 
+async def test_transition_buffers_board_event(
+    state_machine: TaskStateMachine, mock_db: AsyncMock, mock_stream: AsyncMock
+) -> None:
+    task = make_task(status=TaskStatus.waiting)
+    buffer: list[tuple[str, dict]] = []
+    await state_machine.transition(
+        task, TaskStatus.ready, db_session=mock_db, stream_manager=mock_stream, event_buffer=buffer
+    )
+    mock_stream.publish_board_event.assert_not_called()
+    assert buffer == [
+        (
+            "task_transition",
+            {
+                "task_id": str(task.id),
+                "project_id": str(task.project_id),
+                "from_status": "waiting",
+                "to_status": "ready",
+                "actor": "system",
+            },
+        )
+    ]
+
+
+async def test_publish_board_events_pipelines_xadds() -> None:
+    redis_client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=["1-0", "2-0"])
+    redis_client.pipeline = MagicMock(return_value=pipe)
+    manager = RedisStreamManager(redis_client)
+    project_id = str(uuid.uuid4())
+
+    await manager.publish_board_events(
+        [
+            ("task_transition", {"project_id": project_id, "task_id": "a"}),
+            ("phase_completed", {"project_id": project_id, "meta": {"n": 1}}),
+        ]
+    )
+
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert pipe.xadd.call_count == 2
+    stream, fields = pipe.xadd.call_args_list[1].args
+    assert stream == RedisStreamManager.board_stream(project_id)
+    assert fields == {"event": "phase_completed", "project_id": project_id, "meta": '{"n": 1}'}
+    pipe.execute.assert_awaited_once()
+
+    redis_client.pipeline.reset_mock()
+    await manager.publish_board_events([])
+    redis_client.pipeline.assert_not_called()
+
+
+async def test_wait_for_entries_advances_ids_and_counts() -> None:
+    redis_client = MagicMock()
+    redis_client.xread = AsyncMock(
+        return_value=[["tasks:events", [("5-0", {"event": "worker_idle"}), ("6-0", {"event": "worker_idle"})]]]
+    )
+    manager = RedisStreamManager(redis_client)
+    last_ids = {"events:board:p": "1-0", "tasks:events": "4-0"}
+
+    received = await manager.wait_for_entries(last_ids, block=30000)
+
+    assert received == 2
+    assert last_ids == {"events:board:p": "1-0", "tasks:events": "6-0"}
+    assert redis_client.xread.await_args.kwargs["block"] == 30000
+
+    # A timed-out wait reads nothing and leaves the positions alone
+    redis_client.xread = AsyncMock(return_value=[])
+    assert await manager.wait_for_entries(last_ids, block=30000) == 0
+    assert last_ids["tasks:events"] == "6-0"
+
+
+async def test_last_entry_ids_defaults_empty_streams() -> None:
+    redis_client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[[("9-1", {"event": "x"})], []])
+    redis_client.pipeline = MagicMock(return_value=pipe)
+    manager = RedisStreamManager(redis_client)
+
+    ids = await manager.last_entry_ids(["events:board:p", "tasks:events"])
+
+    assert ids == {"events:board:p": "9-1", "tasks:events": "0-0"}
+    assert pipe.xrevrange.call_count == 2
+
+
 async def test_valid_transition_ready_to_queued(
     state_machine: TaskStateMachine, mock_db: AsyncMock, mock_stream: AsyncMock
 ) -> None:
@@ -242,7 +326,7 @@ async def test_valid_transition_review_to_done(
 
     with patch("backend.src.core.state_machine.TaskRepository") as MockRepo:
         mock_repo_instance = AsyncMock()
-        mock_repo_instance.find_waiting_dependents = AsyncMock(return_value=[])
+        mock_repo_instance.find_promotable_dependents = AsyncMock(return_value=[])
         MockRepo.return_value = mock_repo_instance
 
         result = await state_machine.transition(task, TaskStatus.done, db_session=mock_db, stream_manager=mock_stream)
@@ -396,13 +480,9 @@ async def test_promote_dependents_on_done(
     task = make_task(status=TaskStatus.review)
     waiting_task = make_task(status=TaskStatus.waiting)
 
-    with (
-        patch("backend.src.core.state_machine.TaskRepository") as MockRepo,
-        patch.object(state_machine, "_is_phase_active", return_value=True),
-    ):
+    with patch("backend.src.core.state_machine.TaskRepository") as MockRepo:
         mock_repo_instance = AsyncMock()
-        mock_repo_instance.find_waiting_dependents = AsyncMock(return_value=[waiting_task])
-        mock_repo_instance.check_dependencies_met = AsyncMock(return_value=True)
+        mock_repo_instance.find_promotable_dependents = AsyncMock(return_value=[waiting_task])
         MockRepo.return_value = mock_repo_instance
 
         result = await state_machine.transition(task, TaskStatus.done, db_session=mock_db, stream_manager=mock_stream)
@@ -412,52 +492,24 @@ async def test_promote_dependents_on_done(
     # The waiting dependent should have been promoted
     assert waiting_task.status == TaskStatus.ready
     assert waiting_task.version == 2
+    mock_repo_instance.find_promotable_dependents.assert_awaited_once_with(task.id)
 
 
-async def test_promote_dependents_only_when_all_deps_met(
-    state_machine: TaskStateMachine, mock_db: AsyncMock, mock_stream: AsyncMock
-) -> None:
-    """A waiting dependent is NOT promoted if it still has unmet dependencies."""
-    task = make_task(status=TaskStatus.review)
-    waiting_task = make_task(status=TaskStatus.waiting)
-
-    with (
-        patch("backend.src.core.state_machine.TaskRepository") as MockRepo,
-        patch.object(state_machine, "_is_phase_active", return_value=True),
-    ):
-        mock_repo_instance = AsyncMock()
-        mock_repo_instance.find_waiting_dependents = AsyncMock(return_value=[waiting_task])
-        mock_repo_instance.check_dependencies_met = AsyncMock(return_value=False)
-        MockRepo.return_value = mock_repo_instance
-
-        await state_machine.transition(task, TaskStatus.done, db_session=mock_db, stream_manager=mock_stream)
-
-    # Not promoted because dependencies are not met
-    assert waiting_task.status == TaskStatus.waiting
-    assert waiting_task.version == 1
-
-
-async def test_promote_dependents_skips_non_active_phase(
+async def test_promote_dependents_leaves_unlisted_tasks(
     state_machine: TaskStateMachine, mock_db: AsyncMock, mock_stream: AsyncMock
 ) -> None:
-    """A waiting dependent in a non-active phase is NOT promoted even if deps are met."""
+    """Only the dependents the repository reports as promotable change status."""
     task = make_task(status=TaskStatus.review)
-    waiting_task = make_task(status=TaskStatus.waiting)
 
-    with (
-        patch("backend.src.core.state_machine.TaskRepository") as MockRepo,
-        patch.object(state_machine, "_is_phase_active", return_value=False),
-    ):
+    with patch("backend.src.core.state_machine.TaskRepository") as MockRepo:
         mock_repo_instance = AsyncMock()
-        mock_repo_instance.find_waiting_dependents = AsyncMock(return_value=[waiting_task])
-        mock_repo_instance.check_dependencies_met = AsyncMock(return_value=True)
+        mock_repo_instance.find_promotable_dependents = AsyncMock(return_value=[])
         MockRepo.return_value = mock_repo_instance
 
-        await state_machine.transition(task, TaskStatus.done, db_session=mock_db, stream_manager=mock_stream)
+        promoted = await state_machine.promote_dependents(task, mock_db)
 
-    # Not promoted because phase is not active
-    assert waiting_task.status == TaskStatus.waiting
-    assert waiting_task.version == 1
+    assert promoted == []
+    mock_db.add.assert_not_called()
 
 
 # -- Version increment -------------------------------------------------------
@@ -677,7 +729,7 @@ async def test_on_done_sets_completed_at(
 
     with patch("backend.src.core.state_machine.TaskRepository") as MockRepo:
         mock_repo_instance = AsyncMock()
-        mock_repo_instance.find_waiting_dependents = AsyncMock(return_value=[])
+        mock_repo_instance.find_promotable_dependents = AsyncMock(return_value=[])
         MockRepo.return_value = mock_repo_instance
 
         await state_machine.transition(task, TaskStatus.done, db_session=mock_db, stream_manager=mock_stream)
@@ -965,7 +1017,7 @@ async def test_on_done_sets_reviewer_idle(
 
     with patch("backend.src.core.state_machine.TaskRepository") as MockRepo:
         mock_repo_instance = AsyncMock()
-        mock_repo_instance.find_waiting_dependents = AsyncMock(return_value=[])
+        mock_repo_instance.find_promotable_dependents = AsyncMock(return_value=[])
         MockRepo.return_value = mock_repo_instance
 
         await sm.transition(task, TaskStatus.done, db_session=mock_db, stream_manager=mock_stream)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from backend.src.models import Phase, PhaseStatus, Project, ProjectStatus, Task, TaskPriority, TaskStatus
+from backend.src.repositories.task_repository import TaskRepository
+
+
+async def _create_tasks(db_session, count: int) -> list[uuid.UUID]:
+    """Helper to create a project, one phase and ``count`` tasks; returns the task ids."""
+    now = datetime.now(timezone.utc)
+    project = Project(
+        id=uuid.uuid4(), name="P", description="", repo_path="/p",
+        status=ProjectStatus.active, created_at=now, updated_at=now,
+    )
+    phase = Phase(
+        id=uuid.uuid4(), project_id=project.id, name="Phase 1", branch_name="phase-1",
+        order=1, status=PhaseStatus.active, created_at=now, updated_at=now,
+    )
+    db_session.add_all([project, phase])
+    await db_session.flush()
+    tasks = [
+        Task(
+            id=uuid.uuid4(), project_id=project.id, phase_id=phase.id, title=f"T{i}",
+            status=TaskStatus.waiting, priority=TaskPriority.medium, version=1,
+            created_at=now, updated_at=now,
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(tasks)
+    await db_session.flush()
+    return [task.id for task in tasks]
+
+
+class TestDetectCircularDependency:
+    """Tests for TaskRepository.detect_circular_dependency."""
+
+    async def test_direct_self_dependency(self, db_session):
+        """A task listed in its own dependencies is a cycle without touching the graph."""
+        (a,) = await _create_tasks(db_session, 1)
+
+        assert await TaskRepository(db_session).detect_circular_dependency(a, [a]) is True
+
+    async def test_transitive_cycle(self, db_session):
+        """a -> b -> c exists, so making c depend on a closes a cycle."""
+        a, b, c = await _create_tasks(db_session, 3)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(a, b), (b, c)])
+
+        assert await repo.detect_circular_dependency(c, [a]) is True
+
+    async def test_no_cycle(self, db_session):
+        """Depending on an unrelated chain is not a cycle."""
+        a, b, c, d = await _create_tasks(db_session, 4)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(a, b), (b, c)])
+
+        assert await repo.detect_circular_dependency(d, [a]) is False
+        assert await repo.detect_circular_dependency(a, []) is False
+
+    async def test_existing_cycle_elsewhere_terminates(self, db_session):
+        """A cycle already in the graph does not make the walk loop forever."""
+        a, b, c = await _create_tasks(db_session, 3)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(a, b), (b, a)])
+
+        assert await repo.detect_circular_dependency(c, [a]) is False
+
+
+class TestDependencyIds:
+    """Tests for TaskRepository.list_with_dependency_ids / get_with_dependency_ids."""
+
+    async def test_pairs_tasks_with_their_dependency_ids(self, db_session):
+        a, b, c = await _create_tasks(db_session, 3)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(c, a), (c, b)])
+
+        project_id = (await repo.get_by_id(a, load_depends=False)).project_id
+        rows = await repo.list_with_dependency_ids(project_id)
+
+        dep_ids = {task.id: sorted(ids) for task, ids in rows}
+        assert dep_ids == {a: [], b: [], c: sorted([a, b])}
+
+    async def test_get_single_task(self, db_session):
+        a, b = await _create_tasks(db_session, 2)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(b, a)])
+
+        task, dep_ids = await repo.get_with_dependency_ids(b)
+
+        assert task.id == b
+        assert dep_ids == [a]
+        assert await repo.get_with_dependency_ids(uuid.uuid4()) is None
+
+    async def test_eager_loaded_dependencies_carry_only_ids(self, db_session):
+        """depends_on is filled by one IN query selecting just the dependencies' IDs."""
+        from sqlalchemy import inspect as sa_inspect
+
+        a, b = await _create_tasks(db_session, 2)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(b, a)])
+        await db_session.commit()
+        db_session.expunge_all()
+
+        task = await repo.get_by_id(b)
+
+        [dependency] = task.depends_on
+        assert dependency.id == a
+        assert "title" in sa_inspect(dependency).unloaded
+
+
+class TestReplaceDependencies:
+    """Tests for TaskRepository.replace_dependencies."""
+
+    async def test_rewires_every_task_regardless_of_order(self, db_session):
+        """A later task's clear does not drop an edge just added for an earlier one."""
+        a, b, c = await _create_tasks(db_session, 3)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(b, c)])
+
+        # b's new edge points at c, which is rewired after b
+        await repo.replace_dependencies({b: [c], c: [a]})
+
+        dep_map = await repo.get_dependency_map([a, b, c])
+        assert {task_id: sorted(ids) for task_id, ids in dep_map.items()} == {b: [c], c: [a]}
+
+    async def test_empty_list_clears_and_empty_mapping_is_a_no_op(self, db_session):
+        a, b = await _create_tasks(db_session, 2)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(b, a)])
+
+        await repo.replace_dependencies({})
+        assert await repo.get_dependency_ids(b) == [a]
+
+        await repo.replace_dependencies({b: []})
+        assert await repo.get_dependency_ids(b) == []
+
+
+class TestFindPromotableDependents:
+    """Tests for TaskRepository.find_promotable_dependents."""
+
+    async def test_returns_only_dependents_with_every_dependency_done(self, db_session):
+        a, b, c, d = await _create_tasks(db_session, 4)
+        repo = TaskRepository(db_session)
+        # c waits on a only; d waits on a and b
+        await repo.add_dependency_pairs([(c, a), (d, a), (d, b)])
+        (await repo.get_by_id(a, load_depends=False)).status = TaskStatus.done
+
+        promotable = await repo.find_promotable_dependents(a)
+
+        assert [task.id for task in promotable] == [c]
+
+    async def test_skips_dependents_outside_an_active_phase(self, db_session):
+        a, b = await _create_tasks(db_session, 2)
+        repo = TaskRepository(db_session)
+        await repo.add_dependency_pairs([(b, a)])
+        (await repo.get_by_id(a, load_depends=False)).status = TaskStatus.done
+        dependent = await repo.get_by_id(b, load_depends=False)
+        (await db_session.get(Phase, dependent.phase_id)).status = PhaseStatus.pending
+
+        assert await repo.find_promotable_dependents(a) == []
+
+
+class TestMarkUnsetColumnsNull:
+    """Tests for BaseRepository.mark_unset_columns_null."""
+
+    async def test_unset_nullable_columns_read_as_null_without_a_reload(self, db_session):
+        """Columns the INSERT left NULL are readable right after the flush and stay SQL NULL."""
+        from sqlalchemy import inspect as sa_inspect
+        from sqlalchemy import text
+
+        from backend.src.repositories.project_repository import ProjectRepository
+
+        repo = ProjectRepository(db_session)
+        project = await repo.add(Project(name="P", description="", repo_path="/p", phases=[]))
+
+        repo.mark_unset_columns_null(project)
+
+        state = sa_inspect(project)
+        assert {"llm_config", "design_doc_path"}.isdisjoint(state.unloaded)
+        assert project.llm_config is None
+        assert project.design_doc_path is None
+        await repo.commit()
+        stored = await db_session.execute(
+            text("SELECT llm_config IS NULL FROM projects WHERE id = :id"), {"id": project.id.hex}
+        )
+        assert stored.scalar() == 1
@@ -57,6 +57,7 @@ async def setup(db_session: AsyncSession):
     mock_redis.set = AsyncMock()
     mock_redis.get = AsyncMock(return_value=None)
     mock_redis.delete = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
     mock_redis.scan_iter = MagicMock(return_value=_async_iter([]))
     mock_redis.xreadgroup = AsyncMock(return_value=[])
 
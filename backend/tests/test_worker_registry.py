@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backend.src.utils.worker_registry import WorkerRegistry
+from backend.src.utils.worker_registry import _HEARTBEAT_SCRIPT, WorkerRegistry
 
 
 # ── Fixtures ─────────────────────────────────────────────────────────────
@@ -24,11 +24,22 @@ def mock_redis() -> AsyncMock:
     r.get = AsyncMock(return_value=None)
     r.delete = AsyncMock()
 
+    # Writes are queued on a MULTI/EXEC pipeline and sent by execute()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    r.pipeline = MagicMock(return_value=pipe)
+
     # scan_iter returns an async iterator
     r.scan_iter = MagicMock(return_value=_async_iter([]))
     return r
 
 
+@pytest.fixture
+def pipe(mock_redis: AsyncMock) -> MagicMock:
+    """The pipeline WorkerRegistry queues its writes on."""
+    return mock_redis.pipeline.return_value
+
+
 @pytest.fixture
 def registry(mock_redis: AsyncMock) -> WorkerRegistry:
     return WorkerRegistry(mock_redis, ttl=60)
@@ -46,8 +57,8 @@ async def _async_iter(items: list):
 # ── register ─────────────────────────────────────────────────────────────
 
 
-async def test_register_creates_redis_hash(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
-    """register() should HSET the worker data and set TTL."""
+async def test_register_creates_redis_hash(registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock) -> None:
+    """register() should HSET the worker data, set TTL and store the token in one MULTI/EXEC."""
     result = await registry.register(
         worker_id="w-1",
         name="Worker One",
@@ -57,8 +68,8 @@ async def test_register_creates_redis_hash(registry: WorkerRegistry, mock_redis:
     )
 
     # HSET was called with worker:w-1
-    mock_redis.hset.assert_called_once()
-    call_kwargs = mock_redis.hset.call_args
+    pipe.hset.assert_called_once()
+    call_kwargs = pipe.hset.call_args
     assert call_kwargs[0][0] == "worker:w-1"
     mapping = call_kwargs[1]["mapping"]
     assert mapping["id"] == "w-1"
@@ -69,14 +80,21 @@ async def test_register_creates_redis_hash(registry: WorkerRegistry, mock_redis:
     assert mapping["status"] == "idle"
 
     # EXPIRE 60s on worker hash
-    mock_redis.expire.assert_called_once_with("worker:w-1", 60)
+    pipe.expire.assert_called_once_with("worker:w-1", 60)
 
     # Token stored: SET worker:token:{token} w-1 EX 86400
-    mock_redis.set.assert_called_once()
-    set_args = mock_redis.set.call_args
+    pipe.set.assert_called_once()
+    set_args = pipe.set.call_args
     assert set_args[0][1] == "w-1"  # value is worker_id
     assert set_args[1]["ex"] == 86400
 
+    # Indexed as idle and announced to the schedulers, all in a single transaction
+    assert pipe.zadd.call_args.args[0] == "workers:idle"
+    assert pipe.xadd.call_args.args == ("tasks:events", {"event": "worker_idle"})
+    mock_redis.pipeline.assert_called_once_with(transaction=True)
+    pipe.execute.assert_awaited_once()
+    mock_redis.hset.assert_not_called()
+
     # Return value
     assert result["worker_id"] == "w-1"
     assert result["token"]  # non-empty
@@ -95,24 +113,78 @@ async def test_register_generates_64_char_token(registry: WorkerRegistry) -> Non
 # ── heartbeat ────────────────────────────────────────────────────────────
 
 
-async def test_heartbeat_renews_ttl(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
-    """heartbeat() should renew EXPIRE on the worker key."""
-    mock_redis.exists.return_value = 1
+async def test_heartbeat_renews_ttl(registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock) -> None:
+    """heartbeat() renews the worker and its index entry with one script call."""
+    mock_redis.eval = AsyncMock(return_value=1)
 
-    alive = await registry.heartbeat("w-1")
+    with patch("backend.src.utils.worker_registry.time.time", return_value=1000.0):
+        alive = await registry.heartbeat("w-1")
 
     assert alive is True
-    mock_redis.expire.assert_called_once_with("worker:w-1", 60)
+    mock_redis.eval.assert_awaited_once_with(
+        _HEARTBEAT_SCRIPT, 3, "worker:w-1", "workers:idle", "workers:busy", 60, 1060.0, "w-1", "idle", "busy"
+    )
+    # A heartbeat is not a status change, so the schedulers are not woken
+    mock_redis.pipeline.assert_not_called()
+    pipe.xadd.assert_not_called()
 
 
 async def test_heartbeat_returns_false_for_missing_worker(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
-    """heartbeat() returns False when the worker key does not exist."""
-    mock_redis.exists.return_value = 0
+    """heartbeat() returns False when the script finds no worker hash."""
+    mock_redis.eval = AsyncMock(return_value=0)
+
+    assert await registry.heartbeat("w-missing") is False
+
+
+class _ScriptRedis:
+    """Just enough of Redis, over dicts, to run _HEARTBEAT_SCRIPT in Lua."""
+
+    def __init__(self, hashes: dict[str, dict[str, str]], zsets: dict[str, dict[str, float]]) -> None:
+        self.hashes = hashes
+        self.zsets = zsets
+
+    def call(self, command: str, key: str, *args: str) -> object:
+        if command == "EXPIRE":
+            return int(key in self.hashes)
+        if command == "HGET":
+            return self.hashes[key].get(args[0], False)
+        if command == "ZADD":
+            score, member = args
+            self.zsets.setdefault(key, {})[member] = float(score)
+            return 1
+        if command == "ZREM":
+            return int(self.zsets.get(key, {}).pop(args[0], None) is not None)
+        raise AssertionError(f"unexpected command {command}")
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: object) -> object:
+        lupa = pytest.importorskip("lupa")
+        lua = lupa.LuaRuntime()
+        lua.globals().redis = lua.table_from({"call": self.call})
+        lua.globals().KEYS = lua.table_from([str(k) for k in keys_and_args[:numkeys]])
+        lua.globals().ARGV = lua.table_from([str(a) for a in keys_and_args[numkeys:]])
+        return lua.execute(script)
+
+
+@pytest.mark.parametrize("status", ["idle", "busy"])
+async def test_heartbeat_backfills_unindexed_worker(status: str) -> None:
+    """A live worker in neither status set is indexed under the status stored in its hash."""
+    redis_client = _ScriptRedis({"worker:w-1": {"status": status}}, {})
+    registry = WorkerRegistry(redis_client, ttl=60)  # type: ignore[arg-type]
+
+    with patch("backend.src.utils.worker_registry.time.time", return_value=1000.0):
+        assert await registry.heartbeat("w-1") is True
+
+    assert redis_client.zsets[f"workers:{status}"] == {"w-1": 1060.0}
+    assert "w-1" not in redis_client.zsets.get("workers:idle" if status == "busy" else "workers:busy", {})
+
 
-    alive = await registry.heartbeat("w-missing")
+async def test_heartbeat_script_drops_index_entries_of_expired_worker() -> None:
+    """With the hash gone, the worker is removed from every status set."""
+    redis_client = _ScriptRedis({}, {"workers:idle": {"w-1": 900.0}, "workers:busy": {}})
+    registry = WorkerRegistry(redis_client, ttl=60)  # type: ignore[arg-type]
 
-    assert alive is False
-    mock_redis.expire.assert_not_called()
+    assert await registry.heartbeat("w-1") is False
+    assert redis_client.zsets == {"workers:idle": {}, "workers:busy": {}}
 
 
 # ── get_worker ───────────────────────────────────────────────────────────
@@ -200,81 +272,153 @@ async def test_get_all_workers_empty(registry: WorkerRegistry, mock_redis: Async
     assert workers == []
 
 
+# ── count_statuses ───────────────────────────────────────────────────────
+
+
+async def test_count_statuses_pipelines_status_reads(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+    """count_statuses() should read only the status field, in one pipelined round trip."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=["idle", "busy", None, "idle"])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+
+    counts = await registry.count_statuses(["w-1", "w-2", "w-3", "w-4"])
+
+    assert counts == {"idle": 2, "busy": 1, "offline": 1}
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args for c in pipe.hget.call_args_list] == [
+        ("worker:w-1", "status"),
+        ("worker:w-2", "status"),
+        ("worker:w-3", "status"),
+        ("worker:w-4", "status"),
+    ]
+    pipe.execute.assert_awaited_once()
+    mock_redis.hgetall.assert_not_called()
+
+
+async def test_count_statuses_empty(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+    """count_statuses() with no ids should not touch Redis."""
+    mock_redis.pipeline = MagicMock()
+
+    counts = await registry.count_statuses([])
+
+    assert counts == {"idle": 0, "busy": 0, "offline": 0}
+    mock_redis.pipeline.assert_not_called()
+
+
+async def test_count_by_status_reads_status_indexes(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+    """count_by_status() prunes expired index entries and counts the rest in one pipeline."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 4, 0, 2])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+
+    with patch("backend.src.utils.worker_registry.time.time", return_value=1000.0):
+        counts = await registry.count_by_status()
+
+    assert counts == {"idle": 4, "busy": 2}
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args for c in pipe.zremrangebyscore.call_args_list] == [
+        ("workers:idle", "-inf", 1000.0),
+        ("workers:busy", "-inf", 1000.0),
+    ]
+    assert [c.args for c in pipe.zcount.call_args_list] == [
+        ("workers:idle", 1000.0, "+inf"),
+        ("workers:busy", 1000.0, "+inf"),
+    ]
+    mock_redis.scan_iter.assert_not_called()
+
+
+async def test_status_changes_move_worker_between_indexes(
+    registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock,
+) -> None:
+    """set_busy()/set_idle() index the worker under its new status with its expiry as score."""
+    with patch("backend.src.utils.worker_registry.time.time", return_value=1000.0):
+        await registry.set_busy("w-1", "task-42")
+        pipe.zadd.assert_called_once_with("workers:busy", {"w-1": 1060.0})
+        pipe.zrem.assert_called_once_with("workers:idle", "w-1")
+
+        pipe.zadd.reset_mock()
+        pipe.zrem.reset_mock()
+        await registry.set_idle("w-1")
+        pipe.zadd.assert_called_once_with("workers:idle", {"w-1": 1060.0})
+        pipe.zrem.assert_called_once_with("workers:busy", "w-1")
+
+
 # ── set_busy / set_idle ──────────────────────────────────────────────────
 
 
-async def test_set_busy_updates_status(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+async def test_set_busy_updates_status(registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock) -> None:
     """set_busy() should HSET status=busy and current_task_id, then renew TTL."""
     mock_redis.exists.return_value = 1
 
     await registry.set_busy("w-1", "task-42")
 
-    mock_redis.hset.assert_called_once_with(
+    pipe.hset.assert_called_once_with(
         "worker:w-1",
         mapping={"status": "busy", "current_task_id": "task-42"},
     )
-    mock_redis.expire.assert_called_once_with("worker:w-1", 60)
+    pipe.expire.assert_called_once_with("worker:w-1", 60)
 
 
-async def test_set_busy_skips_expired_worker(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+async def test_set_busy_skips_expired_worker(registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock) -> None:
     """set_busy() should not create a zombie key if the worker has expired."""
     mock_redis.exists.return_value = 0
 
     await registry.set_busy("w-gone", "task-42")
 
-    mock_redis.hset.assert_not_called()
-    mock_redis.expire.assert_not_called()
+    pipe.hset.assert_not_called()
+    pipe.expire.assert_not_called()
 
 
-async def test_set_idle_updates_status(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+async def test_set_idle_updates_status(registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock) -> None:
     """set_idle() should HSET status=idle and clear current_task_id, then renew TTL."""
     mock_redis.exists.return_value = 1
 
     await registry.set_idle("w-1")
 
-    mock_redis.hset.assert_called_once_with(
+    pipe.hset.assert_called_once_with(
         "worker:w-1",
         mapping={"status": "idle", "current_task_id": ""},
     )
-    mock_redis.expire.assert_called_once_with("worker:w-1", 60)
+    pipe.expire.assert_called_once_with("worker:w-1", 60)
+    # Waiting scheduling loops are woken in the same transaction
+    pipe.xadd.assert_called_once()
+    assert pipe.xadd.call_args.args == ("tasks:events", {"event": "worker_idle"})
 
 
-async def test_set_idle_skips_expired_worker(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+async def test_set_idle_skips_expired_worker(registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock) -> None:
     """set_idle() should not create a zombie key if the worker has expired."""
     mock_redis.exists.return_value = 0
 
     await registry.set_idle("w-gone")
 
-    mock_redis.hset.assert_not_called()
-    mock_redis.expire.assert_not_called()
+    pipe.hset.assert_not_called()
+    pipe.expire.assert_not_called()
 
 
 # ── deregister ───────────────────────────────────────────────────────────
 
 
-async def test_deregister_cleans_up_keys(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
-    """deregister() should delete worker hash and token key."""
+async def test_deregister_cleans_up_keys(registry: WorkerRegistry, mock_redis: AsyncMock, pipe: MagicMock) -> None:
+    """deregister() should delete the worker hash, its index entries and its token in one transaction."""
     mock_redis.hget.return_value = "my-secret-token"
 
     await registry.deregister("w-1")
 
     # Should have looked up the token
     mock_redis.hget.assert_called_once_with("worker:w-1", "token")
-    # Should delete worker hash and token key
-    assert mock_redis.delete.call_count == 2
-    deleted_keys = [call[0][0] for call in mock_redis.delete.call_args_list]
-    assert "worker:w-1" in deleted_keys
-    assert "worker:token:my-secret-token" in deleted_keys
+    mock_redis.pipeline.assert_called_once_with(transaction=True)
+    assert [c.args for c in pipe.delete.call_args_list] == [("worker:w-1",), ("worker:token:my-secret-token",)]
+    assert {c.args for c in pipe.zrem.call_args_list} == {("workers:idle", "w-1"), ("workers:busy", "w-1")}
+    pipe.execute.assert_awaited_once()
+    mock_redis.delete.assert_not_called()
 
 
-async def test_deregister_without_token(registry: WorkerRegistry, mock_redis: AsyncMock) -> None:
+async def test_deregister_without_token(registry: WorkerRegistry, pipe: MagicMock) -> None:
     """deregister() should only delete worker hash when no token is stored."""
-    mock_redis.hget.return_value = None
-
     await registry.deregister("w-1")
 
     # Only the worker key should be deleted
-    mock_redis.delete.assert_called_once_with("worker:w-1")
+    pipe.delete.assert_called_once_with("worker:w-1")
 
 
 # ── resolve_token ────────────────────────────────────────────────────────
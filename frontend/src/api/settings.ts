@@ -4,6 +4,7 @@ export interface GlobalSettings {
   llm_api_key: string | null
   llm_model: string | null
   llm_base_url: string | null
+  llm_parsing_model: string | null
 }
 
 export const settingsApi = {
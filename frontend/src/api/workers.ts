@@ -1,6 +1,9 @@
 import apiClient from './client'
 import type { Worker, WorkerRegister, RegistrationToken, RegistrationTokenCreate } from '../types/worker'
 
+// Largest page the token list endpoint serves
+const TOKEN_PAGE_SIZE = 200
+
 export const workersApi = {
   list: () => apiClient.get<Worker[]>('/api/v1/workers').then(r => r.data),
   register: (data: WorkerRegister) => apiClient.post<Worker>('/api/v1/workers/register', data).then(r => r.data),
@@ -10,7 +13,20 @@ export const workersApi = {
 export const registrationTokensApi = {
   create: (data?: RegistrationTokenCreate) =>
     apiClient.post<RegistrationToken>('/api/v1/registration-tokens', data ?? {}).then(r => r.data),
-  list: () => apiClient.get<RegistrationToken[]>('/api/v1/registration-tokens').then(r => r.data),
+  // Follows the (created_at, id) keyset cursor until a short page, so every token stays listed
+  list: async () => {
+    const tokens: RegistrationToken[] = []
+    let cursor: { before: string; before_id: string } | undefined
+    for (;;) {
+      const page = await apiClient
+        .get<RegistrationToken[]>('/api/v1/registration-tokens', { params: { limit: TOKEN_PAGE_SIZE, ...cursor } })
+        .then(r => r.data)
+      tokens.push(...page)
+      if (page.length < TOKEN_PAGE_SIZE) return tokens
+      const last = page[page.length - 1]
+      cursor = { before: last.created_at, before_id: last.id }
+    }
+  },
   revoke: (tokenId: string) =>
     apiClient.delete(`/api/v1/registration-tokens/${tokenId}`).then(r => r.data),
 }
@@ -24,6 +24,7 @@ export interface LLMConfigInput {
   api_key: string
   model?: string
   base_url?: string
+  parsing_model?: string
 }
 
 export interface CreateSessionRequest {
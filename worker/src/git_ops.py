@@ -14,6 +14,10 @@ class WorkerGitOps:
 
     async def ensure_repo(self) -> None:
         """Initialize git repo if it doesn't exist."""
+        # Usual case, answered from the files: an initialized repo whose main
+        # already has a commit (its loose ref exists)
+        if self._read_head() is not None and (Path(self.repo_path) / ".git" / "refs" / "heads" / "main").is_file():
+            return
         if await self._is_git_repo():
             # Guard: repo dir exists but main may lack commits (partial init / race)
             try:
@@ -31,29 +35,46 @@ class WorkerGitOps:
 
     async def ensure_branch(self, branch_name: str) -> None:
         """Check out branch, creating it from main if it doesn't exist."""
-        branches = await self._run("branch", "--list", branch_name)
-        if branch_name.strip() in branches:
-            await self._run("checkout", branch_name)
-        else:
-            try:
-                await self._run("rev-parse", "--verify", "main")
-                await self._run("checkout", "-b", branch_name, "main")
-            except RuntimeError:
-                await self._run("checkout", "-b", branch_name)
+        # QA checks out the branch and commit_task checks it out again; when
+        # HEAD already points at it there is nothing to run
+        if self._read_head() == f"ref: refs/heads/{branch_name}":
+            return
+        # Existing branch (the common case): a single git call. Unlike
+        # checkout, switch never falls back to treating the name as a path.
+        try:
+            await self._run("switch", branch_name)
+            return
+        except RuntimeError:
+            pass
+        try:
+            await self._run("rev-parse", "--verify", "main")
+            await self._run("checkout", "-b", branch_name, "main")
+        except RuntimeError:
+            await self._run("checkout", "-b", branch_name)
 
     async def commit_task(self, task_id: str, title: str, branch_name: str) -> str:
         """Stage all changes and commit. Returns commit hash, or empty string if no changes."""
         await self.ensure_branch(branch_name)
         await self._run("add", ".")
+        message = f"feat(task-{task_id}): {title}"
+        try:
+            await self._run("commit", "-m", message)
+        except RuntimeError:
+            # Checked only after a failed commit, which keeps the usual path
+            # to four git calls: with nothing staged there was nothing to commit
+            if not await self._has_staged_changes():
+                return ""
+            raise
+        return self._read_head_commit() or (await self._run("rev-parse", "HEAD")).strip()
+
+    async def _has_staged_changes(self) -> bool:
+        """Return True if the index differs from HEAD."""
         # git diff --cached --quiet exits 0 when no staged changes, 1 when there are
         try:
             await self._run("diff", "--cached", "--quiet")
-            return ""  # nothing to commit
+            return False
         except RuntimeError:
-            pass  # staged changes exist — proceed
-        message = f"feat(task-{task_id}): {title}"
-        await self._run("commit", "-m", message)
-        return (await self._run("rev-parse", "HEAD")).strip()
+            return True
 
     async def get_status(self) -> str:
         """Get short git status output."""
@@ -66,6 +87,35 @@ class WorkerGitOps:
         await self.ensure_branch(branch_name)
         await self._run("revert", "--no-edit", commit_hash)
 
+    def _read_head(self) -> str | None:
+        """Return the contents of .git/HEAD, or None if it can't be read directly.
+
+        Only a plain ``<repo_path>/.git`` directory is read; worktrees, nested
+        paths and anything unusual fall back to running git.
+        """
+        try:
+            return (Path(self.repo_path) / ".git" / "HEAD").read_text().strip()
+        except OSError:
+            return None
+
+    def _read_head_commit(self) -> str | None:
+        """Resolve HEAD to a commit hash from the loose ref files, or None.
+
+        git commit writes the branch tip as a loose ref, so right after a
+        commit this saves a rev-parse process. Packed or reftable refs
+        return None and the caller asks git.
+        """
+        head = self._read_head()
+        if head is None:
+            return None
+        commit = head  # detached HEAD holds the hash itself
+        if head.startswith("ref: "):
+            try:
+                commit = (Path(self.repo_path) / ".git" / head[5:]).read_text().strip()
+            except OSError:
+                return None
+        return commit if len(commit) in (40, 64) else None
+
     async def _is_git_repo(self) -> bool:
         """Check if repo_path is an existing git repository."""
         try:
@@ -13,7 +13,8 @@ def git_ops() -> WorkerGitOps:
 class TestEnsureRepo:
     async def test_ensure_repo_creates_new_repo(self, git_ops: WorkerGitOps) -> None:
         """ensure_repo() should init a new git repo when none exists."""
-        with patch.object(git_ops, "_is_git_repo", return_value=False) as mock_check, \
+        with patch.object(git_ops, "_read_head", return_value=None), \
+             patch.object(git_ops, "_is_git_repo", return_value=False) as mock_check, \
              patch.object(git_ops, "_run", new_callable=AsyncMock) as mock_run, \
              patch("worker.git_ops.Path") as mock_path:
             mock_path.return_value.mkdir = lambda **kwargs: None
@@ -35,6 +36,19 @@ class TestEnsureRepo:
         mock_check.assert_awaited_once()
         mock_run.assert_awaited_once_with("rev-parse", "--verify", "main")
 
+    async def test_ensure_repo_skips_git_when_main_exists(self, tmp_path) -> None:
+        """ensure_repo() should not run git when the repo root already has a main ref."""
+        (tmp_path / ".git" / "refs" / "heads").mkdir(parents=True)
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / ".git" / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+        git_ops = WorkerGitOps(str(tmp_path))
+        with patch.object(git_ops, "_is_git_repo", new_callable=AsyncMock) as mock_check, \
+             patch.object(git_ops, "_run", new_callable=AsyncMock) as mock_run:
+            await git_ops.ensure_repo()
+
+        mock_check.assert_not_awaited()
+        mock_run.assert_not_awaited()
+
     async def test_ensure_repo_recovers_partial_init(self, git_ops: WorkerGitOps) -> None:
         """ensure_repo() should create main + empty commit when repo exists but main has no commits."""
         with patch.object(git_ops, "_is_git_repo", return_value=True), \
@@ -56,44 +70,56 @@ class TestEnsureBranch:
     async def test_ensure_branch_creates_new(self, git_ops: WorkerGitOps) -> None:
         """ensure_branch() should create a new branch from main if it doesn't exist."""
         with patch.object(git_ops, "_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = ""  # branch --list returns empty, rev-parse succeeds
+            mock_run.side_effect = [
+                RuntimeError("fatal: invalid reference: phase/auth"),  # switch phase/auth
+                "",  # rev-parse --verify main
+                "",  # checkout -b phase/auth main
+            ]
             await git_ops.ensure_branch("phase/auth")
 
-        mock_run.assert_any_await("branch", "--list", "phase/auth")
+        mock_run.assert_any_await("switch", "phase/auth")
         mock_run.assert_any_await("rev-parse", "--verify", "main")
         mock_run.assert_any_await("checkout", "-b", "phase/auth", "main")
 
     async def test_ensure_branch_checks_out_existing(self, git_ops: WorkerGitOps) -> None:
-        """ensure_branch() should checkout existing branch."""
+        """ensure_branch() should switch to an existing branch with a single git call."""
         with patch.object(git_ops, "_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "  phase/auth"  # branch --list returns match
+            mock_run.return_value = ""
             await git_ops.ensure_branch("phase/auth")
 
-        mock_run.assert_any_await("branch", "--list", "phase/auth")
-        mock_run.assert_any_await("checkout", "phase/auth")
+        mock_run.assert_awaited_once_with("switch", "phase/auth")
 
     async def test_ensure_branch_fallback_no_main(self, git_ops: WorkerGitOps) -> None:
         """ensure_branch() should branch from HEAD when main is not a valid ref."""
         with patch.object(git_ops, "_run", new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
-                "",  # branch --list returns empty
+                RuntimeError("fatal: invalid reference: phase/auth"),  # switch phase/auth
                 RuntimeError("fatal: 'main' is not a commit"),  # rev-parse --verify main
                 "",  # checkout -b phase/auth (from HEAD)
             ]
             await git_ops.ensure_branch("phase/auth")
 
-        mock_run.assert_any_await("branch", "--list", "phase/auth")
+        mock_run.assert_any_await("switch", "phase/auth")
         mock_run.assert_any_await("rev-parse", "--verify", "main")
         mock_run.assert_any_await("checkout", "-b", "phase/auth")
 
 
+    async def test_ensure_branch_skips_git_when_already_on_branch(self, tmp_path) -> None:
+        """ensure_branch() should not run git when .git/HEAD already names the branch."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/phase/auth\n")
+        git_ops = WorkerGitOps(str(tmp_path))
+        with patch.object(git_ops, "_run", new_callable=AsyncMock) as mock_run:
+            await git_ops.ensure_branch("phase/auth")
+
+        mock_run.assert_not_awaited()
+
+
 class TestCommitTask:
     async def test_commit_task_returns_hash(self, git_ops: WorkerGitOps) -> None:
         """commit_task() should stage, commit, and return the commit hash."""
 
         async def _side_effect(*args: str) -> str:
-            if args == ("diff", "--cached", "--quiet"):
-                raise RuntimeError("changes exist")  # staged changes exist
             if args == ("rev-parse", "HEAD"):
                 return "abc123def456"
             return ""
@@ -106,19 +132,54 @@ class TestCommitTask:
         mock_run.assert_any_await("add", ".")
         mock_run.assert_any_await("commit", "-m", "feat(task-task-1): Add login")
         mock_run.assert_any_await("rev-parse", "HEAD")
+        # The staged-changes probe only runs when the commit fails
+        assert mock_run.await_count == 3
 
     async def test_commit_task_no_changes_returns_empty(self, git_ops: WorkerGitOps) -> None:
         """commit_task() should return empty string when there are no staged changes."""
+
+        async def _side_effect(*args: str) -> str:
+            if args[0] == "commit":
+                raise RuntimeError("nothing to commit, working tree clean")
+            return ""  # diff --cached --quiet succeeds: nothing staged
+
         with patch.object(git_ops, "ensure_branch", new_callable=AsyncMock), \
-             patch.object(git_ops, "_run", new_callable=AsyncMock) as mock_run:
-            # _run returns "" for all calls; diff --cached --quiet succeeds (no changes)
-            mock_run.return_value = ""
+             patch.object(git_ops, "_run", new_callable=AsyncMock, side_effect=_side_effect) as mock_run:
             result = await git_ops.commit_task("task-1", "Add login", "phase/auth")
 
         assert result == ""
         mock_run.assert_any_await("add", ".")
         mock_run.assert_any_await("diff", "--cached", "--quiet")
 
+    async def test_commit_task_reraises_real_commit_failure(self, git_ops: WorkerGitOps) -> None:
+        """commit_task() should surface the commit error when changes were staged."""
+
+        async def _side_effect(*args: str) -> str:
+            if args[0] == "commit":
+                raise RuntimeError("Git error: pre-commit hook failed")
+            if args[0] == "diff":
+                raise RuntimeError("")  # staged changes exist
+            return ""
+
+        with patch.object(git_ops, "ensure_branch", new_callable=AsyncMock), \
+             patch.object(git_ops, "_run", new_callable=AsyncMock, side_effect=_side_effect):
+            with pytest.raises(RuntimeError, match="pre-commit hook failed"):
+                await git_ops.commit_task("task-1", "Add login", "phase/auth")
+
+
+    async def test_commit_task_reads_hash_from_loose_ref(self, tmp_path) -> None:
+        """commit_task() should read the new commit from the ref file instead of running rev-parse."""
+        commit = "a" * 40
+        (tmp_path / ".git" / "refs" / "heads" / "phase").mkdir(parents=True)
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/phase/auth\n")
+        (tmp_path / ".git" / "refs" / "heads" / "phase" / "auth").write_text(commit + "\n")
+        git_ops = WorkerGitOps(str(tmp_path))
+        with patch.object(git_ops, "_run", new_callable=AsyncMock, return_value="") as mock_run:
+            result = await git_ops.commit_task("task-1", "Add login", "phase/auth")
+
+        assert result == commit
+        assert [c.args[0] for c in mock_run.await_args_list] == ["add", "commit"]
+
 
 class TestGetStatus:
     async def test_get_status_calls_git_status_short(self, git_ops: WorkerGitOps) -> None: